@@ -23,15 +23,23 @@ Usage
 from __future__ import annotations
 
 import argparse
+import codecs
+import collections
 import datetime as dt
-import json
+import functools
+import heapq
+import io
+import itertools
 import os
 import platform
 import re
+import selectors
 import shutil
+import signal
 import subprocess
 import sys
 import time
+import types
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +47,11 @@ REPORT_OUTPUT_FILE = f"desktop-analysis-report-{dt.datetime.now().strftime('%Y%m
 TRACE_LOG: list[str] = []
 CONSOLE_LOG: list[str] = []
 _TRACE_SNIPPET_LIMIT = 1200
+# Host identity does not change during a run; read once for probes and both reports.
+_HOSTNAME = platform.node()
+_KERNEL_RELEASE = platform.release()
+# Overlay for commands whose output is only parsed: stable English messages, no UTF-8 collation.
+_C_LOCALE_ENV = {"LC_ALL": "C", "LANG": "C"}
 
 
 def _timestamp() -> str:
@@ -61,6 +74,7 @@ C_GREEN  = "\033[32m"
 C_YELLOW = "\033[33m"
 C_RED    = "\033[31m"
 C_BLUE   = "\033[34m"
+_BLUE_RULE = f"{C_BLUE}{'=' * 62}{C_RESET}"
 
 
 def cprint(color: str, msg: str) -> None:
@@ -70,9 +84,7 @@ def cprint(color: str, msg: str) -> None:
 
 def _section(title: str) -> None:
     log_console(f"== {title} ==")
-    print(f"\n{C_BLUE}{'=' * 62}{C_RESET}")
-    print(f"{C_BLUE}  {title}{C_RESET}")
-    print(f"{C_BLUE}{'=' * 62}{C_RESET}")
+    print(f"\n{_BLUE_RULE}\n{C_BLUE}  {title}{C_RESET}\n{_BLUE_RULE}")
 
 
 def _bullet(label: str, value: object) -> None:
@@ -80,12 +92,225 @@ def _bullet(label: str, value: object) -> None:
     print(f"  {label:<34} {value}")
 
 
+def _join_nonempty(sep: str, *parts: str) -> str:
+    """Join the non-empty parts with sep (no stray separators for missing fields)."""
+    return sep.join(part for part in parts if part)
+
+
+def _firmware_bios_line(fw: dict) -> str:
+    bios_date = fw.get("bios_date", "")
+    return _join_nonempty(" ", fw.get("bios_vendor", ""), fw.get("bios_version", ""), f"({bios_date})" if bios_date else "")
+
+
+def _firmware_system_line(fw: dict) -> str:
+    return _join_nonempty(" ", fw.get("sys_vendor", ""), fw.get("product_name", ""))
+
+
 # ---------------------------------------------------------------------------
 # Subprocess helpers
 # ---------------------------------------------------------------------------
 
-def run_cmd(cmd: list, timeout: int = 20, env: Optional[dict] = None) -> dict:
-    """Run a subprocess and return a result dict."""
+# Lines of merged output kept as "stdout" when a command is streamed through a line handler.
+_STREAM_TAIL_LINES = 40
+# Seconds a streamed command gets after SIGINT to flush its output and exit before SIGKILL.
+_STREAM_INTERRUPT_GRACE_S = 2.0
+
+
+def _run_error_result(cmd_str: str, exc: Exception) -> dict:
+    """Trace and build the result dict for a command that could not be run."""
+    if isinstance(exc, FileNotFoundError):
+        trace(f"run_cmd error: command not found: '{cmd_str}'")
+        return {"ok": False, "stdout": "", "stderr": "", "returncode": 127,
+                "error": "command not found", "cmd": cmd_str}
+    trace(f"run_cmd exception: cmd='{cmd_str}' error='{exc}'")
+    return {"ok": False, "stdout": "", "stderr": "", "returncode": 1,
+            "error": str(exc), "cmd": cmd_str}
+
+
+def _stop_process(proc: subprocess.Popen, grace: float, sig: Optional[int] = None) -> None:
+    """Optionally send sig, give proc grace seconds to exit, then SIGKILL it."""
+    if sig is not None:
+        proc.send_signal(sig)
+    try:
+        proc.wait(grace)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _run_cmd_streaming(cmd: list, cmd_str: str, timeout: int, env: Optional[dict], line_handler) -> dict:
+    """Feed merged stdout/stderr to line_handler as it arrives; keep only a short tail.
+
+    On timeout the command is sent SIGINT (so tools like glmark2 can flush partial
+    results), then SIGKILL after a short grace period. Reading stops at the deadline
+    even if a grandchild still holds the pipe open.
+    """
+    tail: collections.deque = collections.deque(maxlen=_STREAM_TAIL_LINES)
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
+    except Exception as exc:  # noqa: BLE001
+        return _run_error_result(cmd_str, exc)
+
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True)
+    pending = ""
+
+    def _feed(text: str) -> None:
+        nonlocal pending
+        *lines, pending = (pending + text).split("\n")
+        for line in lines:
+            line_handler(line + "\n")
+            tail.append(line + "\n")
+
+    timed_out = False
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if timed_out:
+                    break
+                timed_out = True
+                proc.send_signal(signal.SIGINT)
+                deadline = time.monotonic() + _STREAM_INTERRUPT_GRACE_S
+                continue
+            if not sel.select(min(remaining, 0.2) if timed_out else remaining):
+                # After SIGINT, stop as soon as the command itself is gone and the pipe is quiet.
+                if timed_out and proc.poll() is not None:
+                    break
+                continue
+            chunk = os.read(proc.stdout.fileno(), 65536)
+            if not chunk:
+                break
+            _feed(decoder.decode(chunk))
+    _feed(decoder.decode(b"", final=True))
+    if pending:
+        line_handler(pending)
+        tail.append(pending)
+
+    if timed_out:
+        _stop_process(proc, max(deadline - time.monotonic(), 0.1))
+    else:
+        try:
+            proc.wait(max(deadline - time.monotonic(), 0.1))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            _stop_process(proc, _STREAM_INTERRUPT_GRACE_S, signal.SIGINT)
+    proc.stdout.close()
+
+    stdout = "".join(tail).strip()
+    stdout_excerpt = stdout[:_TRACE_SNIPPET_LIMIT].replace("\n", "\\n")
+    if timed_out:
+        trace(f"run_cmd timeout: cmd='{cmd_str}' stdout='{stdout_excerpt}' (streamed)")
+        return {"ok": False, "stdout": stdout, "stderr": "", "returncode": 124,
+            "error": "timeout", "cmd": cmd_str}
+    trace(f"run_cmd done: rc={proc.returncode} ok={proc.returncode == 0} stdout='{stdout_excerpt}' (streamed)")
+    return {"ok": proc.returncode == 0, "stdout": stdout, "stderr": "",
+        "returncode": proc.returncode, "error": "", "cmd": cmd_str}
+
+
+def _run_cmd_collect(
+    cmd: list,
+    cmd_str: str,
+    timeout: float,
+    env: Optional[dict],
+    max_stdout: Optional[int] = None,
+    max_stderr: Optional[int] = None,
+    stop_at_cap: bool = True,
+    sample: bool = False,
+) -> dict:
+    """Read stdout/stderr until the command exits or the deadline passes, then stop it with SIGTERM.
+
+    max_stdout/max_stderr cap what is kept and add "truncated" to the result. With
+    stop_at_cap the command is stopped once stdout reaches its cap; otherwise it runs
+    on and output past either cap is read and discarded. With sample, reaching the
+    deadline is the expected outcome and is reported as returncode 124 (like timeout(1))
+    rather than as a "timeout" error.
+    """
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    except Exception as exc:  # noqa: BLE001
+        return _run_error_result(cmd_str, exc)
+
+    out, err = bytearray(), bytearray()
+    truncated = timed_out = False
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ, out)
+        sel.register(proc.stderr, selectors.EVENT_READ, err)
+        while sel.get_map() and not (truncated and stop_at_cap):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                key.data.extend(chunk)
+                cap = max_stdout if key.data is out else max_stderr
+                if cap is None or len(key.data) < cap:
+                    continue
+                if stop_at_cap:
+                    truncated = True
+                    break
+                if len(key.data) > cap:
+                    truncated = True
+                    del key.data[cap:]
+
+    if not (timed_out or (truncated and stop_at_cap)):
+        # Both pipes hit EOF: the command exited (or is about to) on its own.
+        try:
+            proc.wait(max(deadline - time.monotonic(), 1))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+    stopped = proc.poll() is None
+    if stopped:
+        _stop_process(proc, 1, signal.SIGTERM)
+    proc.stdout.close()
+    proc.stderr.close()
+
+    stdout = out[:max_stdout].decode("utf-8", errors="replace").strip()
+    stderr = err[:max_stderr].decode("utf-8", errors="replace").strip()
+    stdout_excerpt = stdout[:_TRACE_SNIPPET_LIMIT].replace("\n", "\\n")
+    stderr_excerpt = stderr[:_TRACE_SNIPPET_LIMIT].replace("\n", "\\n")
+    if sample:
+        returncode = 124 if stopped else proc.returncode
+        trace(f"run_cmd done: rc={returncode} stdout='{stdout_excerpt}' (sampled)")
+        return {"ok": returncode == 0, "stdout": stdout, "stderr": stderr,
+            "returncode": returncode, "error": "", "cmd": cmd_str}
+    if timed_out:
+        trace(f"run_cmd timeout: cmd='{cmd_str}' stdout='{stdout_excerpt}' stderr='{stderr_excerpt}' (capped)")
+        return {"ok": False, "stdout": stdout, "stderr": stderr, "returncode": 124,
+            "error": "timeout", "cmd": cmd_str}
+    # Stopping the command at the cap is expected; its output up to the cap is valid.
+    ok = (truncated and stop_at_cap) or proc.returncode == 0
+    trace(
+        f"run_cmd done: rc={proc.returncode} ok={ok} truncated={truncated} "
+        f"stdout='{stdout_excerpt}' stderr='{stderr_excerpt}' (capped)"
+    )
+    return {"ok": ok, "stdout": stdout, "stderr": stderr, "returncode": proc.returncode,
+        "error": "", "cmd": cmd_str, "truncated": truncated}
+
+
+def run_cmd(
+    cmd: list,
+    timeout: int = 20,
+    env: Optional[dict] = None,
+    line_handler=None,
+    max_stdout: Optional[int] = None,
+    max_output: Optional[int] = None,
+) -> dict:
+    """Run a subprocess and return a result dict.
+
+    With line_handler, merged stdout/stderr is streamed line by line to the handler
+    instead of being buffered; "stdout" then holds only the last few lines.
+    With max_stdout, reading stops (and the command is terminated) once that many
+    bytes of stdout have arrived.
+    With max_output, the command runs to completion but only the first max_output
+    bytes of stdout and of stderr are kept.
+    """
     cmd_str = " ".join(cmd)
     env_markers = []
     if env:
@@ -95,6 +320,12 @@ def run_cmd(cmd: list, timeout: int = 20, env: Optional[dict] = None) -> dict:
                 env_markers.append(f"{key}={value}")
     env_suffix = f", env_markers={env_markers}" if env_markers else ""
     trace(f"run_cmd start: cmd='{cmd_str}', timeout={timeout}{env_suffix}")
+    if line_handler is not None:
+        return _run_cmd_streaming(cmd, cmd_str, timeout, env, line_handler)
+    if max_stdout is not None:
+        return _run_cmd_collect(cmd, cmd_str, timeout, env, max_stdout)
+    if max_output is not None:
+        return _run_cmd_collect(cmd, cmd_str, timeout, env, max_output, max_stderr=max_output, stop_at_cap=False)
     try:
         r = subprocess.run(
             cmd,
@@ -119,10 +350,6 @@ def run_cmd(cmd: list, timeout: int = 20, env: Optional[dict] = None) -> dict:
             f"stdout='{stdout_excerpt}' stderr='{stderr_excerpt}'"
         )
         return result
-    except FileNotFoundError:
-        trace(f"run_cmd error: command not found: '{cmd_str}'")
-        return {"ok": False, "stdout": "", "stderr": "", "returncode": 127,
-                "error": "command not found", "cmd": cmd_str}
     except subprocess.TimeoutExpired as exc:
         def _to_text(value) -> str:
             if value is None:
@@ -141,9 +368,18 @@ def run_cmd(cmd: list, timeout: int = 20, env: Optional[dict] = None) -> dict:
         return {"ok": False, "stdout": stdout, "stderr": stderr, "returncode": 124,
             "error": "timeout", "cmd": cmd_str}
     except Exception as exc:  # noqa: BLE001
-        trace(f"run_cmd exception: cmd='{cmd_str}' error='{exc}'")
-        return {"ok": False, "stdout": "", "stderr": "", "returncode": 1,
-            "error": str(exc), "cmd": cmd_str}
+        return _run_error_result(cmd_str, exc)
+
+
+def _sample_cmd_output(cmd: list, duration_s: float, env: Optional[dict] = None) -> dict:
+    """Collect output of a never-ending command for duration_s, then stop it with SIGTERM.
+
+    Reaching the deadline is the expected outcome and is reported as returncode 124 (like
+    timeout(1)); a command that exits earlier keeps its own returncode.
+    """
+    cmd_str = " ".join(cmd)
+    trace(f"run_cmd start: cmd='{cmd_str}', sample={duration_s}s")
+    return _run_cmd_collect(cmd, cmd_str, duration_s, env, sample=True)
 
 
 def resolve_report_output_path(requested_path: str) -> tuple[str, str]:
@@ -211,8 +447,8 @@ def analyze_kwin_crash_signals(journalctl_sections: dict) -> dict:
     for sec in (journalctl_sections or {}).values():
         if not isinstance(sec, dict):
             continue
-        combined_chunks.append(sec.get("stdout", "") or "")
-        combined_chunks.append(sec.get("stderr", "") or "")
+        combined_chunks.append(sec.get("stdout") or "")
+        combined_chunks.append(sec.get("stderr") or "")
     text = "\n".join(combined_chunks)
     text_l = text.lower()
 
@@ -229,7 +465,7 @@ def analyze_kwin_crash_signals(journalctl_sections: dict) -> dict:
     if "kwin_wayland" in text_l and ("segfault" in text_l or "segmentation fault" in text_l or "sigsegv" in text_l):
         signals.append("KWin segfault signature detected in logs.")
         score += 5
-    if "coredumpctl" in (journalctl_sections or {}) and (journalctl_sections.get("coredumpctl", {}).get("stdout", "") or "").strip():
+    if "coredumpctl" in (journalctl_sections or {}) and (journalctl_sections.get("coredumpctl", {}).get("stdout") or "").strip():
         signals.append("coredumpctl returned entries for kwin_wayland.")
         score += 4
 
@@ -258,10 +494,37 @@ def analyze_kwin_crash_signals(journalctl_sections: dict) -> dict:
     }
 
 
+@functools.cache
+def _path_entry_names() -> frozenset:
+    """Names of every entry in the PATH directories, from one scandir sweep per directory."""
+    names: set[str] = set()
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            with os.scandir(directory or ".") as it:
+                names.update(entry.name for entry in it)
+        except OSError:
+            continue
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
 def command_exists(cmd: str) -> bool:
+    # Names absent from every PATH directory are rejected without per-directory stat calls;
+    # candidates still go through shutil.which for the executable-bit check.
+    if os.sep not in cmd and cmd not in _path_entry_names():
+        return False
     return shutil.which(cmd) is not None
 
 
+def invalidate_install_caches() -> None:
+    """Forget memoized PATH and package lookups; call after anything that installs or removes packages."""
+    _path_entry_names.cache_clear()
+    command_exists.cache_clear()
+    _available_packages.cache_clear()
+    _qdbus_cmd.cache_clear()
+    _scan_installed_nvidia_packages.cache_clear()
+
+
 def command_exists_any(commands: list[str]) -> bool:
     return any(command_exists(cmd) for cmd in commands)
 
@@ -283,6 +546,12 @@ def tool_available(tool: str) -> bool:
     return command_exists(tool)
 
 
+@functools.cache
+def _qdbus_cmd() -> Optional[str]:
+    """Installed qdbus variant, resolved once per run; None when no variant exists."""
+    return resolve_command_variant("qdbus") if tool_available("qdbus") else None
+
+
 def read_file(path: str) -> str:
     try:
         return Path(path).read_text().strip()
@@ -290,15 +559,22 @@ def read_file(path: str) -> str:
         return ""
 
 
+_RE_ANSI = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+
+
+@functools.lru_cache(maxsize=32)
 def strip_ansi(text: str) -> str:
-    """Remove ANSI escape sequences from terminal output."""
-    return re.sub(r"\x1B\[[0-?]*[ -/]*[@-~]", "", text or "")
+    """Remove ANSI escape sequences from terminal output (memoized; same stdout is often scanned twice)."""
+    return _RE_ANSI.sub("", text or "")
+
+
+_RE_NUMERIC_SCALAR = re.compile(r"^(?:uint32\s+)?([0-9]+(?:\.[0-9]+)?)$")
 
 
 def parse_numeric_scalar(text: str) -> Optional[float]:
     """Parse a plain numeric scalar (optionally prefixed by uint32) safely."""
     cleaned = strip_ansi(text).strip()
-    m = re.match(r"^(?:uint32\s+)?([0-9]+(?:\.[0-9]+)?)$", cleaned)
+    m = _RE_NUMERIC_SCALAR.match(cleaned)
     if not m:
         return None
     try:
@@ -311,6 +587,7 @@ def parse_numeric_scalar(text: str) -> Optional[float]:
 # OS / distro detection
 # ---------------------------------------------------------------------------
 
+@functools.cache
 def read_os_release() -> dict:
     data: dict = {}
     for line in read_file("/etc/os-release").splitlines():
@@ -340,6 +617,7 @@ def detect_base_distro(osr: dict) -> str:
     return "unknown"
 
 
+@functools.cache
 def detect_pkg_manager() -> Optional[str]:
     for pm in ("apt-get", "dnf", "pacman", "zypper", "rpm-ostree"):
         if command_exists(pm):
@@ -347,12 +625,14 @@ def detect_pkg_manager() -> Optional[str]:
     return None
 
 
+@functools.cache
 def detect_immutable() -> bool:
     return command_exists("rpm-ostree")
 
 
+@functools.cache
 def detect_live_environment() -> dict:
-    """Best-effort detection of live/installer environment where package installs may be restricted."""
+    """Best-effort detection of live/installer environment where package installs may be restricted (cached per run)."""
     markers = {
         "/run/initramfs/live": Path("/run/initramfs/live").exists(),
         "/run/archiso": Path("/run/archiso").exists(),
@@ -373,7 +653,7 @@ def detect_live_environment() -> dict:
     if command_exists("findmnt"):
         res = run_cmd(["findmnt", "-n", "-o", "FSTYPE", "/"], timeout=10)
         if res.get("ok"):
-            root_fs_type = (res.get("stdout", "") or "").strip()
+            root_fs_type = (res.get("stdout") or "").strip()
     in_container = (
         Path("/.dockerenv").exists()
         or Path("/run/.containerenv").exists()
@@ -560,11 +840,45 @@ _PKG_MAP: dict = {
 }
 
 
+# One bulk listing of installable package names per package manager. The trailing newline in
+# the dnf format keeps dnf5 output one name per line.
+_PACKAGE_LIST_CMDS = {
+    "apt-get": (["apt-cache", "pkgnames"], 60),
+    "dnf": (["dnf", "-q", "repoquery", "--qf", "%{name}\n"], 180),
+    "pacman": (["pacman", "-Slq"], 60),
+    "zypper": (["zypper", "--non-interactive", "-q", "search", "-t", "package"], 120),
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _available_packages(pm: str) -> frozenset:
+    """Package names pm can install, from one query; empty when the listing is unavailable."""
+    spec = _PACKAGE_LIST_CMDS.get(pm)
+    if not spec or not command_exists(spec[0][0]):
+        return frozenset()
+    cmd, timeout = spec
+    res = run_cmd(cmd, timeout=timeout)
+    if not res.get("ok"):
+        return frozenset()
+    stdout = res.get("stdout", "")
+    if pm == "zypper":
+        # Table rows: "S | Name | Summary | Type"
+        return frozenset(
+            cols[1].strip() for cols in (line.split("|") for line in stdout.splitlines()) if len(cols) > 2
+        )
+    return frozenset(stdout.split())
+
+
 def _package_exists(pm: str, package: str) -> bool:
     """Best-effort package existence check for distro package managers."""
     if not package:
         return False
 
+    available = _available_packages(pm)
+    if available:
+        return package in available
+
+    # Bulk listing failed: fall back to asking about this one package.
     if pm == "apt-get" and command_exists("apt-cache"):
         res = run_cmd(["apt-cache", "show", package], timeout=20)
         return res.get("ok", False) and bool(res.get("stdout"))
@@ -694,16 +1008,16 @@ def gather_package_manager_diagnostics(pm: Optional[str], run_user_cmd, base_dis
         policy = run_user_cmd(["apt-cache", "policy"], timeout=30) if command_exists("apt-cache") else {"ok": False}
         diag["checks"]["repo_policy"] = {
             "ok": policy.get("ok", False),
-            "stderr": (policy.get("stderr", "") or "")[:3000],
-            "stdout_excerpt": (policy.get("stdout", "") or "")[:8000],
+            "stderr": (policy.get("stderr") or "")[:3000],
+            "stdout_excerpt": (policy.get("stdout") or "")[:8000],
         }
         diag["can_install"] = bool(policy.get("ok", False)) and not live_env.get("likely_live")
     elif pm == "dnf":
         repolist = run_user_cmd(["dnf", "-q", "repolist", "--enabled"], timeout=45)
         diag["checks"]["repolist_enabled"] = {
             "ok": repolist.get("ok", False),
-            "stderr": (replist_err := (repolist.get("stderr", "") or ""))[:3000],
-            "stdout_excerpt": (repolist.get("stdout", "") or "")[:8000],
+            "stderr": (replist_err := (repolist.get("stderr") or ""))[:3000],
+            "stdout_excerpt": (repolist.get("stdout") or "")[:8000],
         }
         diag["can_install"] = bool(repolist.get("ok", False)) and not live_env.get("likely_live")
         if not repolist.get("ok"):
@@ -713,16 +1027,16 @@ def gather_package_manager_diagnostics(pm: Optional[str], run_user_cmd, base_dis
         sync_db = run_user_cmd(["pacman", "-Sy", "--print-format", "%n", "--noconfirm"], timeout=45)
         diag["checks"]["syncdb"] = {
             "ok": sync_db.get("ok", False),
-            "stderr": (sync_db.get("stderr", "") or "")[:3000],
-            "stdout_excerpt": (sync_db.get("stdout", "") or "")[:8000],
+            "stderr": (sync_db.get("stderr") or "")[:3000],
+            "stdout_excerpt": (sync_db.get("stdout") or "")[:8000],
         }
         diag["can_install"] = bool(sync_db.get("ok", False)) and not live_env.get("likely_live")
     elif pm == "zypper":
         repos = run_user_cmd(["zypper", "--non-interactive", "repos", "-d"], timeout=45)
         diag["checks"]["repos"] = {
             "ok": repos.get("ok", False),
-            "stderr": (repos.get("stderr", "") or "")[:3000],
-            "stdout_excerpt": (repos.get("stdout", "") or "")[:8000],
+            "stderr": (repos.get("stderr") or "")[:3000],
+            "stdout_excerpt": (repos.get("stdout") or "")[:8000],
         }
         diag["can_install"] = bool(repos.get("ok", False)) and not live_env.get("likely_live")
     else:
@@ -736,29 +1050,40 @@ def gather_package_manager_diagnostics(pm: Optional[str], run_user_cmd, base_dis
     return diag
 
 
+# Bytes of stdout and of stderr kept per package-manager command; the rest is drained and dropped.
+_INSTALL_LOG_MAX_BYTES = 65_536
+
+
 def install_packages(pm: str, packages: list, priv: dict) -> dict:
     if not packages:
         return {"ok": True, "installed": [], "logs": []}
     logs = []
+
+    def run_install(cmd: list, timeout: int) -> dict:
+        # Verbose installs of large package sets must not grow memory without bound.
+        return run_cmd(cmd, timeout=timeout, max_output=_INSTALL_LOG_MAX_BYTES)
+
     if pm == "apt-get":
         cmd = ensure_sudo(["apt-get", "update", "-qq"], priv)
         if cmd:
-            logs.append(run_cmd(cmd, timeout=120))
+            logs.append(run_install(cmd, 120))
         cmd = ensure_sudo(["apt-get", "install", "-y", "-qq"] + packages, priv)
         if cmd:
-            logs.append(run_cmd(cmd, timeout=300))
+            logs.append(run_install(cmd, 300))
     elif pm == "dnf":
         cmd = ensure_sudo(["dnf", "-y", "-q", "install"] + packages, priv)
         if cmd:
-            logs.append(run_cmd(cmd, timeout=300))
+            logs.append(run_install(cmd, 300))
     elif pm == "pacman":
         cmd = ensure_sudo(["pacman", "-Sy", "--noconfirm", "--quiet"] + packages, priv)
         if cmd:
-            logs.append(run_cmd(cmd, timeout=300))
+            logs.append(run_install(cmd, 300))
     elif pm == "zypper":
         cmd = ensure_sudo(["zypper", "--non-interactive", "install"] + packages, priv)
         if cmd:
-            logs.append(run_cmd(cmd, timeout=300))
+            logs.append(run_install(cmd, 300))
+    if logs:
+        invalidate_install_caches()
     ok = all(lg.get("ok") for lg in logs) if logs else False
     return {"ok": ok, "installed": packages if ok else [], "logs": logs}
 
@@ -772,13 +1097,12 @@ def detect_processes() -> list:
     return res["stdout"].splitlines() if res["ok"] else []
 
 
+_RE_XWAYLAND_DISPLAY = re.compile(r"^Xwayland[^\n]*?[ \t](:\d+)[ \t]", re.MULTILINE)
+
+
 def parse_xwayland_display(processes: list) -> Optional[str]:
-    for p in processes:
-        if p.startswith("Xwayland"):
-            m = re.search(r"\s(:\d+)\s", p)
-            if m:
-                return m.group(1)
-    return None
+    m = _RE_XWAYLAND_DISPLAY.search("\n".join(processes))
+    return m.group(1) if m else None
 
 
 def guess_wayland_display(uid: int) -> Optional[str]:
@@ -793,6 +1117,27 @@ def detect_session_type(env: dict) -> str:
     return env.get("XDG_SESSION_TYPE", "unknown") or "unknown"
 
 
+_DESKTOP_SESSION_PROCS = (
+    ("COSMIC",   ("cosmic-comp",)),
+    ("GNOME",    ("gnome-shell",)),
+    ("KDE",      ("plasmashell",)),
+    ("Cinnamon", ("cinnamon",)),
+    ("Xfce",     ("xfce4-session",)),
+    ("Sway",     ("sway",)),
+    ("Hyprland", ("Hyprland",)),
+    ("i3",       ("i3",)),
+    ("MATE",     ("mate-session",)),
+    ("LXQt",     ("lxqt-session",)),
+    ("Openbox",  ("openbox",)),
+    ("Budgie",   ("budgie-wm",)),
+)
+# Prefix match at the start of a ps line, like str.startswith on each process entry.
+_RE_DESKTOP_SESSION_PROC = re.compile(
+    "^(?:" + "|".join(re.escape(proc) for _, procs in _DESKTOP_SESSION_PROCS for proc in procs) + ")",
+    re.MULTILINE,
+)
+
+
 def infer_desktop_session(env: dict, processes: list) -> str:
     desktop = (
         env.get("XDG_CURRENT_DESKTOP")
@@ -802,37 +1147,34 @@ def infer_desktop_session(env: dict, processes: list) -> str:
     ).strip()
     if desktop:
         return desktop
-    for name, procs in [
-        ("COSMIC",   ["cosmic-comp"]),
-        ("GNOME",    ["gnome-shell"]),
-        ("KDE",      ["plasmashell"]),
-        ("Cinnamon", ["cinnamon"]),
-        ("Xfce",     ["xfce4-session"]),
-        ("Sway",     ["sway"]),
-        ("Hyprland", ["Hyprland"]),
-        ("i3",       ["i3"]),
-        ("MATE",     ["mate-session"]),
-        ("LXQt",     ["lxqt-session"]),
-        ("Openbox",  ["openbox"]),
-        ("Budgie",   ["budgie-wm"]),
-    ]:
-        for p in processes:
-            if any(p.startswith(proc) for proc in procs):
-                return name
+    # One pass over the process list collects every session process that is running;
+    # the table order still decides which desktop wins.
+    running = {m.group(0) for m in _RE_DESKTOP_SESSION_PROC.finditer("\n".join(processes))}
+    for name, procs in _DESKTOP_SESSION_PROCS:
+        if not running.isdisjoint(procs):
+            return name
     return "unknown"
 
 
+_KNOWN_COMPOSITORS = (
+    "cosmic-comp", "kwin_wayland", "kwin_x11", "mutter", "gnome-shell",
+    "muffin", "xfwm4", "sway", "Hyprland", "weston", "picom", "compton",
+    "i3", "bspwm", "awesome", "qtile", "marco", "openbox", "budgie-wm",
+)
+_KNOWN_COMPOSITORS_RANK = {name: idx for idx, name in enumerate(_KNOWN_COMPOSITORS)}
+_KNOWN_COMPOSITORS_ALT = "|".join(map(re.escape, _KNOWN_COMPOSITORS))
+# A known name at the start of a ps line (prefix) or as a space-delimited word elsewhere in it.
+_RE_COMPOSITOR_WM = re.compile(f"^({_KNOWN_COMPOSITORS_ALT})|(?<= )({_KNOWN_COMPOSITORS_ALT})(?= )")
+
+
 def detect_compositor_wm(processes: list) -> dict:
-    known = [
-        "cosmic-comp", "kwin_wayland", "kwin_x11", "mutter", "gnome-shell",
-        "muffin", "xfwm4", "sway", "Hyprland", "weston", "picom", "compton",
-        "i3", "bspwm", "awesome", "qtile", "marco", "openbox", "budgie-wm",
-    ]
-    found = []
+    seen: dict = {}
     for p in processes:
-        for k in known:
-            if (p.startswith(k) or f" {k} " in p) and k not in found:
-                found.append(k)
+        # Several names on one line are reported in _KNOWN_COMPOSITORS order, not line order.
+        hits = {m.group(1) or m.group(2) for m in _RE_COMPOSITOR_WM.finditer(p)}
+        for name in sorted(hits, key=_KNOWN_COMPOSITORS_RANK.__getitem__):
+            seen.setdefault(name, None)
+    found = list(seen)
     compositor = found[0] if found else "unknown"
     return {"window_manager": compositor, "compositor": compositor, "found": found}
 
@@ -861,6 +1203,9 @@ def parse_proc_input_devices() -> list:
     return devices
 
 
+_RE_EVENT_HANDLER = re.compile(r"event(\d+)")
+
+
 def select_mouse_event_device(devices: list) -> Optional[str]:
     """Return /dev/input/eventN for the best mouse/pointer device found."""
     # First pass: name-based
@@ -868,14 +1213,14 @@ def select_mouse_event_device(devices: list) -> Optional[str]:
         name     = dev.get("name", "").lower()
         handlers = dev.get("handlers", "")
         if any(k in name for k in ("mouse", "pointer", "trackpad", "touchpad", "trackball")):
-            m = re.search(r"event(\d+)", handlers)
+            m = _RE_EVENT_HANDLER.search(handlers)
             if m:
                 return f"/dev/input/event{m.group(1)}"
     # Second pass: handler-based
     for dev in devices:
         handlers = dev.get("handlers", "")
         if "mouse" in handlers.lower():
-            m = re.search(r"event(\d+)", handlers)
+            m = _RE_EVENT_HANDLER.search(handlers)
             if m:
                 return f"/dev/input/event{m.group(1)}"
     return None
@@ -886,19 +1231,25 @@ def select_mouse_event_device(devices: list) -> Optional[str]:
 # ---------------------------------------------------------------------------
 
 def gather_graphics_info(run_user_cmd, priv: dict) -> dict:
-    info: dict = {}
+    jobs: dict = {}
     cmd = ensure_sudo(["lspci", "-nnk"], priv)
     if cmd:
-        info["lspci"] = run_cmd(cmd)
+        jobs["lspci"] = functools.partial(run_cmd, cmd)
     cmd = ensure_sudo(["lshw", "-C", "display"], priv)
     if cmd:
-        info["lshw"] = run_cmd(cmd, timeout=30)
-    info["lsmod"] = run_cmd(["lsmod"])
+        jobs["lshw"] = functools.partial(run_cmd, cmd, timeout=30)
+    jobs["lsmod"] = functools.partial(run_cmd, ["lsmod"])
     if command_exists("glxinfo"):
-        info["glxinfo"] = run_user_cmd(["glxinfo", "-B"])
+        jobs["glxinfo"] = functools.partial(run_user_cmd, ["glxinfo", "-B"])
     if command_exists("vulkaninfo"):
-        info["vulkaninfo"] = run_user_cmd(["vulkaninfo", "--summary"], 30)
-    return info
+        jobs["vulkaninfo"] = functools.partial(run_user_cmd, ["vulkaninfo", "--summary"], 30)
+    return _run_probes_concurrently(jobs, max_workers=5)
+
+
+_RE_LSPCI_SLOT = re.compile(r"^[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-9]\s")
+_RE_LSPCI_DISPLAY_CLASS = re.compile(r"vga compatible controller|3d controller|display controller", re.IGNORECASE)
+_RE_LSPCI_DESC = re.compile(r":\s*(.+?)(?:\s*\(rev\s+[0-9a-fA-F]+\))?$")
+_RE_GLX_RENDERER = re.compile(r"OpenGL renderer[^:\n]*:(.*)")
 
 
 def parse_lspci_gpu_inventory(lspci_text: str) -> list[dict]:
@@ -907,18 +1258,18 @@ def parse_lspci_gpu_inventory(lspci_text: str) -> list[dict]:
     current: Optional[dict] = None
     for raw_line in (lspci_text or "").splitlines():
         line = raw_line.rstrip()
-        if re.match(r"^[0-9a-fA-F]{2}:[0-9a-fA-F]{2}\.[0-9]\s", line):
+        if _RE_LSPCI_SLOT.match(line):
             if current:
                 gpus.append(current)
                 current = None
-            if any(x in line.lower() for x in ("vga compatible controller", "3d controller", "display controller")):
+            if _RE_LSPCI_DISPLAY_CLASS.search(line):
                 slot = line.split()[0]
-                m_desc = re.search(r":\s*(.+?)(?:\s*\(rev\s+[0-9a-fA-F]+\))?$", line)
+                m_desc = _RE_LSPCI_DESC.search(line)
                 current = {
                     "slot": slot,
                     "model": (m_desc.group(1).strip() if m_desc else line.strip()),
                     "driver_in_use": "",
-                    "kernel_modules": [],
+                    "kernel_modules": (),
                 }
             continue
         if current is None:
@@ -926,13 +1277,17 @@ def parse_lspci_gpu_inventory(lspci_text: str) -> list[dict]:
         if "Kernel driver in use:" in line:
             current["driver_in_use"] = line.split(":", 1)[1].strip()
         elif "Kernel modules:" in line:
-            mods = [m.strip() for m in line.split(":", 1)[1].split(",") if m.strip()]
+            mods = tuple(m.strip() for m in line.split(":", 1)[1].split(",") if m.strip())
             current["kernel_modules"] = mods
     if current:
         gpus.append(current)
     return gpus
 
 
+# "driver   : nvidia-driver-535 - distro non-free recommended" -> (package, rest of line)
+_RE_UD_DRIVER = re.compile(r"driver[ \t]*:[ \t]*(\S+)([^\n]*)")
+
+
 def parse_possible_nvidia_drivers(base_distro: str, run_user_cmd) -> dict:
     """Collect possible/recommended NVIDIA driver packages from distro tools."""
     data = {
@@ -946,14 +1301,11 @@ def parse_possible_nvidia_drivers(base_distro: str, run_user_cmd) -> dict:
         ud = run_user_cmd(["ubuntu-drivers", "devices"], timeout=40)
         if ud.get("ok"):
             data["raw"] = ud.get("stdout", "")[:8000]
-            for line in ud.get("stdout", "").splitlines():
-                m = re.search(r"driver\s*:\s*([^\s]+)", line)
-                if not m:
-                    continue
-                pkg = m.group(1).strip()
+            for m in _RE_UD_DRIVER.finditer(ud.get("stdout", "")):
+                pkg = m.group(1)
                 if pkg not in data["available"]:
                     data["available"].append(pkg)
-                if "recommended" in line.lower():
+                if "recommended" in m.group(2).lower():
                     data["recommended"] = pkg
     return data
 
@@ -1009,7 +1361,7 @@ def gather_desktop_pipeline_packages(
     """Collect major desktop pipeline packages and installed versions."""
     pm = detect_pkg_manager()
     desktop_lc = (desktop or "").lower()
-    compositor_lc = (wm_comp.get("compositor", "") or "").lower()
+    compositor_lc = (wm_comp.get("compositor") or "").lower()
     session_lc = (session_type or "").lower()
 
     components: list[tuple[str, list[str]]] = [
@@ -1116,7 +1468,7 @@ def gather_desktop_pipeline_packages(
             ("Scaling tools", ["xrandr", "arandr"]),
         ])
 
-    uses_nvidia = "nvidia" in set(driver_info.get("loaded", [])) or "nvidia" in (compositor_lc + desktop_lc)
+    uses_nvidia = "nvidia" in driver_info.get("loaded", ()) or "nvidia" in (compositor_lc + desktop_lc)
     if uses_nvidia or possible_nvidia_drivers.get("available"):
         nvidia_candidates = []
         nvidia_candidates.extend(possible_nvidia_drivers.get("available", [])[:12])
@@ -1253,8 +1605,8 @@ def evaluate_inspection_coverage(
     gpu_inventory: list,
 ) -> dict:
     """Compute a quick coverage score and list missing inspection signals."""
-    rows = pipeline_packages.get("rows", []) or []
-    active_runtime = pipeline_packages.get("active_runtime", []) or []
+    rows = pipeline_packages.get("rows") or []
+    active_runtime = pipeline_packages.get("active_runtime") or []
 
     role_requirements = [
         "Compositor / WM",
@@ -1329,7 +1681,7 @@ def gather_gaming_optimization_signals(
 ) -> dict:
     """Collect kernel/system optimization signals relevant to gaming operation."""
     pm = detect_pkg_manager()
-    kernel_release = platform.release()
+    kernel_release = _KERNEL_RELEASE
     kernel_lc = kernel_release.lower()
 
     # Kernel flavor tags frequently associated with gaming/low-latency tuning.
@@ -1367,12 +1719,12 @@ def gather_gaming_optimization_signals(
     steam_active = any(name in process_names_lc for name in ("steam", "steamwebhelper"))
 
     gamemode_service = run_cmd(["systemctl", "is-active", "gamemoded"], timeout=10)
-    combined_text = ((gamemode_service.get("stdout", "") or "") + "\n" + (gamemode_service.get("stderr", "") or "")).strip()
+    combined_text = ((gamemode_service.get("stdout") or "") + "\n" + (gamemode_service.get("stderr") or "")).strip()
     combined_lc = combined_text.lower()
     if "systemd" in combined_lc and "not running" in combined_lc:
         gamemode_service_state = "not-available (no systemd init context)"
     elif gamemode_service.get("ok"):
-        first_line = (gamemode_service.get("stdout", "") or "").strip().splitlines()
+        first_line = (gamemode_service.get("stdout") or "").strip().splitlines()
         gamemode_service_state = first_line[0].strip() if first_line else "unknown"
     else:
         gamemode_service_state = "unknown"
@@ -1517,7 +1869,7 @@ def should_guard_scale_switching(session_type: str, desktop: str, driver_info: d
         return False, "disabled-by-default"
     is_wayland = "wayland" in (session_type or "").lower()
     is_kde = "kde" in (desktop or "").lower() or "plasma" in (desktop or "").lower()
-    uses_nouveau = "nouveau" in set(driver_info.get("loaded", []))
+    uses_nouveau = "nouveau" in driver_info.get("loaded", ())
     if is_wayland and is_kde and uses_nouveau:
         return True, "kde-wayland+nouveau risk guard"
     return False, ""
@@ -1526,13 +1878,25 @@ def should_guard_scale_switching(session_type: str, desktop: str, driver_info: d
 def gather_driver_info(lsmod_text: str, priv: dict) -> dict:
     loaded_all = {line.split()[0] for line in lsmod_text.splitlines() if line.strip()}
     gpu_modules = {"nvidia", "nouveau", "i915", "xe", "amdgpu", "radeon"}
-    loaded_gpu = sorted(loaded_all & gpu_modules)
-    drivers: dict = {}
+    # At most a handful of names: a sorted tuple tests membership as fast as a set and stays JSON-friendly.
+    loaded_gpu = tuple(sorted(loaded_all & gpu_modules))
+    # modinfo -F takes one field per call; all module/field lookups are independent.
+    jobs: dict = {}
     for mod in loaded_gpu:
-        def _mf(field: str, m: str = mod) -> str:
-            cmd = ensure_sudo(["modinfo", "-F", field, m], priv)
-            return run_cmd(cmd).get("stdout", "") if cmd else ""
-        drivers[mod] = {"module": mod, "version": _mf("version"), "filename": _mf("filename")}
+        for field in ("version", "filename"):
+            cmd = ensure_sudo(["modinfo", "-F", field, mod], priv)
+            if cmd:
+                jobs[(mod, field)] = functools.partial(run_cmd, cmd)
+    fields = _run_probes_concurrently(jobs)
+
+    def _mf(mod: str, field: str) -> str:
+        res = fields.get((mod, field))
+        return res.get("stdout", "") if res else ""
+
+    drivers = {
+        mod: {"module": mod, "version": _mf(mod, "version"), "filename": _mf(mod, "filename")}
+        for mod in loaded_gpu
+    }
     driver_type = "proprietary" if "nvidia" in loaded_gpu else "open-source"
     return {"drivers": drivers, "driver_type": driver_type, "loaded": loaded_gpu}
 
@@ -1587,55 +1951,103 @@ def assess_driver_suitability(glxinfo_stdout: str, driver_info: dict) -> tuple:
 # Display info and scale detection
 # ---------------------------------------------------------------------------
 
+_RE_WLR_MODE = re.compile(r"(\d+x\d+)\s+px,\s*([0-9.]+)\s*Hz,\s*current")
+_RE_WLR_SCALE = re.compile(r"[Ss]cale:\s*([0-9.]+)|scale\s+([0-9.]+)")
+
+# Last wlr-randr result for this analysis pass; cleared whenever the scale may have changed.
+_WLR_RANDR_CACHE: dict[str, dict] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_wlr_randr(stdout: str) -> tuple[dict, ...]:
+    """Parse wlr-randr output into per-output name/scale/refresh_hz/mode/focused records."""
+    outputs: list[dict] = []
+    current: Optional[dict] = None
+    for raw in strip_ansi(stdout).splitlines():
+        line = raw.rstrip()
+        if not line:
+            continue
+        if not line.startswith(" ") and not line.startswith("\t"):
+            if current:
+                outputs.append(current)
+            current = {
+                "name": line.split(None, 1)[0],
+                "scale": None,
+                "refresh_hz": None,
+                "mode": "",
+                "focused": "(focused)" in line,
+            }
+            continue
+        if current is None:
+            continue
+
+        m_mode = _RE_WLR_MODE.search(line)
+        if m_mode:
+            current["mode"] = m_mode.group(1)
+            try:
+                current["refresh_hz"] = float(m_mode.group(2))
+            except ValueError:
+                pass
+
+        m_scale = _RE_WLR_SCALE.search(line)
+        if m_scale:
+            try:
+                current["scale"] = float(m_scale.group(1) or m_scale.group(2))
+            except ValueError:
+                pass
+
+    if current:
+        outputs.append(current)
+    return tuple(outputs)
+
+
+def _run_wlr_randr(run_user_cmd) -> dict:
+    """Run wlr-randr at most once per pass; scale changes clear _WLR_RANDR_CACHE."""
+    if "result" not in _WLR_RANDR_CACHE:
+        _WLR_RANDR_CACHE["result"] = run_user_cmd(["wlr-randr"])
+    return _WLR_RANDR_CACHE["result"]
+
+
+def get_wlr_outputs(run_user_cmd) -> Optional[list[dict]]:
+    """Return parsed wlr-randr outputs, or None when wlr-randr is missing or failed."""
+    if not command_exists("wlr-randr"):
+        return None
+    res = _run_wlr_randr(run_user_cmd)
+    if not res.get("ok"):
+        return None
+    return [dict(out) for out in _parse_wlr_randr(res.get("stdout", ""))]
+
+
 def gather_display_info(run_user_cmd) -> dict:
-    info: dict = {}
+    jobs: dict = {}
     if command_exists("wayland-info"):
-        info["wayland_info"] = run_user_cmd(["wayland-info"])
+        jobs["wayland_info"] = functools.partial(run_user_cmd, ["wayland-info"])
     if command_exists("wlr-randr"):
-        info["wlr_randr"] = run_user_cmd(["wlr-randr"])
-    return info
+        jobs["wlr_randr"] = functools.partial(_run_wlr_randr, run_user_cmd)
+    return _run_probes_concurrently(jobs)
 
 
-def detect_current_scale(
-    session_env: dict,
-    desktop: str,
-    run_user_cmd,
-    home_dir: str,
-) -> tuple:
-    """
-    Try every available method to detect the current desktop scale.
-    Priority order:
-      1. wlr-randr (Sway / Hyprland / wlroots / COSMIC)
-      2. kscreen-doctor (KDE Plasma 6 Wayland)
-      3. gsettings integer scale (GNOME)
-      4. kreadconfig5 (KDE Plasma 5)
-      5. xfconf-query (Xfce)
-      6. COSMIC config files
-      7. Mutter gdbus (GNOME fractional)
-      8. xrandr transform matrix (X11)
-      9. HiDPI env vars (GDK_SCALE, QT_SCALE_FACTOR)
-     10. Fallback 1x
-    Returns (factor: float, source: str).
-    """
-    de = desktop.lower()
+def _try_wlr_randr_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
+    wlr_scale = next((out["scale"] for out in get_wlr_outputs(run_user_cmd) or [] if out["scale"] is not None), None)
+    if wlr_scale is not None:
+        return wlr_scale, "wlr-randr"
+    return None
+
+
+_RE_KSCREEN_SCALE = re.compile(r"Scale:\s*([0-9.]+)")
 
-    # 1. wlr-randr (Sway, Hyprland, wlroots, COSMIC)
-    if command_exists("wlr-randr"):
-        res = run_user_cmd(["wlr-randr"])
-        if res["ok"]:
-            m = re.search(r"[Ss]cale:\s*([0-9.]+)", strip_ansi(res["stdout"]))
-            if m:
-                return float(m.group(1)), "wlr-randr"
 
-    # 2. kscreen-doctor (KDE Wayland)
+def _try_kscreen_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if command_exists("kscreen-doctor"):
         res = run_user_cmd(["kscreen-doctor", "--outputs"])
         if res["ok"]:
-            m = re.search(r"Scale:\s*([0-9.]+)", strip_ansi(res["stdout"]))
+            m = _RE_KSCREEN_SCALE.search(strip_ansi(res["stdout"]))
             if m:
                 return float(m.group(1)), "kscreen-doctor"
+    return None
+
 
-    # 3. gsettings (GNOME integer scale)
+def _try_gsettings_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if command_exists("gsettings") and any(x in de for x in ("gnome", "ubuntu", "cinnamon")):
         res = run_user_cmd(["gsettings", "get", "org.gnome.desktop.interface", "scaling-factor"])
         if res["ok"]:
@@ -1649,8 +2061,10 @@ def detect_current_scale(
                     if text_factor is not None and text_factor != 1.0:
                         return round(factor * text_factor, 4), "gsettings (integer x text-scaling-factor)"
                 return factor, "gsettings scaling-factor"
+    return None
 
-    # 4. kreadconfig5 (KDE Plasma 5)
+
+def _try_kreadconfig5_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if command_exists("kreadconfig5"):
         res = run_user_cmd(["kreadconfig5", "--group", "KScreen", "--key", "ScaleFactor"])
         if res["ok"] and res["stdout"].strip():
@@ -1658,8 +2072,10 @@ def detect_current_scale(
                 return float(res["stdout"].strip()), "kreadconfig5 KScreen/ScaleFactor"
             except ValueError:
                 pass
+    return None
+
 
-    # 5. xfconf-query (Xfce)
+def _try_xfconf_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if command_exists("xfconf-query"):
         res = run_user_cmd(["xfconf-query", "-c", "xsettings", "-p", "/Gdk/WindowScalingFactor"])
         if res["ok"] and res["stdout"].strip():
@@ -1667,20 +2083,30 @@ def detect_current_scale(
                 return float(res["stdout"].strip()), "xfconf-query Gdk/WindowScalingFactor"
             except ValueError:
                 pass
+    return None
+
+
+_RE_CFG_SCALE = re.compile(r"scale[^=\n]*=\s*([0-9.]+)", re.IGNORECASE)
 
-    # 6. COSMIC config files
+
+def _try_cosmic_config_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if "cosmic" in de:
         cosmic_cfg = discover_cosmic_configs(home_dir)
         for path in cosmic_cfg.get("files", []):
             try:
                 content = Path(path).read_text(errors="ignore")
-                m = re.search(r"scale[^=\n]*=\s*([0-9.]+)", content, re.IGNORECASE)
+                m = _RE_CFG_SCALE.search(content)
                 if m:
                     return float(m.group(1)), f"COSMIC config ({path})"
             except OSError:
                 pass
+    return None
 
-    # 7. Mutter fractional (GNOME 47+)
+
+_RE_MUTTER_SCALE = re.compile(r"<double ([0-9.]+)>")
+
+
+def _try_mutter_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if command_exists("gdbus"):
         res = run_user_cmd([
             "gdbus", "call", "--session",
@@ -1689,21 +2115,28 @@ def detect_current_scale(
             "--method", "org.gnome.Mutter.DisplayConfig.GetCurrentState",
         ])
         if res["ok"]:
-            m = re.search(r"<double ([0-9.]+)>", res["stdout"])
+            m = _RE_MUTTER_SCALE.search(res["stdout"])
             if m:
                 return float(m.group(1)), "gsettings (Mutter fractional)"
+    return None
+
+
+_RE_XRANDR_TRANSFORM = re.compile(r"Transform:\s+([0-9.]+)\s")
 
-    # 8. xrandr transform (X11 fallback)
+
+def _try_xrandr_transform_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     if command_exists("xrandr") and session_env.get("DISPLAY"):
         res = run_user_cmd(["xrandr", "--verbose"])
         if res["ok"]:
-            m = re.search(r"Transform:\s+([0-9.]+)\s", res["stdout"])
+            m = _RE_XRANDR_TRANSFORM.search(res["stdout"])
             if m:
                 sx = float(m.group(1))
                 if sx != 1.0 and sx > 0:
                     return round(1.0 / sx, 4), "xrandr transform matrix"
+    return None
+
 
-    # 9. HiDPI env vars
+def _try_env_scale(session_env: dict, de: str, run_user_cmd, home_dir: str) -> Optional[tuple]:
     for var in ("GDK_SCALE", "QT_SCALE_FACTOR"):
         val = session_env.get(var, "")
         if val:
@@ -1711,35 +2144,92 @@ def detect_current_scale(
                 return float(val), f"env {var}"
             except ValueError:
                 pass
+    return None
+
+
+# Generic probe order; desktop-specific detectors from _SCALE_DETECTORS_BY_DESKTOP run first.
+_SCALE_DETECTORS = (
+    _try_wlr_randr_scale,
+    _try_kscreen_scale,
+    _try_gsettings_scale,
+    _try_kreadconfig5_scale,
+    _try_xfconf_scale,
+    _try_cosmic_config_scale,
+    _try_mutter_scale,
+    _try_xrandr_transform_scale,
+    _try_env_scale,
+)
+
+_SCALE_DETECTORS_BY_DESKTOP = (
+    (("kde", "plasma"), (_try_kscreen_scale, _try_kreadconfig5_scale)),
+    (("gnome", "ubuntu", "cinnamon"), (_try_gsettings_scale, _try_mutter_scale)),
+    (("cosmic",), (_try_wlr_randr_scale, _try_cosmic_config_scale)),
+    (("sway", "hypr", "wlroots", "wayfire", "river"), (_try_wlr_randr_scale,)),
+    (("xfce",), (_try_xfconf_scale,)),
+)
+
+
+def detect_current_scale(
+    session_env: dict,
+    desktop: str,
+    run_user_cmd,
+    home_dir: str,
+) -> tuple:
+    """
+    Try every available method to detect the current desktop scale.
+    Detectors matching the desktop name run first, then the generic order:
+      1. wlr-randr (Sway / Hyprland / wlroots / COSMIC)
+      2. kscreen-doctor (KDE Plasma 6 Wayland)
+      3. gsettings integer scale (GNOME)
+      4. kreadconfig5 (KDE Plasma 5)
+      5. xfconf-query (Xfce)
+      6. COSMIC config files
+      7. Mutter gdbus (GNOME fractional)
+      8. xrandr transform matrix (X11)
+      9. HiDPI env vars (GDK_SCALE, QT_SCALE_FACTOR)
+     10. Fallback 1x
+    Returns (factor: float, source: str).
+    """
+    de = desktop.lower()
+    preferred = next((dets for keys, dets in _SCALE_DETECTORS_BY_DESKTOP if any(k in de for k in keys)), ())
+    for detector in dict.fromkeys(preferred + _SCALE_DETECTORS):
+        found = detector(session_env, de, run_user_cmd, home_dir)
+        if found is not None:
+            return found
 
     return 1.0, "fallback (assumed 1x)"
 
 
+_RE_KSCREEN_OUTPUT = re.compile(r"^[ \t]*Output:[ \t]*(\d+)\s", re.MULTILINE)
+
+
 def set_scale_programmatic(desktop: str, factor: float, run_user_cmd) -> tuple:
     """
     Attempt to apply the given scale programmatically.
     Returns (ok: bool, method: str).
     """
+    try:
+        return _apply_scale_programmatic(factor, run_user_cmd)
+    finally:
+        # Any attempt may have changed output scales; later reads must re-run wlr-randr.
+        _WLR_RANDR_CACHE.clear()
+
+
+def _apply_scale_programmatic(factor: float, run_user_cmd) -> tuple:
     # wlr-randr (Sway, Hyprland, COSMIC, wlroots)
-    if command_exists("wlr-randr"):
-        res = run_user_cmd(["wlr-randr"])
-        if res["ok"]:
-            m = re.match(r"^(\S+)\s+", res["stdout"])
-            if m:
-                output = m.group(1)
-                res2 = run_user_cmd(["wlr-randr", "--output", output, "--scale", str(factor)])
-                if res2["ok"]:
-                    return True, f"wlr-randr --output {output} --scale {factor}"
+    wlr_outputs = get_wlr_outputs(run_user_cmd)
+    if wlr_outputs:
+        output = wlr_outputs[0]["name"]
+        res2 = run_user_cmd(["wlr-randr", "--output", output, "--scale", str(factor)])
+        if res2["ok"]:
+            return True, f"wlr-randr --output {output} --scale {factor}"
 
     # kscreen-doctor (KDE)
     if command_exists("kscreen-doctor"):
         out = run_user_cmd(["kscreen-doctor", "--outputs"], timeout=25)
         output_ids = []
         if out.get("ok"):
-            for line in strip_ansi(out.get("stdout", "")).splitlines():
-                m = re.match(r"\s*Output:\s*(\d+)\s+", line)
-                if m:
-                    output_ids.append(m.group(1))
+            output_ids = _RE_KSCREEN_OUTPUT.findall(strip_ansi(out.get("stdout", "")))
         if not output_ids:
             output_ids = ["1"]
         for output_id in output_ids:
@@ -1833,10 +2323,12 @@ def analyze_xwayland(run_user_cmd, session_env: dict) -> dict:
     if command_exists("xlsclients"):
         res = run_user_cmd(["xlsclients"])
         if res.get("ok"):
-            clients = [ln for ln in res["stdout"].splitlines() if ln.strip()]
-            data["xwayland_clients"] = len(clients)
-            data["xwayland_clients_list"] = "\n".join(clients[:50])
-            if len(clients) > 50:
+            clients = (ln for ln in res["stdout"].splitlines() if ln.strip())
+            head = list(itertools.islice(clients, 50))
+            rest = sum(1 for _ in clients)
+            data["xwayland_clients"] = len(head) + rest
+            data["xwayland_clients_list"] = "\n".join(head)
+            if rest:
                 data["notes"] = "xwayland client list truncated to 50 entries"
     return data
 
@@ -1896,69 +2388,84 @@ def detect_fps_strategy(session_type: str, desktop: str, compositor: str) -> dic
     }
 
 
+def _run_probes_concurrently(jobs: dict, max_workers: int = 4) -> dict:
+    """Run independent probe callables in a small thread pool; results keep the jobs' key order."""
+    if not jobs:
+        return {}
+    # Imported here: concurrent.futures pulls in logging, which the early-exit paths never need.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as ex:
+        futures = {name: ex.submit(job) for name, job in jobs.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+def _head_lines(text: str, n: int) -> str:
+    """First n lines of text, sliced once instead of splitting the whole string."""
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end < 0:
+            return text
+    return text[:end]
+
+
+def _probe_excerpt(res: dict, limit: int) -> dict:
+    return {"ok": res.get("ok", False), "stdout_excerpt": res.get("stdout", "")[:limit]}
+
+
 def gather_fps_strategy_findings(strategy: dict, run_user_cmd, session_type: str) -> dict:
     """Collect environment findings for selected FPS strategy."""
     findings = {
         "strategy": strategy,
-        "tool_availability": {},
+        "tool_availability": {tool: tool_available(tool) for tool in strategy.get("tools", ())},
         "probes": {},
         "notes": [],
     }
 
-    for tool in strategy.get("tools", []):
-        findings["tool_availability"][tool] = tool_available(tool)
-
+    sid = strategy.get("id", "")
+    jobs: dict = {}
     # Shared refresh probe
     if command_exists("xrandr"):
-        xr = run_user_cmd(["xrandr", "--query"])
-        findings["probes"]["xrandr"] = {
-            "ok": xr.get("ok", False),
-            "active_refresh_hz": _get_active_refresh_hz(run_user_cmd),
-        }
-
-    sid = strategy.get("id", "")
+        jobs["xrandr"] = lambda: run_user_cmd(["xrandr", "--query"], extra_env=_C_LOCALE_ENV)
     if sid in ("cosmic-wayland", "wlroots-wayland") and command_exists("wlr-randr"):
-        rr = run_user_cmd(["wlr-randr"])
-        findings["probes"]["wlr-randr"] = {
-            "ok": rr.get("ok", False),
-            "stdout_excerpt": "\n".join(rr.get("stdout", "").splitlines()[:20]),
-        }
-
+        jobs["wlr-randr"] = lambda: _run_wlr_randr(run_user_cmd)
     if sid == "hyprland-wayland" and command_exists("hyprctl"):
-        hy = run_user_cmd(["hyprctl", "monitors", "-j"])
-        findings["probes"]["hyprctl-monitors"] = {
-            "ok": hy.get("ok", False),
-            "stdout_excerpt": hy.get("stdout", "")[:2000],
-        }
-
+        jobs["hyprctl-monitors"] = lambda: run_user_cmd(["hyprctl", "monitors", "-j"])
     if sid == "gnome-wayland" and command_exists("gdbus"):
-        mt = run_user_cmd([
+        jobs["mutter-displayconfig"] = lambda: run_user_cmd([
             "gdbus", "call", "--session",
             "--dest", "org.gnome.Mutter.DisplayConfig",
             "--object-path", "/org/gnome/Mutter/DisplayConfig",
             "--method", "org.gnome.Mutter.DisplayConfig.GetCurrentState",
         ], timeout=30)
-        findings["probes"]["mutter-displayconfig"] = {
-            "ok": mt.get("ok", False),
-            "stdout_excerpt": mt.get("stdout", "")[:2000],
-        }
-
     if sid == "kde-wayland" and command_exists("kscreen-doctor"):
-        kd = run_user_cmd(["kscreen-doctor", "--outputs"], timeout=30)
-        findings["probes"]["kscreen-doctor"] = {
-            "ok": kd.get("ok", False),
-            "stdout_excerpt": kd.get("stdout", "")[:2000],
-        }
+        jobs["kscreen-doctor"] = lambda: run_user_cmd(["kscreen-doctor", "--outputs"], timeout=30)
+    qdbus_cmd = _qdbus_cmd() if sid == "kde-wayland" else None
+    if qdbus_cmd:
+        jobs["kwin-support-info"] = lambda: run_user_cmd(
+            [qdbus_cmd, "org.kde.KWin", "/KWin", "supportInformation"], timeout=30,
+        )
 
-    if sid == "kde-wayland" and tool_available("qdbus"):
-        qdbus_cmd = resolve_command_variant("qdbus")
-        qd = run_user_cmd([qdbus_cmd, "org.kde.KWin", "/KWin", "supportInformation"], timeout=30)
-        findings["probes"]["kwin-support-info"] = {
-            "ok": qd.get("ok", False),
-            "stdout_excerpt": qd.get("stdout", "")[:2000],
+    results = _run_probes_concurrently(jobs)
+    probes = findings["probes"]
+    if "xrandr" in results:
+        xr = results["xrandr"]
+        probes["xrandr"] = {
+            "ok": xr.get("ok", False),
+            "active_refresh_hz": _parse_active_refresh_hz(xr["stdout"]) if xr.get("ok") else 0.0,
         }
+    if "wlr-randr" in results:
+        rr = results["wlr-randr"]
+        probes["wlr-randr"] = {
+            "ok": rr.get("ok", False),
+            "stdout_excerpt": _head_lines(rr.get("stdout", ""), 20),
+        }
+    for name in ("hyprctl-monitors", "mutter-displayconfig", "kscreen-doctor", "kwin-support-info"):
+        if name in results:
+            probes[name] = _probe_excerpt(results[name], 2000)
 
-    if not any(v for v in findings["tool_availability"].values()):
+    if not any(findings["tool_availability"].values()):
         findings["notes"].append("No strategy tools available; relying on benchmark-only fallback")
     if "wayland" in (session_type or "").lower() and not command_exists("wayland-info"):
         findings["notes"].append("wayland-info missing; environment introspection is limited")
@@ -1975,95 +2482,48 @@ def gather_compositor_diagnostics(strategy: dict, wm_comp: dict, run_user_cmd, s
         "notes": [],
     }
 
+    # name -> (command, timeout, excerpt length)
+    probe_specs: dict = {}
     compositor_name = (wm_comp.get("compositor") or "").strip()
     if compositor_name:
-        ps_probe = run_user_cmd(["ps", "-C", compositor_name, "-o", "pid=,%cpu=,rss=,etimes="], timeout=20)
-        diagnostics["probes"]["compositor-ps"] = {
-            "ok": ps_probe.get("ok", False),
-            "stdout_excerpt": ps_probe.get("stdout", "")[:1000],
-        }
+        probe_specs["compositor-ps"] = (["ps", "-C", compositor_name, "-o", "pid=,%cpu=,rss=,etimes="], 20, 1000)
     else:
         diagnostics["notes"].append("Compositor process name unknown; skipping process-level probe")
 
     sid = strategy.get("id", "")
     if sid == "gnome-wayland" and command_exists("gsettings"):
-        gs = run_user_cmd(["gsettings", "get", "org.gnome.mutter", "experimental-features"], timeout=20)
-        diagnostics["probes"]["gnome-mutter-experimental-features"] = {
-            "ok": gs.get("ok", False),
-            "stdout_excerpt": gs.get("stdout", "")[:1000],
-        }
-
+        probe_specs["gnome-mutter-experimental-features"] = (
+            ["gsettings", "get", "org.gnome.mutter", "experimental-features"], 20, 1000,
+        )
     if sid == "hyprland-wayland" and command_exists("hyprctl"):
-        hp = run_user_cmd(["hyprctl", "-j", "monitors"], timeout=20)
-        diagnostics["probes"]["hyprctl-monitors-json"] = {
-            "ok": hp.get("ok", False),
-            "stdout_excerpt": hp.get("stdout", "")[:2000],
-        }
-
+        probe_specs["hyprctl-monitors-json"] = (["hyprctl", "-j", "monitors"], 20, 2000)
     if sid in ("cosmic-wayland", "wlroots-wayland") and command_exists("wayland-info"):
-        wi = run_user_cmd(["wayland-info"], timeout=25)
-        diagnostics["probes"]["wayland-info"] = {
-            "ok": wi.get("ok", False),
-            "stdout_excerpt": wi.get("stdout", "")[:2000],
-        }
-
+        probe_specs["wayland-info"] = (["wayland-info"], 25, 2000)
     if sid == "x11-generic" and session_env.get("DISPLAY") and command_exists("xprop"):
-        xp = run_user_cmd(["xprop", "-root", "_NET_SUPPORTING_WM_CHECK"], timeout=20)
-        diagnostics["probes"]["x11-wm-check"] = {
-            "ok": xp.get("ok", False),
-            "stdout_excerpt": xp.get("stdout", "")[:1000],
-        }
+        probe_specs["x11-wm-check"] = (["xprop", "-root", "_NET_SUPPORTING_WM_CHECK"], 20, 1000)
+
+    results = _run_probes_concurrently({
+        name: functools.partial(run_user_cmd, cmd, timeout=timeout)
+        for name, (cmd, timeout, _) in probe_specs.items()
+    })
+    for name, (_, _, limit) in probe_specs.items():
+        diagnostics["probes"][name] = _probe_excerpt(results[name], limit)
 
     return diagnostics
 
 
+_RE_XRANDR_ACTIVE_MODE = re.compile(r"^\s+(\d+x\d+)\s+.*?([0-9.]+)\*")
+
+
 def gather_output_scaling_topology(run_user_cmd, session_type: str) -> dict:
     """Collect display/output scale + refresh details from session-specific tools."""
     data: dict = {"backend": "unknown", "outputs": [], "notes": []}
 
-    if "wayland" in session_type.lower() and command_exists("wlr-randr"):
-        res = run_user_cmd(["wlr-randr"])
-        if res.get("ok"):
+    if "wayland" in session_type.lower():
+        wlr_outputs = get_wlr_outputs(run_user_cmd)
+        if wlr_outputs is not None:
             data["backend"] = "wlr-randr"
-            current: Optional[dict] = None
-            for raw in res.get("stdout", "").splitlines():
-                line = raw.rstrip()
-                if not line:
-                    continue
-                if not line.startswith(" ") and not line.startswith("\t"):
-                    if current:
-                        data["outputs"].append(current)
-                    output_name = line.split()[0]
-                    current = {
-                        "name": output_name,
-                        "scale": None,
-                        "refresh_hz": None,
-                        "mode": "",
-                        "focused": "(focused)" in line,
-                    }
-                    continue
-                if current is None:
-                    continue
-
-                m_mode = re.search(r"(\d+x\d+)\s+px,\s*([0-9.]+)\s*Hz,\s*current", line)
-                if m_mode:
-                    current["mode"] = m_mode.group(1)
-                    try:
-                        current["refresh_hz"] = float(m_mode.group(2))
-                    except ValueError:
-                        pass
-
-                m_scale_a = re.search(r"[Ss]cale:\s*([0-9.]+)", line)
-                m_scale_b = re.search(r"scale\s+([0-9.]+)", line)
-                scale_match = m_scale_a or m_scale_b
-                if scale_match:
-                    try:
-                        current["scale"] = float(scale_match.group(1))
-                    except ValueError:
-                        pass
-
-            if current:
-                data["outputs"].append(current)
+            data["outputs"] = wlr_outputs
             if not data["outputs"]:
                 data["notes"].append("wlr-randr available, but no outputs parsed")
             return data
@@ -2089,7 +2549,7 @@ def gather_output_scaling_topology(run_user_cmd, session_type: str) -> dict:
                     continue
                 if current is None:
                     continue
-                m_mode = re.search(r"^\s+(\d+x\d+)\s+.*?([0-9.]+)\*", line)
+                m_mode = _RE_XRANDR_ACTIVE_MODE.search(line)
                 if m_mode:
                     current["mode"] = m_mode.group(1)
                     try:
@@ -2104,6 +2564,29 @@ def gather_output_scaling_topology(run_user_cmd, session_type: str) -> dict:
     return data
 
 
+_FRAC_EPS = 1e-6
+
+# Loaded kernel module -> GPU path label, in classification priority order.
+_DRIVER_TO_GPU_PATH: dict[str, str] = {
+    "nvidia": "nvidia-proprietary",
+    "nouveau": "nvidia-nouveau",
+    "amdgpu": "amd-mesa",
+    "radeon": "amd-mesa",
+    "i915": "intel-mesa",
+    "xe": "intel-mesa",
+}
+
+_RE_SW_RENDERER = re.compile(r"llvmpipe|softpipe|software rasterizer")
+
+# (keyword matched against compositor or desktop, Wayland gaming compatibility hint)
+_COMPOSITOR_GAMING_HINTS: tuple[tuple[str, str], ...] = (
+    ("hypr", "Hyprland Wayland sessions may need compositor-specific overlay/capture setup (MangoHud, OBS, gamescope)."),
+    ("sway", "Sway sessions can require explicit XWayland/window rules for legacy game launchers and overlays."),
+    ("wayfire", "Wayfire plugin configuration may influence frame pacing and fullscreen behavior."),
+    ("cosmic", "COSMIC transition-era builds may vary in gaming overlay/capture maturity across releases."),
+)
+
+
 def analyze_scaling_pipeline(
     session_type: str,
     desktop: str,
@@ -2119,27 +2602,22 @@ def analyze_scaling_pipeline(
     """Classify the render/scaling pipeline and explain expected efficiency."""
     xwayland_clients = xwayland_analysis.get("xwayland_clients")
     xwayland_clients = xwayland_clients if isinstance(xwayland_clients, int) else 0
-    loaded_drivers = set(driver_info.get("loaded", []))
+    loaded_drivers = frozenset(driver_info.get("loaded", []))
     renderer_lc = (renderer or "").lower()
+    is_software = bool(_RE_SW_RENDERER.search(renderer_lc))
     is_wayland = "wayland" in (session_type or "").lower()
 
-    scale_values = [reference_scale]
-    if target_scale is not None:
-        scale_values.append(target_scale)
-    is_fractional = any(abs(s - round(s)) > 1e-6 for s in scale_values)
+    is_fractional = abs(reference_scale - round(reference_scale)) > _FRAC_EPS or (
+        target_scale is not None and abs(target_scale - round(target_scale)) > _FRAC_EPS
+    )
 
-    if "llvmpipe" in renderer_lc or "softpipe" in renderer_lc or "software rasterizer" in renderer_lc:
+    if is_software:
         gpu_path = "software-rendering"
-    elif "nvidia" in loaded_drivers:
-        gpu_path = "nvidia-proprietary"
-    elif "nouveau" in loaded_drivers:
-        gpu_path = "nvidia-nouveau"
-    elif "amdgpu" in loaded_drivers or "radeon" in loaded_drivers:
-        gpu_path = "amd-mesa"
-    elif "i915" in loaded_drivers or "xe" in loaded_drivers:
-        gpu_path = "intel-mesa"
     else:
-        gpu_path = "unknown-gpu-stack"
+        gpu_path = next(
+            (label for drv, label in _DRIVER_TO_GPU_PATH.items() if drv in loaded_drivers),
+            "unknown-gpu-stack",
+        )
 
     if is_wayland:
         if xwayland_clients > 0:
@@ -2163,7 +2641,7 @@ def analyze_scaling_pipeline(
     if gpu_path == "nvidia-nouveau":
         bottlenecks.append("nouveau driver may limit throughput and frame pacing")
         rationale.append("NVIDIA open-source driver can underperform compared to proprietary stack on many cards")
-    if gpu_path == "software-rendering":
+    if is_software:
         bottlenecks.append("software renderer detected")
         rationale.append("CPU rasterization is significantly slower for compositor and app rendering")
     if is_fractional:
@@ -2174,21 +2652,15 @@ def analyze_scaling_pipeline(
 
     gaming_compat_hints = []
     compositor_lc = (compositor or "").lower()
-    desktop_lc = (desktop or "").lower()
-    if is_wayland and ("hypr" in compositor_lc or "hypr" in desktop_lc):
-        gaming_compat_hints.append("Hyprland Wayland sessions may need compositor-specific overlay/capture setup (MangoHud, OBS, gamescope).")
-    if is_wayland and ("sway" in compositor_lc or "sway" in desktop_lc):
-        gaming_compat_hints.append("Sway sessions can require explicit XWayland/window rules for legacy game launchers and overlays.")
-    if is_wayland and ("wayfire" in compositor_lc or "wayfire" in desktop_lc):
-        gaming_compat_hints.append("Wayfire plugin configuration may influence frame pacing and fullscreen behavior.")
-    if is_wayland and ("cosmic" in compositor_lc or "cosmic" in desktop_lc):
-        gaming_compat_hints.append("COSMIC transition-era builds may vary in gaming overlay/capture maturity across releases.")
-    if is_wayland and "kwin" in compositor_lc:
-        gaming_compat_hints.append("KWin Wayland: prefer windowed benchmark mode if fullscreen causes instability.")
+    if is_wayland:
+        comp_desktop_lc = f"{compositor_lc}|{(desktop or '').lower()}"
+        gaming_compat_hints.extend(hint for kw, hint in _COMPOSITOR_GAMING_HINTS if kw in comp_desktop_lc)
+        if "kwin" in compositor_lc:
+            gaming_compat_hints.append("KWin Wayland: prefer windowed benchmark mode if fullscreen causes instability.")
     if render_path == "wayland-mixed-with-xwayland":
         gaming_compat_hints.append("Mixed Wayland/XWayland workloads can increase latency variance for some games.")
 
-    if gpu_path == "software-rendering":
+    if is_software:
         efficiency_expectation = "low"
     elif "nouveau" in gpu_path:
         efficiency_expectation = "low-to-moderate" if is_fractional else "moderate"
@@ -2247,109 +2719,109 @@ def _build_glmark_cmd(tool: str, resolved_mode: str, fps_window_size: str) -> li
     return cmd
 
 
+# Group 1: final glmark2 score; group 2: per-scene FPS from (partial) benchmark output.
+_RE_GLMARK_COMBINED = re.compile(r"glmark2 Score:\s*(\d+)|\bFPS:\s*([0-9]+(?:\.[0-9]+)?)", re.IGNORECASE)
+_RE_GLXGEARS_FPS = re.compile(r"=\s*([\d.]+)\s*FPS", re.IGNORECASE)
+
+
+def _new_glmark_state() -> dict:
+    return {"score": None, "fps_total": 0.0, "fps_count": 0}
+
+
+def _feed_glmark_line(state: dict, line: str) -> None:
+    """Streaming line handler for glmark2 output: first score plus a running scene-FPS sum."""
+    for m in _RE_GLMARK_COMBINED.finditer(line):
+        if m.group(1) is not None:
+            if state["score"] is None:
+                state["score"] = float(m.group(1))
+        else:
+            try:
+                state["fps_total"] += float(m.group(2))
+                state["fps_count"] += 1
+            except ValueError:
+                pass
+
+
+def _glmark_result(state: dict) -> tuple:
+    """Returns (score or None, mean scene FPS or None)."""
+    fps_avg = state["fps_total"] / state["fps_count"] if state["fps_count"] else None
+    return state["score"], fps_avg
+
+
 def _run_glmark2(
     run_user_cmd,
+    glmark_cmds: dict,
     duration_s: int = 3,
     resolved_mode: str = "fullscreen",
-    fps_window_size: str = "1920x1080",
 ) -> tuple:
     """Run glmark2(-wayland). Returns (score_like_value, tool)."""
-    
-    for tool in ("glmark2-wayland", "glmark2"):
-        if not command_exists(tool):
-            continue
+    for tool, glmark_cmd in glmark_cmds.items():
         # glmark2 full suite can take long; parse partial output on timeout.
-        cmd = _build_glmark_cmd(tool, resolved_mode, fps_window_size)
-        res = run_user_cmd(cmd, duration_s + 5)
-        combined = "\n".join([res.get("stdout", ""), res.get("stderr", "")])
+        state = _new_glmark_state()
+        res = run_user_cmd(list(glmark_cmd), duration_s + 5, line_handler=functools.partial(_feed_glmark_line, state))
         if res.get("ok") or res.get("returncode") in (0, 124):
-            for line in combined.splitlines():
-                m = re.search(r"glmark2 Score:\s*(\d+)", line, re.IGNORECASE)
-                if m:
-                    return float(m.group(1)), f"{tool} ({resolved_mode})"
-
+            score, fps_avg = _glmark_result(state)
+            if score is not None:
+                return score, f"{tool} ({resolved_mode})"
             # Fallback: compute scene FPS average from partial benchmark output.
-            fps_vals = []
-            for line in combined.splitlines():
-                m = re.search(r"\bFPS:\s*([0-9]+(?:\.[0-9]+)?)", line, re.IGNORECASE)
-                if m:
-                    try:
-                        fps_vals.append(float(m.group(1)))
-                    except ValueError:
-                        pass
-            if fps_vals:
-                return round(sum(fps_vals) / len(fps_vals), 1), f"{tool} ({resolved_mode}, partial)"
+            if fps_avg is not None:
+                return round(fps_avg, 1), f"{tool} ({resolved_mode}, partial)"
     return 0.0, ""
 
 
 def _run_glmark2_with_hud(
     run_user_cmd,
+    glmark_cmds: dict,
     duration_s: int = 3,
     resolved_mode: str = "fullscreen",
-    fps_window_size: str = "1920x1080",
 ) -> tuple:
     """Run glmark2 via MangoHud wrapper when available."""
     if not command_exists("mangohud"):
         return 0.0, ""
 
-    for tool in ("glmark2-wayland", "glmark2"):
-        if not command_exists(tool):
-            continue
-        glmark_cmd = _build_glmark_cmd(tool, resolved_mode, fps_window_size)
-        res = run_user_cmd(["mangohud"] + glmark_cmd, timeout=duration_s + 5)
-        combined = "\n".join([res.get("stdout", ""), res.get("stderr", "")])
+    for tool, glmark_cmd in glmark_cmds.items():
+        state = _new_glmark_state()
+        res = run_user_cmd(
+            ["mangohud", *glmark_cmd],
+            timeout=duration_s + 5,
+            line_handler=functools.partial(_feed_glmark_line, state),
+        )
         if res.get("ok") or res.get("returncode") in (0, 124):
-            for line in combined.splitlines():
-                m = re.search(r"glmark2 Score:\s*(\d+)", line, re.IGNORECASE)
-                if m:
-                    return float(m.group(1)), f"mangohud+{tool} ({resolved_mode})"
-
-            fps_vals = []
-            for line in combined.splitlines():
-                m = re.search(r"\bFPS:\s*([0-9]+(?:\.[0-9]+)?)", line, re.IGNORECASE)
-                if m:
-                    try:
-                        fps_vals.append(float(m.group(1)))
-                    except ValueError:
-                        pass
-            if fps_vals:
-                return round(sum(fps_vals) / len(fps_vals), 1), f"mangohud+{tool} ({resolved_mode}, partial)"
+            score, fps_avg = _glmark_result(state)
+            if score is not None:
+                return score, f"mangohud+{tool} ({resolved_mode})"
+            # Fallback: compute scene FPS average from partial benchmark output.
+            if fps_avg is not None:
+                return round(fps_avg, 1), f"mangohud+{tool} ({resolved_mode}, partial)"
     return 0.0, ""
 
 
 def _run_glmark2_with_gallium_hud(
     run_user_cmd,
+    glmark_cmds: dict,
     duration_s: int = 3,
     resolved_mode: str = "fullscreen",
-    fps_window_size: str = "1920x1080",
 ) -> tuple:
     """Run glmark2 with Mesa GALLIUM_HUD enabled as fallback when MangoHud is unavailable."""
-    for tool in ("glmark2-wayland", "glmark2"):
-        if not command_exists(tool):
-            continue
+    for tool, glmark_cmd in glmark_cmds.items():
         env = {
             "GALLIUM_HUD": "simple,fps",
             "GALLIUM_HUD_PERIOD": "0.5",
         }
-        cmd = _build_glmark_cmd(tool, resolved_mode, fps_window_size)
-        res = run_user_cmd(cmd, timeout=duration_s + 5, extra_env=env)
-        combined = "\n".join([res.get("stdout", ""), res.get("stderr", "")])
+        state = _new_glmark_state()
+        res = run_user_cmd(
+            list(glmark_cmd),
+            timeout=duration_s + 5,
+            extra_env=env,
+            line_handler=functools.partial(_feed_glmark_line, state),
+        )
         if res.get("ok") or res.get("returncode") in (0, 124):
-            for line in combined.splitlines():
-                m = re.search(r"glmark2 Score:\s*(\d+)", line, re.IGNORECASE)
-                if m:
-                    return float(m.group(1)), f"gallium_hud+{tool} ({resolved_mode})"
-
-            fps_vals = []
-            for line in combined.splitlines():
-                m = re.search(r"\bFPS:\s*([0-9]+(?:\.[0-9]+)?)", line, re.IGNORECASE)
-                if m:
-                    try:
-                        fps_vals.append(float(m.group(1)))
-                    except ValueError:
-                        pass
-            if fps_vals:
-                return round(sum(fps_vals) / len(fps_vals), 1), f"gallium_hud+{tool} ({resolved_mode}, partial)"
+            score, fps_avg = _glmark_result(state)
+            if score is not None:
+                return score, f"gallium_hud+{tool} ({resolved_mode})"
+            # Fallback: compute scene FPS average from partial benchmark output.
+            if fps_avg is not None:
+                return round(fps_avg, 1), f"gallium_hud+{tool} ({resolved_mode}, partial)"
     return 0.0, ""
 
 
@@ -2361,18 +2833,29 @@ def _run_glxgears(run_user_cmd, duration_s: int = 5) -> float:
         # Use SIGINT and a slightly longer runtime so glxgears has a chance to emit at least one FPS sample.
         timeout_s = max(6, int(duration_s) + 1)
         res = run_user_cmd(["timeout", "-s", "INT", f"{timeout_s}s", "glxgears", "-info"], timeout=timeout_s + 5)
-        out = "\n".join([res.get("stdout", ""), res.get("stderr", "")])
     except Exception:  # noqa: BLE001
         return 0.0
-    fps_vals = []
-    for line in out.splitlines():
-        m = re.search(r"=\s*([\d.]+)\s*FPS", line, re.IGNORECASE)
+    fps_total = 0.0
+    fps_count = 0
+    for line in itertools.chain(res.get("stdout", "").splitlines(), res.get("stderr", "").splitlines()):
+        if "FPS" not in line and "fps" not in line:
+            continue
+        # Fast path for the standard "300 frames in 5.0 seconds = 60.000 FPS" line.
+        if line.rstrip().endswith(" FPS") and "=" in line:
+            try:
+                fps_total += float(line.rsplit("=", 1)[1].split()[0])
+                fps_count += 1
+                continue
+            except (ValueError, IndexError):
+                pass
+        m = _RE_GLXGEARS_FPS.search(line)
         if m:
             try:
-                fps_vals.append(float(m.group(1)))
+                fps_total += float(m.group(1))
+                fps_count += 1
             except ValueError:
                 pass
-    return round(sum(fps_vals) / len(fps_vals), 1) if fps_vals else 0.0
+    return round(fps_total / fps_count, 1) if fps_count else 0.0
 
 
 def _is_software_renderer(renderer_text: str) -> bool:
@@ -2380,6 +2863,10 @@ def _is_software_renderer(renderer_text: str) -> bool:
     return any(token in text for token in ("llvmpipe", "softpipe", "software rasterizer"))
 
 
+# glmark2 runners in preference order; the first positive result wins.
+_GLMARK_ATTEMPTS = (_run_glmark2_with_hud, _run_glmark2_with_gallium_hud, _run_glmark2)
+
+
 def measure_fps(
     run_user_cmd,
     allow_glxgears_fallback: bool = False,
@@ -2407,32 +2894,25 @@ def measure_fps(
                 return fps, "glxgears"
         return 0.0, "unavailable"
 
-    fps, tool = _run_glmark2_with_hud(
-        run_user_cmd,
-        duration_s=benchmark_seconds,
-        resolved_mode=resolved_mode,
-        fps_window_size=fps_window_size,
-    )
-    if fps > 0:
-        return fps, tool
-
-    fps, tool = _run_glmark2_with_gallium_hud(
-        run_user_cmd,
-        duration_s=benchmark_seconds,
-        resolved_mode=resolved_mode,
-        fps_window_size=fps_window_size,
-    )
-    if fps > 0:
-        return fps, tool
-
-    fps, tool = _run_glmark2(
-        run_user_cmd,
-        duration_s=benchmark_seconds,
-        resolved_mode=resolved_mode,
-        fps_window_size=fps_window_size,
-    )
-    if fps > 0:
-        return fps, tool
+    # Prepared once for all attempts: available tool -> glmark2 command for the resolved mode.
+    glmark_cmds = {
+        tool: tuple(_build_glmark_cmd(tool, resolved_mode, fps_window_size))
+        for tool in ("glmark2-wayland", "glmark2")
+        if command_exists(tool)
+    }
+    # Attempts stay sequential: concurrent benchmarks would share the GPU and skew each other's FPS.
+    if glmark_cmds:
+        for attempt in _GLMARK_ATTEMPTS:
+            fps, tool = attempt(
+                run_user_cmd,
+                glmark_cmds,
+                duration_s=benchmark_seconds,
+                resolved_mode=resolved_mode,
+            )
+            if fps > 0:
+                return fps, tool
+    else:
+        trace("measure_fps: no glmark2 binary available; skipping glmark attempts")
     if allow_glxgears_fallback:
         fps = _run_glxgears(run_user_cmd, duration_s=max(3, benchmark_seconds))
         if fps > 0:
@@ -2452,10 +2932,23 @@ def _map_start_scale_to_case(start_scale: float, required_cases: dict) -> str:
     return nearest_name
 
 
-def _ensure_scale(session_env: dict, desktop: str, target_scale: float, run_user_cmd, interactive: bool) -> tuple:
-    """Try automatic scale switching, fallback to manual confirmation."""
+def _ensure_scale(
+    session_env: dict,
+    desktop: str,
+    target_scale: float,
+    run_user_cmd,
+    interactive: bool,
+    known_scale: Optional[float] = None,
+) -> tuple:
+    """Try automatic scale switching, fallback to manual confirmation.
+
+    known_scale skips the initial detection when the caller already has a current reading.
+    """
     home_dir = os.path.expanduser("~")
-    current_scale, _ = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
+    if known_scale is None:
+        current_scale, _ = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
+    else:
+        current_scale = known_scale
     if abs(current_scale - target_scale) < 1e-6:
         return True, "already-at-target"
 
@@ -2463,6 +2956,7 @@ def _ensure_scale(session_env: dict, desktop: str, target_scale: float, run_user
     if applied:
         for _ in range(4):
             time.sleep(1)
+            _WLR_RANDR_CACHE.clear()  # compositor may apply the new scale asynchronously
             confirmed_scale, _ = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
             if abs(confirmed_scale - target_scale) < 0.03:
                 return True, method
@@ -2471,6 +2965,7 @@ def _ensure_scale(session_env: dict, desktop: str, target_scale: float, run_user
     if interactive:
         input(f"    Please set scale to {target_scale}x manually, then press Enter...")
         time.sleep(2)
+        _WLR_RANDR_CACHE.clear()
         confirmed_scale, _ = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
         return abs(confirmed_scale - target_scale) < 0.02, "manual"
 
@@ -2578,6 +3073,9 @@ def _ask_nvidia_remediation_mode() -> str:
     return "skip"
 
 
+_RE_DOTTED_VERSION = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+
+
 def _infer_nvidia_runfile_candidate(diag: dict) -> dict:
     """Infer NVIDIA .run download candidate from installed proprietary package versions."""
     packages = list(diag.get("installed_proprietary_packages") or [])
@@ -2595,14 +3093,14 @@ def _infer_nvidia_runfile_candidate(diag: dict) -> dict:
         ]
         for key in fallback_keys:
             entry = checks.get(key) or {}
-            excerpt = str(entry.get("stdout_excerpt", "") or "")
+            excerpt = str(entry.get("stdout_excerpt") or "")
             if excerpt:
                 packages.append(excerpt)
 
     version_candidates: list[tuple[int, int, int]] = []
     for pkg in packages:
         text = str(pkg or "")
-        match = re.search(r"(\d+)\.(\d+)\.(\d+)", text)
+        match = _RE_DOTTED_VERSION.search(text)
         if not match:
             continue
         try:
@@ -2629,21 +3127,24 @@ def _infer_nvidia_runfile_candidate(diag: dict) -> dict:
     }
 
 
+_RE_NVIDIA_TOKENS = re.compile(r"nvidia|geforce|quadro|tesla|10de:")
+
+
 def _detect_nvidia_context(gpu_lspci: str, renderer: str, gpu_inventory: list[dict]) -> bool:
     text = f"{gpu_lspci} {renderer}".lower()
-    if any(token in text for token in ("nvidia", "geforce", "quadro", "tesla", "10de:")):
+    if _RE_NVIDIA_TOKENS.search(text):
         return True
-    for gpu in gpu_inventory or []:
-        model = (gpu or {}).get("model", "").lower()
-        if any(token in model for token in ("nvidia", "geforce", "quadro", "tesla", "10de:")):
-            return True
-    return False
+    models = "\n".join((gpu or {}).get("model", "") for gpu in gpu_inventory or []).lower()
+    return bool(_RE_NVIDIA_TOKENS.search(models))
+
+
+_RE_OPEN_WORD = re.compile(r"\bopen\b")
 
 
 def _package_looks_open_nvidia(package_name: str) -> bool:
     pkg = (package_name or "").lower()
     return bool(
-        re.search(r"\bopen\b", pkg)
+        _RE_OPEN_WORD.search(pkg)
         or "nvidia-open" in pkg
         or "-open" in pkg
     )
@@ -2659,6 +3160,11 @@ def _extract_nvidia_gpu_model(gpu_lspci: str, gpu_inventory: list[dict]) -> str:
     return ""
 
 
+# Chip codenames: Fermi/Kepler/Maxwell/Pascal vs Turing and newer.
+_RE_PRE_TURING_CHIP = re.compile(r"\b(gf\d{3}|gk\d{3}|gm\d{3}|gp\d{3})\b")
+_RE_TURING_PLUS_CHIP = re.compile(r"\b(tu\d{3}|ga\d{3}|ad\d{3}|gh\d{3})\b")
+
+
 def _infer_open_module_support_from_gpu_model(gpu_model: str) -> dict:
     """Best-effort compatibility hint for nvidia-open/GSP vs proprietary branch."""
     model = (gpu_model or "").lower()
@@ -2669,7 +3175,7 @@ def _infer_open_module_support_from_gpu_model(gpu_model: str) -> dict:
         }
 
     # Pre-Turing families (Kepler/Maxwell/Pascal) generally require proprietary branch.
-    if re.search(r"\b(gf\d{3}|gk\d{3}|gm\d{3}|gp\d{3})\b", model):
+    if _RE_PRE_TURING_CHIP.search(model):
         return {
             "likely_supported": False,
             "reason": "legacy-nvidia-generation-detected (pre-turing; nvidia-open/GSP unlikely; nouveau may be valid)",
@@ -2681,7 +3187,7 @@ def _infer_open_module_support_from_gpu_model(gpu_model: str) -> dict:
         }
 
     # Newer generations are more likely compatible with open/GSP path.
-    if re.search(r"\b(tu\d{3}|ga\d{3}|ad\d{3}|gh\d{3})\b", model):
+    if _RE_TURING_PLUS_CHIP.search(model):
         return {
             "likely_supported": True,
             "reason": "modern-nvidia-generation-detected (open path may be supported)",
@@ -2698,6 +3204,15 @@ def _infer_open_module_support_from_gpu_model(gpu_model: str) -> dict:
     }
 
 
+# Both phrases of a pair must appear somewhere in the (already --grep filtered) kernel log.
+_RE_OPEN_UNSUPPORTED_GPU = re.compile(
+    r"\A(?=.*?not supported by open)(?=.*?does not include the required gpu)", re.IGNORECASE | re.DOTALL,
+)
+_RE_GSP_PROBE_FAILED = re.compile(
+    r"\A(?=.*?system processor \(gsp\))(?=.*?probe with driver nvidia failed)", re.IGNORECASE | re.DOTALL,
+)
+
+
 def _detect_open_gsp_mismatch(run_user_cmd) -> dict:
     result = {
         "detected": False,
@@ -2711,18 +3226,15 @@ def _detect_open_gsp_mismatch(run_user_cmd) -> dict:
 
     res = run_user_cmd(
         [
-            "journalctl", "-k", "-b", "--no-pager", "-n", "4000",
+            "journalctl", "-k", "-b", "--no-pager", "-n", "800",
             "--grep", "NVRM|nvidia|GSP|nouveau",
         ],
         timeout=40,
+        extra_env=_C_LOCALE_ENV,
     )
     result["check_ok"] = bool(res.get("ok", False))
-    out = (res.get("stdout", "") or "")
-    text = out.lower()
-    mismatch = (
-        ("not supported by open" in text and "does not include the required gpu" in text)
-        or ("system processor (gsp)" in text and "probe with driver nvidia failed" in text)
-    )
+    out = (res.get("stdout") or "")
+    mismatch = bool(_RE_OPEN_UNSUPPORTED_GPU.match(out) or _RE_GSP_PROBE_FAILED.match(out))
     result["detected"] = bool(mismatch)
     if mismatch:
         result["reason"] = "nvidia-open-gsp-mismatch"
@@ -2747,9 +3259,10 @@ def _detect_nouveau_probe_failure(run_user_cmd) -> dict:
             "--grep", "nouveau|firmware|NVRM|nvidia",
         ],
         timeout=40,
+        extra_env=_C_LOCALE_ENV,
     )
     result["check_ok"] = bool(res.get("ok", False))
-    out = (res.get("stdout", "") or "")
+    out = (res.get("stdout") or "")
     text = out.lower()
 
     probe_failed = "probe with driver nouveau failed" in text
@@ -2772,15 +3285,45 @@ def _detect_nouveau_probe_failure(run_user_cmd) -> dict:
     return result
 
 
+_RE_OPEN_NVIDIA_PKGS = re.compile(
+    r"\bnvidia-open\b"
+    r"|nvidia-driver-\d+-open"
+    r"|akmod-nvidia-open"
+    r"|kmod-nvidia-open"
+    r"|open-dkms"
+    r"|xorg-x11-drv-nvidia-open"
+)
+_RE_PROPRIETARY_NVIDIA_PKGS = re.compile(
+    r"\bakmod-nvidia\b"
+    r"|\bxorg-x11-drv-nvidia\b"
+    r"|^nvidia-driver-\d+$"
+    r"|\bnvidia-utils\b"
+    r"|\bnvidia-driver-g0\d\b"
+    r"|\bnvidia\b"
+)
+
+
 def _collect_installed_nvidia_packages(base_distro: str, run_user_cmd) -> dict:
-    packages: list[str] = []
+    """Installed NVIDIA packages split into open/proprietary families (memoized until packages change)."""
+    cached = _scan_installed_nvidia_packages(base_distro, run_user_cmd)
+    return {
+        "all": list(cached["all"]),
+        "open": list(cached["open"]),
+        "proprietary": list(cached["proprietary"]),
+        "checks": dict(cached["checks"]),
+    }
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_installed_nvidia_packages(base_distro: str, run_user_cmd) -> dict:
+    packages: set[str] = set()
     checks: dict = {}
 
     if base_distro in ("ubuntu", "debian") and command_exists("dpkg"):
         res = run_user_cmd(["dpkg", "-l"], timeout=60)
-        checks["dpkg_l"] = {"ok": bool(res.get("ok", False)), "stderr": (res.get("stderr", "") or "")[:500]}
+        checks["dpkg_l"] = {"ok": bool(res.get("ok", False)), "stderr": (res.get("stderr") or "")[:500]}
         if res.get("ok"):
-            for line in (res.get("stdout", "") or "").splitlines():
+            for line in (res.get("stdout") or "").splitlines():
                 if not line.startswith("ii"):
                     continue
                 parts = line.split()
@@ -2788,57 +3331,53 @@ def _collect_installed_nvidia_packages(base_distro: str, run_user_cmd) -> dict:
                     continue
                 pkg = parts[1]
                 if "nvidia" in pkg:
-                    packages.append(pkg)
+                    packages.add(pkg)
     elif base_distro in ("fedora", "suse") and command_exists("rpm"):
         res = run_user_cmd(["rpm", "-qa"], timeout=60)
-        checks["rpm_qa"] = {"ok": bool(res.get("ok", False)), "stderr": (res.get("stderr", "") or "")[:500]}
+        checks["rpm_qa"] = {"ok": bool(res.get("ok", False)), "stderr": (res.get("stderr") or "")[:500]}
         if res.get("ok"):
-            for pkg in (res.get("stdout", "") or "").splitlines():
+            for pkg in (res.get("stdout") or "").splitlines():
                 if "nvidia" in pkg.lower():
-                    packages.append(pkg.strip())
+                    packages.add(pkg.strip())
     elif base_distro == "arch" and command_exists("pacman"):
         res = run_user_cmd(["pacman", "-Q"], timeout=60)
-        checks["pacman_q"] = {"ok": bool(res.get("ok", False)), "stderr": (res.get("stderr", "") or "")[:500]}
+        checks["pacman_q"] = {"ok": bool(res.get("ok", False)), "stderr": (res.get("stderr") or "")[:500]}
         if res.get("ok"):
-            for line in (res.get("stdout", "") or "").splitlines():
+            for line in (res.get("stdout") or "").splitlines():
                 pkg = line.split()[0] if line.split() else ""
                 if "nvidia" in pkg.lower():
-                    packages.append(pkg)
-
-    open_patterns = [
-        r"\bnvidia-open\b",
-        r"nvidia-driver-\d+-open",
-        r"akmod-nvidia-open",
-        r"kmod-nvidia-open",
-        r"open-dkms",
-        r"xorg-x11-drv-nvidia-open",
-    ]
-    proprietary_patterns = [
-        r"\bakmod-nvidia\b",
-        r"\bxorg-x11-drv-nvidia\b",
-        r"^nvidia-driver-\d+$",
-        r"\bnvidia-utils\b",
-        r"\bnvidia-driver-g0\d\b",
-        r"\bnvidia\b",
-    ]
+                    packages.add(pkg)
 
+    # Filtering the sorted, de-duplicated list keeps both categories sorted and unique.
+    all_pkgs = sorted(packages)
     open_pkgs: list[str] = []
     proprietary_pkgs: list[str] = []
-    for pkg in sorted(set(packages)):
+    for pkg in all_pkgs:
         low = pkg.lower()
-        if any(re.search(p, low) for p in open_patterns):
+        if _RE_OPEN_NVIDIA_PKGS.search(low):
             open_pkgs.append(pkg)
-        if any(re.search(p, low) for p in proprietary_patterns):
+        if _RE_PROPRIETARY_NVIDIA_PKGS.search(low):
             proprietary_pkgs.append(pkg)
 
     return {
-        "all": sorted(set(packages)),
-        "open": sorted(set(open_pkgs)),
-        "proprietary": sorted(set(proprietary_pkgs)),
+        "all": all_pkgs,
+        "open": open_pkgs,
+        "proprietary": proprietary_pkgs,
         "checks": checks,
     }
 
 
+@functools.cache
+def _fedora_release() -> str:
+    """Fedora release number as reported by rpm macros; constant for the host."""
+    return run_cmd(["rpm", "-E", "%fedora"], timeout=20).get("stdout", "").strip() or ""
+
+
+# Plan steps that can load or unload kernel modules in the running session; every other
+# step only changes packages/initramfs, which takes effect at the next boot.
+_NVIDIA_LIVE_MODULE_STEPS = frozenset({"execute-runfile", "switch-to-multi-user"})
+
+
 def _build_nvidia_remediation_plan(
     base_distro: str,
     mode: str,
@@ -2847,8 +3386,8 @@ def _build_nvidia_remediation_plan(
     runfile_url: str = "",
     session_type: str = "unknown",
 ) -> dict:
-    open_pkgs = list((diag or {}).get("installed_open_packages", []) or [])
-    proprietary_pkgs = list((diag or {}).get("installed_proprietary_packages", []) or [])
+    open_pkgs = list((diag or {}).get("installed_open_packages") or [])
+    proprietary_pkgs = list((diag or {}).get("installed_proprietary_packages") or [])
     remove_pkgs = sorted(set([pkg for pkg in (open_pkgs + proprietary_pkgs) if pkg]))
 
     plan = {
@@ -2902,7 +3441,7 @@ def _build_nvidia_remediation_plan(
             timeout=900,
         )
 
-        kernel_release = platform.release().strip()
+        kernel_release = _KERNEL_RELEASE.strip()
         add_step(
             "install-build-deps",
             [
@@ -2963,8 +3502,8 @@ def _build_nvidia_remediation_plan(
             return plan
         if remove_pkgs:
             add_step("remove-existing-nvidia-packages", ["dnf", "remove", "-y"] + remove_pkgs)
-        fedora_release = run_cmd(["rpm", "-E", "%fedora"], timeout=20).get("stdout", "").strip() or ""
-        kernel_release = platform.release().strip()
+        fedora_release = _fedora_release()
+        kernel_release = _KERNEL_RELEASE.strip()
         repo_url = f"https://developer.download.nvidia.com/compute/cuda/repos/fedora{fedora_release}/x86_64/cuda-fedora{fedora_release}.repo"
         add_step("add-cuda-repo", ["dnf", "config-manager", "--add-repo", repo_url], timeout=180)
         add_step("dnf-clean-all", ["dnf", "clean", "all"], timeout=120)
@@ -3060,6 +3599,9 @@ def _build_nvidia_remediation_plan(
     return plan
 
 
+_RE_AKMODS_FAILED_LOG = re.compile(r"(/var/cache/akmods/[^\s]+\.failed\.log)")
+
+
 def maybe_offer_nvidia_remediation(
     *,
     interactive: bool,
@@ -3083,6 +3625,8 @@ def maybe_offer_nvidia_remediation(
         "issues_detected": [],
         "action_recommended": False,
         "reboot_required": False,
+        "module_state_may_have_changed": False,
+        "driver_info_after": {},
         "actions": [],
         "logs": [],
         "post_check": {},
@@ -3220,6 +3764,7 @@ def maybe_offer_nvidia_remediation(
         trace(f"nvidia remediation step start: {step} cmd={' '.join(cmd)}")
         log = _run_privileged(cmd, timeout=timeout)
         log["step"] = step
+        invalidate_install_caches()
         trace(
             "nvidia remediation step done: "
             f"step={step} ok={log.get('ok')} rc={log.get('returncode')} "
@@ -3270,16 +3815,18 @@ def maybe_offer_nvidia_remediation(
     else:
         result["ok"] = all(log.get("ok", False) for log in result.get("logs", [])) if result.get("logs") else False
         result["execution_class"] = "executed" if result["ok"] else "failed"
+    result["module_state_may_have_changed"] = any(
+        log.get("step") in _NVIDIA_LIVE_MODULE_STEPS for log in result["logs"]
+    )
 
     def _extract_failed_log_path(logs: list[dict]) -> str:
-        pattern = re.compile(r"(/var/cache/akmods/[^\s]+\.failed\.log)")
         stack = list(logs)
         while stack:
             entry = stack.pop()
             if isinstance(entry, dict):
                 for key in ("stderr", "stdout", "error", "cmd"):
                     text = str(entry.get(key, "") or "")
-                    match = pattern.search(text)
+                    match = _RE_AKMODS_FAILED_LOG.search(text)
                     if match:
                         return match.group(1)
                 nested = entry.get("alternatives")
@@ -3292,19 +3839,30 @@ def maybe_offer_nvidia_remediation(
     kernel_api_mismatch_signature = ""
     if failed_log_path:
         failed_log_tail = _run_privileged(["tail", "-n", "220", failed_log_path], timeout=45)
-        failed_text = ((failed_log_tail.get("stdout", "") or "") + "\n" + (failed_log_tail.get("stderr", "") or "")).lower()
+        failed_text = ((failed_log_tail.get("stdout") or "") + "\n" + (failed_log_tail.get("stderr") or "")).lower()
         if "vm_area_struct" in failed_text and "__vm_flags" in failed_text:
             kernel_api_mismatch = True
             kernel_api_mismatch_signature = "vm_area_struct.__vm_flags missing"
 
-    mismatch_check = _detect_open_gsp_mismatch(run_user_cmd)
+    prior_mismatch = (nvidia_activation_diagnostics.get("checks") or {}).get("open_gsp_mismatch")
+    if prior_mismatch and not result.get("logs"):
+        # No remediation command ran, so the diagnostics pass's journal check is still current.
+        mismatch_check = {
+            "detected": bool(prior_mismatch.get("detected")),
+            "reason": prior_mismatch.get("reason", ""),
+            "journal_excerpt": prior_mismatch.get("stdout_excerpt", ""),
+            "check_ok": bool(prior_mismatch.get("ok", False)),
+        }
+    else:
+        mismatch_check = _detect_open_gsp_mismatch(run_user_cmd)
     nouveau_probe_check = _detect_nouveau_probe_failure(run_user_cmd)
     installed_after = _collect_installed_nvidia_packages(base_distro, run_user_cmd)
     lsmod_after = run_cmd(["lsmod"])
     loaded_after = gather_driver_info(lsmod_after.get("stdout", ""), priv)
+    result["driver_info_after"] = loaded_after
     smi_after = run_user_cmd(["nvidia-smi"], timeout=20) if command_exists("nvidia-smi") else {"ok": False, "stderr": "nvidia-smi not found", "stdout": ""}
-    nvidia_active_after = any(mod.startswith("nvidia") for mod in (loaded_after.get("loaded", []) or []))
-    nouveau_active_after = "nouveau" in (loaded_after.get("loaded", []) or [])
+    nvidia_active_after = any(mod.startswith("nvidia") for mod in (loaded_after.get("loaded") or []))
+    nouveau_active_after = "nouveau" in (loaded_after.get("loaded") or [])
     proprietary_mode = selected_mode in {"distro-repair", "cuda-repo", "runfile"}
     proprietary_target_ok = (
         nvidia_active_after
@@ -3397,6 +3955,32 @@ def maybe_offer_nvidia_remediation(
     return result
 
 
+_RE_APT_DRIVER_BRANCH = re.compile(r"(nvidia-driver-\d+)\b")
+_RE_DRIVER_BRANCH_NUM = re.compile(r"nvidia-driver-(\d+)$")
+# Package column of installed ("ii") dpkg -l rows whose line mentions an NVIDIA driver package.
+_RE_DPKG_NVIDIA = re.compile(
+    r"^ii[ \t]+(?=[^\n]*(?:\bnvidia\b|linux-modules-nvidia|system76.*nvidia))(\S+)", re.MULTILINE,
+)
+
+
+# Probes whose answer no in-session remediation step can change (firmware Secure Boot state,
+# hardware-based driver recommendation, repo metadata nothing refreshes). Cached so the
+# post-remediation diagnostics pass only re-runs the package/module-dependent checks.
+@functools.lru_cache(maxsize=4)
+def _probe_secure_boot_state(run_user_cmd) -> dict:
+    return run_user_cmd(["mokutil", "--sb-state"], timeout=20)
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_ubuntu_driver_devices(run_user_cmd) -> dict:
+    return run_user_cmd(["ubuntu-drivers", "devices"], timeout=40)
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_apt_nvidia_driver_branches(run_user_cmd) -> dict:
+    return run_user_cmd(["apt-cache", "search", "nvidia-driver-"], timeout=30)
+
+
 def gather_nvidia_activation_diagnostics(
     run_user_cmd,
     base_distro: str,
@@ -3407,7 +3991,7 @@ def gather_nvidia_activation_diagnostics(
 ) -> dict:
     """Collect actionable diagnostics for NVIDIA proprietary driver activation."""
     gpu_text = f"{gpu_lspci} {renderer}".lower()
-    loaded = set(driver_info.get("loaded", []))
+    loaded = driver_info.get("loaded", ())
     nvidia_gpu = _detect_nvidia_context(gpu_lspci, renderer, gpu_inventory)
     nvidia_gpu_model = _extract_nvidia_gpu_model(gpu_lspci, gpu_inventory)
     support_hint = _infer_open_module_support_from_gpu_model(nvidia_gpu_model)
@@ -3446,9 +4030,29 @@ def gather_nvidia_activation_diagnostics(
         diag["notes"].append("NVIDIA GPU not detected in renderer/lspci context.")
         return diag
 
-    secure_boot_enabled = None
+    # Independent probes run concurrently; results are merged below in the original order.
+    jobs: dict = {
+        "open_gsp_mismatch": functools.partial(_detect_open_gsp_mismatch, run_user_cmd),
+        "installed_pkgs": functools.partial(_collect_installed_nvidia_packages, base_distro, run_user_cmd),
+    }
     if command_exists("mokutil"):
-        sb = run_user_cmd(["mokutil", "--sb-state"], timeout=20)
+        jobs["mokutil"] = functools.partial(_probe_secure_boot_state, run_user_cmd)
+    if command_exists("nvidia-smi"):
+        jobs["nvidia_smi"] = functools.partial(run_user_cmd, ["nvidia-smi"], timeout=20)
+    if command_exists("modinfo"):
+        jobs["modinfo"] = functools.partial(run_user_cmd, ["modinfo", "nvidia"], timeout=20)
+    if base_distro in ("ubuntu", "debian"):
+        if command_exists("ubuntu-drivers"):
+            jobs["ubuntu_drivers"] = functools.partial(_probe_ubuntu_driver_devices, run_user_cmd)
+        if command_exists("dpkg"):
+            jobs["dpkg"] = functools.partial(run_user_cmd, ["dpkg", "-l"], timeout=60)
+        if command_exists("apt-cache"):
+            jobs["apt_cache_search"] = functools.partial(_probe_apt_nvidia_driver_branches, run_user_cmd)
+    probes = _run_probes_concurrently(jobs, max_workers=6)
+
+    secure_boot_enabled = None
+    if "mokutil" in probes:
+        sb = probes["mokutil"]
         diag["checks"]["secure_boot"] = {
             "ok": sb.get("ok", False),
             "stdout": sb.get("stdout", "")[:1000],
@@ -3460,8 +4064,8 @@ def gather_nvidia_activation_diagnostics(
         elif "disabled" in sb_text:
             secure_boot_enabled = False
 
-    if command_exists("nvidia-smi"):
-        smi = run_user_cmd(["nvidia-smi"], timeout=20)
+    if "nvidia_smi" in probes:
+        smi = probes["nvidia_smi"]
         diag["checks"]["nvidia_smi"] = {
             "ok": smi.get("ok", False),
             "stdout": smi.get("stdout", "")[:1200],
@@ -3474,25 +4078,25 @@ def gather_nvidia_activation_diagnostics(
             "stderr": "nvidia-smi command not found",
         }
 
-    if command_exists("modinfo"):
-        mod = run_user_cmd(["modinfo", "nvidia"], timeout=20)
+    if "modinfo" in probes:
+        mod = probes["modinfo"]
         diag["checks"]["modinfo_nvidia"] = {
             "ok": mod.get("ok", False),
             "stdout": mod.get("stdout", "")[:1000],
             "stderr": mod.get("stderr", "")[:500],
         }
 
-    open_mismatch = _detect_open_gsp_mismatch(run_user_cmd)
+    open_mismatch = probes["open_gsp_mismatch"]
     diag["open_gsp_mismatch"] = bool(open_mismatch.get("detected"))
     diag["open_gsp_mismatch_reason"] = open_mismatch.get("reason", "")
     diag["checks"]["open_gsp_mismatch"] = {
         "ok": bool(open_mismatch.get("check_ok", False)),
         "detected": bool(open_mismatch.get("detected")),
         "reason": open_mismatch.get("reason", ""),
-        "stdout_excerpt": (open_mismatch.get("journal_excerpt", "") or "")[:2000],
+        "stdout_excerpt": (open_mismatch.get("journal_excerpt") or "")[:2000],
     }
 
-    installed_pkgs = _collect_installed_nvidia_packages(base_distro, run_user_cmd)
+    installed_pkgs = probes["installed_pkgs"]
     diag["installed_open_packages"] = installed_pkgs.get("open", [])
     diag["installed_proprietary_packages"] = installed_pkgs.get("proprietary", [])
     diag["checks"]["installed_nvidia_packages_unified"] = {
@@ -3504,46 +4108,37 @@ def gather_nvidia_activation_diagnostics(
     if base_distro in ("ubuntu", "debian"):
         recommended_package = ""
         candidate_packages = []
-        if command_exists("ubuntu-drivers"):
-            ud = run_user_cmd(["ubuntu-drivers", "devices"], timeout=40)
+        if "ubuntu_drivers" in probes:
+            ud = probes["ubuntu_drivers"]
             diag["checks"]["ubuntu_drivers_devices"] = {
                 "ok": ud.get("ok", False),
                 "stdout": ud.get("stdout", "")[:3000],
                 "stderr": ud.get("stderr", "")[:1000],
             }
             if ud.get("ok"):
-                for line in ud.get("stdout", "").splitlines():
-                    m = re.search(r"driver\s*:\s*([^\s]+)", line)
-                    if not m:
-                        continue
-                    pkg = m.group(1).strip()
+                for m in _RE_UD_DRIVER.finditer(ud.get("stdout", "")):
+                    pkg = m.group(1)
                     if pkg not in candidate_packages:
                         candidate_packages.append(pkg)
-                    if "recommended" in line.lower():
+                    if "recommended" in m.group(2).lower():
                         recommended_package = pkg
 
         installed_nvidia_packages = []
-        if command_exists("dpkg"):
-            dpkg_res = run_user_cmd(["dpkg", "-l"], timeout=60)
+        if "dpkg" in probes:
+            dpkg_res = probes["dpkg"]
             if dpkg_res.get("ok"):
-                for line in dpkg_res.get("stdout", "").splitlines():
-                    if not line.startswith("ii"):
-                        continue
-                    if re.search(r"\bnvidia\b|linux-modules-nvidia|system76.*nvidia", line):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            installed_nvidia_packages.append(parts[1])
+                installed_nvidia_packages = _RE_DPKG_NVIDIA.findall(dpkg_res.get("stdout", ""))
             diag["checks"]["installed_nvidia_packages"] = {
                 "ok": bool(installed_nvidia_packages),
                 "packages": installed_nvidia_packages[:80],
             }
 
         available_branches = []
-        if command_exists("apt-cache"):
-            search = run_user_cmd(["apt-cache", "search", "nvidia-driver-"], timeout=30)
+        if "apt_cache_search" in probes:
+            search = probes["apt_cache_search"]
             if search.get("ok"):
                 for line in search.get("stdout", "").splitlines():
-                    m = re.match(r"(nvidia-driver-\d+)\b", line.strip())
+                    m = _RE_APT_DRIVER_BRANCH.match(line.strip())
                     if m:
                         available_branches.append(m.group(1))
             diag["checks"]["available_driver_branches"] = {
@@ -3555,7 +4150,7 @@ def gather_nvidia_activation_diagnostics(
             best_name = ""
             best_num = -1
             for pkg in pkgs:
-                m = re.match(r"nvidia-driver-(\d+)$", pkg)
+                m = _RE_DRIVER_BRANCH_NUM.match(pkg)
                 if not m:
                     continue
                 try:
@@ -3611,17 +4206,37 @@ def gather_nvidia_activation_diagnostics(
         recommended_package = ""
 
         if command_exists("dnf"):
+            # The three repoqueries are independent read-only lookups; dnf serializes any metadata refresh itself.
+            dnf_probes = _run_probes_concurrently({
+                # One repoquery for all candidates; the trailing newline keeps dnf5 output one NEVRA per line.
+                "candidates": functools.partial(
+                    run_user_cmd,
+                    ["dnf", "repoquery", "--qf", "%{name}-%{version}-%{release}.%{arch}\n"] + candidate_priority,
+                    timeout=60,
+                ),
+                "installed": functools.partial(
+                    run_user_cmd,
+                    ["dnf", "repoquery", "--installed", "--qf", "%{name} %{epoch}:%{version}-%{release}.%{arch} from %{repoid}", "*nvidia*"],
+                    timeout=60,
+                ),
+                "smi_providers": functools.partial(
+                    run_user_cmd,
+                    ["dnf", "repoquery", "--whatprovides", "*/nvidia-smi", "--qf", "%{name} %{epoch}:%{version}-%{release}.%{arch} from %{repoid}"],
+                    timeout=60,
+                ),
+            }, max_workers=3)
+            rq = dnf_probes["candidates"]
+            nevras_by_name: dict[str, list[str]] = {}
+            if rq.get("ok"):
+                for nevra in (rq.get("stdout") or "").split():
+                    nevras_by_name.setdefault(nevra.rsplit("-", 2)[0], []).append(nevra)
             for pkg in candidate_priority:
-                rq = run_user_cmd(
-                    ["dnf", "repoquery", "--qf", "%{name}-%{version}-%{release}.%{arch}", pkg],
-                    timeout=45,
-                )
-                stdout = rq.get("stdout", "") or ""
-                available = bool(rq.get("ok")) and (pkg in stdout)
+                nevras = nevras_by_name.get(pkg, [])
+                available = bool(nevras)
                 diag["checks"][f"repoquery_{pkg}"] = {
-                    "ok": bool(available),
-                    "stdout_excerpt": stdout[:1200],
-                    "stderr_excerpt": (rq.get("stderr", "") or "")[:500],
+                    "ok": available,
+                    "stdout_excerpt": "\n".join(nevras)[:1200],
+                    "stderr_excerpt": (rq.get("stderr") or "")[:500],
                 }
                 if available:
                     candidate_packages.append(pkg)
@@ -3634,32 +4249,32 @@ def gather_nvidia_activation_diagnostics(
                     "branches": sorted(set(candidate_packages)),
                 }
             else:
-                search = run_user_cmd(["dnf", "search", "nvidia"], timeout=45)
+                # Cached metadata first (no refresh); the full search only if the cache has nothing.
+                search_cmd = ["dnf", "-C", "repoquery", "--qf", "%{name}\n", "*nvidia*"]
+                search = run_user_cmd(search_cmd, timeout=45)
+                if not (search.get("ok") and (search.get("stdout") or "").strip()):
+                    search_cmd = ["dnf", "search", "nvidia"]
+                    search = run_user_cmd(search_cmd, timeout=45)
                 diag["checks"]["dnf_search_nvidia"] = {
                     "ok": search.get("ok", False),
-                    "stdout_excerpt": (search.get("stdout", "") or "")[:2000],
-                    "stderr_excerpt": (search.get("stderr", "") or "")[:500],
+                    "cmd": " ".join(search_cmd),
+                    "stdout_excerpt": (search.get("stdout") or "")[:2000],
+                    "stderr_excerpt": (search.get("stderr") or "")[:500],
                 }
 
             # Extra conflict diagnostics for mixed-package-family issues.
-            installed_q = run_user_cmd(
-                ["dnf", "repoquery", "--installed", "--qf", "%{name} %{epoch}:%{version}-%{release}.%{arch} from %{repoid}", "*nvidia*"],
-                timeout=60,
-            )
+            installed_q = dnf_probes["installed"]
             diag["checks"]["dnf_installed_nvidia_repoquery"] = {
                 "ok": installed_q.get("ok", False),
-                "stdout_excerpt": (installed_q.get("stdout", "") or "")[:5000],
-                "stderr_excerpt": (installed_q.get("stderr", "") or "")[:1000],
+                "stdout_excerpt": (installed_q.get("stdout") or "")[:5000],
+                "stderr_excerpt": (installed_q.get("stderr") or "")[:1000],
             }
 
-            smi_providers = run_user_cmd(
-                ["dnf", "repoquery", "--whatprovides", "*/nvidia-smi", "--qf", "%{name} %{epoch}:%{version}-%{release}.%{arch} from %{repoid}"],
-                timeout=60,
-            )
+            smi_providers = dnf_probes["smi_providers"]
             diag["checks"]["dnf_nvidia_smi_providers"] = {
                 "ok": smi_providers.get("ok", False),
-                "stdout_excerpt": (smi_providers.get("stdout", "") or "")[:5000],
-                "stderr_excerpt": (smi_providers.get("stderr", "") or "")[:1000],
+                "stdout_excerpt": (smi_providers.get("stdout") or "")[:5000],
+                "stderr_excerpt": (smi_providers.get("stderr") or "")[:1000],
             }
 
         suited_package = recommended_package or (candidate_packages[0] if candidate_packages else "")
@@ -3810,7 +4425,7 @@ def build_nvidia_command_block(diag: dict, base_distro: str) -> list[str]:
             "# after reboot:",
             "lsmod | grep -E 'nvidia|nouveau'",
             "nvidia-smi",
-            "journalctl -k -b --no-pager | grep -Ei 'nvidia|nouveau|drm|module'",
+            "journalctl -k -b --no-pager --grep 'nvidia|nouveau|drm|module'",
         ]
 
     suited = (diag or {}).get("suited_package", "")
@@ -3832,7 +4447,7 @@ def build_nvidia_command_block(diag: dict, base_distro: str) -> list[str]:
         "# after reboot:",
         "nvidia-smi",
         "lsmod | grep -E 'nvidia|nouveau'",
-        "journalctl -b --no-pager | grep -Ei 'nvidia|nouveau|dkms|secure boot|module'",
+        "journalctl -b --no-pager --grep 'nvidia|nouveau|dkms|secure boot|module'",
     ]
     return cmds
 
@@ -3874,12 +4489,20 @@ def build_nvidia_runfile_command_block(base_distro: str) -> list[str]:
     ]
 
 
-def gather_journalctl_debug(run_user_cmd, journalctl_lines: int = 8000) -> dict:
-    """Collect journalctl slices for troubleshooting in markdown report."""
+# Per-section stdout cap; journalctl is stopped once this much has been read.
+_JOURNAL_SECTION_MAX_BYTES = 120_000
+
+
+def gather_journalctl_debug(run_user_cmd, journalctl_lines: int = 8000, journalctl_since: str = "") -> dict:
+    """Collect journalctl slices for troubleshooting in markdown report.
+
+    journalctl_since (e.g. "-10min") narrows every section server-side; empty keeps the whole boot.
+    """
     data = {
         "enabled": True,
         "available": command_exists("journalctl"),
         "lines": int(max(50, journalctl_lines)),
+        "since": journalctl_since,
         "sections": {},
         "notes": [],
         "kwin_crash_analysis": {
@@ -3894,40 +4517,50 @@ def gather_journalctl_debug(run_user_cmd, journalctl_lines: int = 8000) -> dict:
         return data
 
     lines_arg = str(data["lines"])
+    window = ["-b", "--no-pager", "-n", lines_arg] + (["--since", journalctl_since] if journalctl_since else [])
     commands = {
-        "boot_tail": ["journalctl", "-b", "--no-pager", "-n", lines_arg],
-        "warnings_and_errors": ["journalctl", "-b", "--no-pager", "-p", "warning", "-n", lines_arg],
+        "boot_tail": ["journalctl", *window],
+        "warnings_and_errors": ["journalctl", *window, "-p", "warning"],
         "graphics_filter": [
-            "journalctl", "-b", "--no-pager", "-n", lines_arg,
+            "journalctl", *window,
             "--grep", "nvidia|nouveau|kwin|xwayland|drm|gpu|glmark|mangohud",
         ],
         "kwin_user_unit": [
-            "journalctl", "--user-unit", "plasma-kwin_wayland", "-b", "--no-pager", "-n", lines_arg,
+            "journalctl", "--user-unit", "plasma-kwin_wayland.service", *window,
         ],
         "kwin_focus_user": [
-            "journalctl", "--user", "-b", "--no-pager", "-n", lines_arg,
+            "journalctl", "--user", *window,
             "--grep", "kwin_wayland_drm|kwin_scene_opengl|GL_INVALID|prepareAtomicPresentation|xwayland|EGL|drm",
         ],
         "kernel_drm_focus": [
-            "journalctl", "-k", "-b", "--no-pager", "-n", lines_arg,
+            "journalctl", "-k", *window,
             "--grep", "drm|nvidia|nouveau|amdgpu|i915|simpledrm",
         ],
     }
-    for key, cmd in commands.items():
-        res = run_user_cmd(cmd, timeout=45)
+    def _run_section(cmd: list) -> dict:
+        res = run_user_cmd(cmd, timeout=45, extra_env=_C_LOCALE_ENV, max_stdout=_JOURNAL_SECTION_MAX_BYTES)
         if (not res.get("ok")) and ("--grep" in cmd):
             # Some journalctl versions are stricter about --grep; keep graceful fallback.
             fallback_cmd = list(cmd)
             grep_idx = fallback_cmd.index("--grep")
             del fallback_cmd[grep_idx:grep_idx + 2]
-            res = run_user_cmd(fallback_cmd, timeout=45)
-        stderr_text = (res.get("stderr", "") or "")
+            res = run_user_cmd(fallback_cmd, timeout=45, extra_env=_C_LOCALE_ENV, max_stdout=_JOURNAL_SECTION_MAX_BYTES)
+        return res
+
+    # Each section keeps its own server-side filter and -n window; they only share the wait.
+    results = _run_probes_concurrently(
+        {key: functools.partial(_run_section, cmd) for key, cmd in commands.items()},
+        max_workers=len(commands),
+    )
+    for key, cmd in commands.items():
+        res = results[key]
+        stderr_text = (res.get("stderr") or "")
         section_ok = bool(res.get("ok", False)) or ("No journal files were found." in stderr_text)
         data["sections"][key] = {
             "ok": section_ok,
             "cmd": " ".join(cmd),
             "returncode": res.get("returncode"),
-            "stdout": (res.get("stdout", "") or "")[:120000],
+            "stdout": res.get("stdout") or "",
             "stderr": stderr_text[:5000],
         }
 
@@ -3937,8 +4570,8 @@ def gather_journalctl_debug(run_user_cmd, journalctl_lines: int = 8000) -> dict:
             "ok": coredump_res.get("ok", False),
             "cmd": "coredumpctl list kwin_wayland --no-pager",
             "returncode": coredump_res.get("returncode"),
-            "stdout": (coredump_res.get("stdout", "") or "")[:120000],
-            "stderr": (coredump_res.get("stderr", "") or "")[:5000],
+            "stdout": (coredump_res.get("stdout") or "")[:120000],
+            "stderr": (coredump_res.get("stderr") or "")[:5000],
         }
 
     data["kwin_crash_analysis"] = analyze_kwin_crash_signals(data.get("sections", {}))
@@ -3949,48 +4582,49 @@ def gather_journalctl_debug(run_user_cmd, journalctl_lines: int = 8000) -> dict:
 # Mouse smoothness measurement
 # ---------------------------------------------------------------------------
 
+_RE_XRANDR_ACTIVE_RATE = re.compile(r"(\d+(?:\.\d+)?)\*", re.ASCII)
+
+
 def _get_active_refresh_hz(run_user_cmd) -> float:
     """Read active refresh rate from xrandr query output."""
     if not command_exists("xrandr"):
         return 0.0
-    res = run_user_cmd(["xrandr", "--query"])
+    res = run_user_cmd(["xrandr", "--query"], extra_env=_C_LOCALE_ENV)
     if not res["ok"]:
         return 0.0
+    return _parse_active_refresh_hz(res["stdout"])
+
+
+def _parse_active_refresh_hz(xrandr_stdout: str) -> float:
     in_connected = False
-    for line in res["stdout"].splitlines():
-        if " connected" in line:
-            in_connected = True
-        elif re.match(r"^\S", line) and " connected" not in line:
-            in_connected = False
-        if in_connected:
+    for line in xrandr_stdout.splitlines():
+        if line[:1].strip():
+            # Output header; only modes listed under a connected output count.
+            in_connected = " connected" in line
+        elif in_connected and "*" in line:
             # Active mode has * after the rate: "  1920x1080  60.00*+"
-            m = re.search(r"(\d+(?:\.\d+)?)\*", line)
+            m = _RE_XRANDR_ACTIVE_RATE.search(line)
             if m:
-                try:
-                    return float(m.group(1))
-                except ValueError:
-                    pass
+                return float(m.group(1))
     return 0.0
 
 
+_RE_EVENT_TIME = re.compile(r"time\s+([0-9]+\.[0-9]+)", re.ASCII)
+
+
 def extract_timestamps_from_events(text: str) -> list:
-    times = []
-    for line in text.splitlines():
-        m = re.search(r"time\s+([0-9]+\.[0-9]+)", line)
-        if m:
-            times.append(float(m.group(1)))
-    return times
+    return [float(m.group(1)) for m in _RE_EVENT_TIME.finditer(text)]
 
 
 def compute_event_stats(times: list) -> dict:
     if len(times) < 2:
         return {"events": len(times), "duration_s": 0.0, "avg_gap_ms": None, "max_gap_ms": None}
-    gaps = [times[i] - times[i - 1] for i in range(1, len(times))]
+    # Consecutive gaps telescope, so their mean is (last - first) / (n - 1); no gap list needed.
     return {
         "events": len(times),
         "duration_s": round(max(times) - min(times), 3),
-        "avg_gap_ms": round((sum(gaps) / len(gaps)) * 1000.0, 2),
-        "max_gap_ms": round(max(gaps) * 1000.0, 2),
+        "avg_gap_ms": round((times[-1] - times[0]) / (len(times) - 1) * 1000.0, 2),
+        "max_gap_ms": round(max(b - a for a, b in itertools.pairwise(times)) * 1000.0, 2),
     }
 
 
@@ -4013,7 +4647,8 @@ def sample_input_events(device_path: Optional[str], priv: dict, interactive: boo
     input("Mouse test: move the mouse continuously for 10 s, then press Enter to start...")
     # Use list args (no shell=True) to avoid command injection via device_path
     cmd = ["libinput", "debug-events", "--device", device_path]
-    res = run_cmd(cmd, timeout=10)
+    c_env = {**os.environ, **_C_LOCALE_ENV}
+    res = _sample_cmd_output(cmd, 10, env=c_env)
     summary["method"] = "libinput debug-events"
     summary["returncode"] = res.get("returncode")
 
@@ -4027,7 +4662,7 @@ def sample_input_events(device_path: Optional[str], priv: dict, interactive: boo
         cprint(C_YELLOW, "Permission denied; retrying with sudo...")
         sudo_cmd = ensure_sudo(cmd, priv)
         if sudo_cmd:
-            res = run_cmd(sudo_cmd, timeout=10)
+            res = _sample_cmd_output(sudo_cmd, 10, env=c_env)
             summary["method"] = "libinput debug-events (sudo)"
             summary["returncode"] = res.get("returncode")
             if res["ok"] or res.get("returncode") in (124, 143):
@@ -4040,8 +4675,11 @@ def sample_input_events(device_path: Optional[str], priv: dict, interactive: boo
     return summary
 
 
-def assess_mouse_smoothness(session_type: str, mouse_stats: dict, run_user_cmd) -> tuple:
-    """Return (smooth: bool, notes: str)."""
+def assess_mouse_smoothness(session_type: str, mouse_stats: dict, refresh: float, has_libinput: bool) -> tuple:
+    """Return (smooth: bool, notes: str).
+
+    refresh (Hz, 0 when unknown) and has_libinput are probed by the caller, which usually has them already.
+    """
     notes = []
     is_wayland = "wayland" in session_type.lower()
     notes.append(
@@ -4049,12 +4687,11 @@ def assess_mouse_smoothness(session_type: str, mouse_stats: dict, run_user_cmd)
         if is_wayland
         else "X11 display server (pointer events via X server)"
     )
-    if command_exists("libinput"):
+    if has_libinput:
         notes.append("libinput present (smooth acceleration profiles available)")
     else:
         notes.append("libinput not found — evdev/synaptics driver may be active")
 
-    refresh = _get_active_refresh_hz(run_user_cmd)
     if refresh:
         notes.append(f"Active refresh rate: {refresh} Hz")
 
@@ -4066,7 +4703,7 @@ def assess_mouse_smoothness(session_type: str, mouse_stats: dict, run_user_cmd)
     elif mouse_stats.get("error"):
         notes.append(f"Mouse event capture: {mouse_stats.get('error')}")
 
-    smooth = is_wayland or command_exists("libinput")
+    smooth = is_wayland or has_libinput
     if refresh:
         if refresh < 45:
             smooth = False
@@ -4083,22 +4720,55 @@ def assess_mouse_smoothness(session_type: str, mouse_stats: dict, run_user_cmd)
 # Memory breakdown
 # ---------------------------------------------------------------------------
 
+def _meminfo_kb(buf: bytes, key: bytes) -> int:
+    """Value of one "Key:  1234 kB" field in a raw /proc/meminfo buffer (0 when absent)."""
+    start = buf.find(key)
+    if start < 0:
+        return 0
+    end = buf.find(b"\n", start)
+    return int(buf[start + len(key):end if end >= 0 else None].split()[0])
+
+
 def ram_snapshot() -> tuple:
     """Return (used_mb, available_mb) from /proc/meminfo."""
-    total_kb = avail_kb = 0
-    for line in read_file("/proc/meminfo").splitlines():
-        if line.startswith("MemTotal"):
-            total_kb = int(line.split()[1])
-        elif line.startswith("MemAvailable"):
-            avail_kb = int(line.split()[1])
+    try:
+        with open("/proc/meminfo", "rb") as fh:
+            buf = fh.read()
+    except OSError:
+        buf = b""
+    total_kb = _meminfo_kb(buf, b"MemTotal:")
+    avail_kb = _meminfo_kb(buf, b"MemAvailable:")
     used_mb  = (total_kb - avail_kb) // 1024
     avail_mb = avail_kb // 1024
     return used_mb, avail_mb
 
 
+def _iter_proc_rss_kb():
+    """Yield (comm, rss_kb) per process straight from /proc; processes that exit mid-scan are skipped."""
+    page_kb = os.sysconf("SC_PAGESIZE") // 1024
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            # /proc/<pid>/stat holds both comm (field 2, in parens) and rss (field 24): one read per process.
+            try:
+                with open(f"/proc/{entry.name}/stat", "rb") as fh:
+                    stat = fh.read()
+                rpar = stat.rindex(b")")
+                comm = stat[stat.index(b"(") + 1:rpar].decode("utf-8", errors="replace")
+                rss_pages = int(stat[rpar + 2:].split()[21])
+            except (OSError, IndexError, ValueError):
+                continue
+            yield comm, rss_pages * page_kb
+
+
 def summarize_memory_breakdown() -> dict:
     """RSS-based top-process memory breakdown."""
-    res = run_cmd(["ps", "-eo", "comm,rss"])
+    try:
+        return {"ok": True, "top": heapq.nlargest(10, _iter_proc_rss_kb(), key=lambda x: x[1])}
+    except OSError:
+        pass
+    res = run_cmd(["ps", "-eo", "comm,rss"], env={**os.environ, **_C_LOCALE_ENV})
     if not res["ok"]:
         return {"ok": False, "error": res["error"], "top": []}
     parsed = []
@@ -4119,6 +4789,23 @@ def summarize_memory_breakdown() -> dict:
 
 _FPS_ACCEPTABLE_RATIO = 0.80
 _REFERENCE_SCALE = 1.0
+# CPUs this process may run on (honours cgroup/taskset limits); read once at import.
+_CPU_COUNT = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 0)
+
+
+_RE_CPUINFO_MODEL = re.compile(rb"^model name[ \t]*:[ \t]*(.*)$", re.MULTILINE)
+
+
+@functools.cache
+def _read_cpuinfo_model() -> str:
+    """First 'model name' from /proc/cpuinfo; the first CPU block fits in one 4 KiB read."""
+    try:
+        with open("/proc/cpuinfo", "rb") as f:
+            head = f.read(4096)
+    except OSError:
+        return ""
+    m = _RE_CPUINFO_MODEL.search(head)
+    return m.group(1).decode("utf-8", "replace").strip() if m else ""
 
 
 def assess_performance(
@@ -4151,7 +4838,7 @@ def assess_performance(
         delta = target_used_mb - baseline_used_mb
         lines.append(
             f"RAM at target scale {target_scale}x: {target_used_mb} MB used "
-            f"({'+'if delta >= 0 else ''}{delta} MB vs baseline)."
+            f"({delta:+d} MB vs baseline)."
         )
         if delta > 200:
             lines.append(
@@ -4236,6 +4923,16 @@ def build_conclusions(
 # Console report
 # ---------------------------------------------------------------------------
 
+# Fixed per-item line templates, bound once for the output and remediation-log loops.
+_fmt_output_line = "    - {}: mode={}, scale={}, refresh={} Hz".format
+_fmt_remediation_log = "    - {}: ok={} rc={} cmd={}".format
+
+
+def _matrix_has_fractional(test_runs: dict) -> bool:
+    """True when any test-matrix case requested a non-integer scale (one float() per run)."""
+    return any(not float(run.get("requested_scale", 1.0)).is_integer() for run in test_runs.values())
+
+
 def print_console_report(
     osr, base_distro, session_type, desktop, wm_comp, xwayland_present,
     start_scale, start_scale_source,
@@ -4263,15 +4960,10 @@ def print_console_report(
     package_install_result,
     sudo_passwordless_result,
 ) -> None:
-    matrix_has_fractional = any(
-        abs(float(run.get("requested_scale", 1.0)) - round(float(run.get("requested_scale", 1.0)))) > 1e-6
-        for run in test_runs.values()
-    )
-
     _section("System Information")
-    _bullet("Hostname",            platform.node())
+    _bullet("Hostname",            _HOSTNAME)
     _bullet("OS",                  osr.get("PRETTY_NAME", "unknown"))
-    _bullet("Kernel",              platform.release())
+    _bullet("Kernel",              _KERNEL_RELEASE)
     _bullet("Base distro",         base_distro)
     _bullet("CPU",                 cpu_model or "unknown")
     _bullet("CPU cores",           cpu_cores)
@@ -4286,12 +4978,13 @@ def print_console_report(
                 _bullet(f"GPU[{idx}] possible", ", ".join(mods))
     _bullet("OpenGL renderer",     renderer or "unknown")
     _bullet("GPU driver (kernel)", ", ".join(driver_info.get("loaded", [])) or "unknown")
-    _bullet("Boot mode", firmware_security_info.get("boot_mode", "unknown"))
-    sb = firmware_security_info.get("secure_boot", {})
+    fw = firmware_security_info
+    _bullet("Boot mode", fw.get("boot_mode", "unknown"))
+    sb = fw.get("secure_boot", {})
     _bullet("Secure Boot", sb.get("state", "unknown"))
-    _bullet("BIOS", f"{firmware_security_info.get('bios_vendor', '')} {firmware_security_info.get('bios_version', '')} ({firmware_security_info.get('bios_date', '')})".strip())
-    _bullet("Mainboard", firmware_security_info.get("board_name", "unknown"))
-    _bullet("System", f"{firmware_security_info.get('sys_vendor', '')} {firmware_security_info.get('product_name', '')}".strip())
+    _bullet("BIOS", _firmware_bios_line(fw))
+    _bullet("Mainboard", fw.get("board_name", "unknown"))
+    _bullet("System", _firmware_system_line(fw))
     if possible_nvidia_drivers.get("recommended"):
         _bullet("NVIDIA recommended", possible_nvidia_drivers.get("recommended"))
     if possible_nvidia_drivers.get("available"):
@@ -4324,29 +5017,35 @@ def print_console_report(
         print("    Active runtime components: none detected in current process list")
 
     _section("Package Manager Diagnostics")
-    _bullet("Package manager", package_manager_diagnostics.get("pm", "unknown"))
-    _bullet("Installability probe", "yes" if package_manager_diagnostics.get("can_install") else "no")
-    _bullet("Immutable environment", "yes" if package_manager_diagnostics.get("immutable") else "no")
-    live_info = package_manager_diagnostics.get("live_env", {}) or {}
+    pm_diag = package_manager_diagnostics
+    install_attempted = package_install_result.get("attempted")
+    requested_packages = package_install_result.get("requested_packages", [])
+    _bullet("Package manager", pm_diag.get("pm", "unknown"))
+    _bullet("Installability probe", "yes" if pm_diag.get("can_install") else "no")
+    _bullet("Immutable environment", "yes" if pm_diag.get("immutable") else "no")
+    live_info = pm_diag.get("live_env") or {}
     _bullet("Likely live environment", "yes" if live_info.get("likely_live") else "no")
-    package_resolution = package_install_result.get("package_resolution", {}) or {}
+    package_resolution = package_install_result.get("package_resolution") or {}
     _bullet(
         "Package resolution",
         f"{package_resolution.get('resolved_tool_count', 0)} / {package_resolution.get('missing_tool_count', 0)} missing tools mapped to installable packages",
     )
-    if live_info.get("reasons"):
-        print(f"    Live detection reasons: {', '.join(live_info.get('reasons', [])[:8])}")
-    if package_manager_diagnostics.get("reasons"):
-        print(f"    Installability reasons: {', '.join(package_manager_diagnostics.get('reasons', [])[:8])}")
-    _bullet("Install attempted", "yes" if package_install_result.get("attempted") else "no")
-    if package_install_result.get("requested_packages"):
-        print(f"    Requested packages: {', '.join(package_install_result.get('requested_packages', [])[:12])}")
-    if package_install_result.get("attempted"):
+    live_reasons = live_info.get("reasons", [])
+    if live_reasons:
+        print(f"    Live detection reasons: {', '.join(live_reasons[:8])}")
+    install_reasons = pm_diag.get("reasons", [])
+    if install_reasons:
+        print(f"    Installability reasons: {', '.join(install_reasons[:8])}")
+    _bullet("Install attempted", "yes" if install_attempted else "no")
+    if requested_packages:
+        print(f"    Requested packages: {', '.join(requested_packages[:12])}")
+    if install_attempted:
         _bullet("Install success", "yes" if package_install_result.get("ok") else "no")
     _bullet("Install result", package_install_result.get("reason", "not-attempted"))
-    if package_resolution.get("out_of_sync"):
+    out_of_sync = package_resolution.get("out_of_sync", [])
+    if out_of_sync:
         print("    Out-of-sync mappings (script vs distro reality):")
-        for entry in package_resolution.get("out_of_sync", [])[:20]:
+        for entry in out_of_sync[:20]:
             tool = entry.get("tool", "unknown")
             status = entry.get("status", "unknown")
             candidates = ", ".join(entry.get("candidates", [])[:8]) or "none"
@@ -4412,7 +5111,7 @@ def print_console_report(
     _bullet("Start detected via",  start_scale_source)
     _bullet("Baseline factor",     f"{baseline_scale}x")
     _bullet("Detected via",        baseline_scale_source)
-    _bullet("Fractional case tested", "yes" if matrix_has_fractional else "no")
+    _bullet("Fractional case tested", "yes" if _matrix_has_fractional(test_runs) else "no")
 
     _section("Test Matrix")
     for case_name, run in test_runs.items():
@@ -4441,13 +5140,14 @@ def print_console_report(
     _bullet("Available at baseline", f"{baseline_avail_mb} MB")
     if target_used_mb is not None:
         delta = target_used_mb - baseline_used_mb
-        _bullet("Used at target scale", f"{target_used_mb} MB  (delta: {'+'if delta >= 0 else ''}{delta} MB)")
+        _bullet("Used at target scale", f"{target_used_mb} MB  (delta: {delta:+d} MB)")
 
     _section("Mouse Smoothness")
     _bullet("Assessment",          "likely smooth" if smooth else "potentially degraded")
     for note in mouse_notes.split(";"):
-        if note.strip():
-            print(f"    {note.strip()}")
+        note = note.strip()
+        if note:
+            print(f"    {note}")
 
     _section("Driver Suitability")
     _bullet("Assessment",          "suitable" if driver_suitable else "may be unsuitable")
@@ -4455,53 +5155,43 @@ def print_console_report(
     if nvidia_instructions:
         for line in nvidia_instructions:
             print(f"    {line}")
-    if nvidia_activation_diagnostics.get("relevant"):
-        _bullet("NVIDIA module active", "yes" if nvidia_activation_diagnostics.get("nvidia_module_active") else "no")
-        _bullet("nouveau active", "yes" if nvidia_activation_diagnostics.get("nouveau_active") else "no")
-        _bullet(
-            "Nouveau accepted for legacy GPU",
-            "yes" if nvidia_activation_diagnostics.get("nouveau_accepted_legacy_gpu") else "no",
-        )
-        checks = nvidia_activation_diagnostics.get("checks", {})
+    nad = nvidia_activation_diagnostics
+    if nad.get("relevant"):
+        _bullet("NVIDIA module active", "yes" if nad.get("nvidia_module_active") else "no")
+        _bullet("nouveau active", "yes" if nad.get("nouveau_active") else "no")
+        _bullet("Nouveau accepted for legacy GPU", "yes" if nad.get("nouveau_accepted_legacy_gpu") else "no")
+        checks = nad.get("checks") or {}
         pkgs = checks.get("installed_nvidia_packages", {}).get("packages", [])
         branches = checks.get("available_driver_branches", {}).get("branches", [])
         if pkgs:
             _bullet("Installed NVIDIA pkgs", ", ".join(pkgs[:8]))
         if branches:
             _bullet("Available branches", ", ".join(branches[:8]))
-        for opt in nvidia_activation_diagnostics.get("options", []):
+        for opt in nad.get("options") or ():
             print(f"    {opt}")
-        cmd_block = nvidia_activation_diagnostics.get("command_block", [])
-        if cmd_block:
-            print("    Suggested command block:")
-            print("    ```bash")
-            for cmd in cmd_block:
-                print(f"    {cmd}")
-            print("    ```")
-        cmd_block_cuda = nvidia_activation_diagnostics.get("command_block_nvidia_cuda_repo", [])
-        if cmd_block_cuda:
-            print("    NVIDIA direct install command block (CUDA repo):")
-            print("    ```bash")
-            for cmd in cmd_block_cuda:
-                print(f"    {cmd}")
-            print("    ```")
-        cmd_block_run = nvidia_activation_diagnostics.get("command_block_nvidia_runfile", [])
-        if cmd_block_run:
-            print("    NVIDIA direct install command block (.run installer):")
-            print("    ```bash")
-            for cmd in cmd_block_run:
-                print(f"    {cmd}")
-            print("    ```")
-        remediation = nvidia_activation_diagnostics.get("auto_remediation", {})
+        for key, title in (
+            ("command_block", "Suggested command block:"),
+            ("command_block_nvidia_cuda_repo", "NVIDIA direct install command block (CUDA repo):"),
+            ("command_block_nvidia_runfile", "NVIDIA direct install command block (.run installer):"),
+        ):
+            cmd_block = nad.get(key)
+            if cmd_block:
+                print(f"    {title}")
+                print("    ```bash")
+                for cmd in cmd_block:
+                    print(f"    {cmd}")
+                print("    ```")
+        remediation = nad.get("auto_remediation") or {}
         if remediation:
+            post_check = remediation.get("post_check") or {}
             _bullet("NVIDIA auto remediation offered", "yes" if remediation.get("offered") else "no")
             _bullet("NVIDIA auto remediation attempted", "yes" if remediation.get("attempted") else "no")
             _bullet("NVIDIA auto remediation result", "ok" if remediation.get("ok") else remediation.get("reason", "n/a"))
             _bullet("NVIDIA issues detected", ", ".join(remediation.get("issues_detected", [])) or "none")
             _bullet("NVIDIA action recommended", "yes" if remediation.get("action_recommended") else "no")
-            reboot_required = bool(remediation.get("reboot_required")) or bool((remediation.get("post_check") or {}).get("needs_reboot"))
+            reboot_required = bool(remediation.get("reboot_required")) or bool(post_check.get("needs_reboot"))
             _bullet("NVIDIA reboot required", "yes" if reboot_required else "no")
-            actions = remediation.get("actions", {})
+            actions = remediation.get("actions")
             if actions:
                 print(
                     "    planned actions: "
@@ -4509,16 +5199,12 @@ def print_console_report(
                     f"install={actions.get('install_packages', [])}, "
                     f"post={actions.get('post_commands', [])}"
                 )
-            for log in remediation.get("logs", [])[:30]:
-                print(
-                    "    - "
-                    f"{log.get('step', 'step')}: ok={log.get('ok')} rc={log.get('returncode')} "
-                    f"cmd={log.get('cmd', '')}"
-                )
-                stderr_excerpt = (log.get("stderr", "") or "")[:240]
+            for log in itertools.islice(remediation.get("logs") or (), 30):
+                log_get = log.get
+                print(_fmt_remediation_log(log_get("step", "step"), log_get("ok"), log_get("returncode"), log_get("cmd", "")))
+                stderr_excerpt = (log_get("stderr") or "")[:240]
                 if stderr_excerpt:
                     print(f"      stderr: {stderr_excerpt}")
-            post_check = remediation.get("post_check", {})
             if post_check:
                 print(
                     "    post-check: "
@@ -4532,15 +5218,14 @@ def print_console_report(
     _bullet("Pipeline",            pipeline_analysis.get("pipeline_class", "unknown"))
     _bullet("GPU path",            pipeline_analysis.get("gpu_path", "unknown"))
     _bullet("Expected efficiency", pipeline_analysis.get("efficiency_expectation", "unknown"))
-    output_topology = pipeline_analysis.get("output_topology", {})
-    outputs = output_topology.get("outputs", [])
-    if outputs:
-        for out in outputs:
-            out_name = out.get("name", "output")
-            out_scale = out.get("scale") if out.get("scale") is not None else "n/a"
-            out_hz = out.get("refresh_hz") if out.get("refresh_hz") is not None else "n/a"
-            out_mode = out.get("mode") or "unknown"
-            print(f"    - {out_name}: mode={out_mode}, scale={out_scale}, refresh={out_hz} Hz")
+    for out in pipeline_analysis.get("output_topology", {}).get("outputs", []):
+        out_name = out.get("name", "output")
+        out_scale = out.get("scale")
+        out_scale = "n/a" if out_scale is None else out_scale
+        out_hz = out.get("refresh_hz")
+        out_hz = "n/a" if out_hz is None else out_hz
+        out_mode = out.get("mode") or "unknown"
+        print(_fmt_output_line(out_name, out_mode, out_scale, out_hz))
     for reason in pipeline_analysis.get("likely_bottlenecks", []):
         print(f"    bottleneck: {reason}")
 
@@ -4569,20 +5254,22 @@ def print_console_report(
         print(f"    note: {note}")
 
     _section("Journalctl Debug Capture")
-    _bullet("Enabled", "yes" if journalctl_debug.get("enabled") else "no")
-    _bullet("journalctl available", "yes" if journalctl_debug.get("available") else "no")
-    _bullet("Captured lines", journalctl_debug.get("lines", "n/a"))
-    kwin_analysis = journalctl_debug.get("kwin_crash_analysis", {}) or {}
+    jd = journalctl_debug
+    _bullet("Enabled", "yes" if jd.get("enabled") else "no")
+    _bullet("journalctl available", "yes" if jd.get("available") else "no")
+    _bullet("Captured lines", jd.get("lines", "n/a"))
+    kwin_analysis = jd.get("kwin_crash_analysis") or {}
     _bullet("KWin crash risk", kwin_analysis.get("risk_level", "unknown"))
     _bullet("KWin crash score", kwin_analysis.get("score", "n/a"))
-    for signal in kwin_analysis.get("signals", []):
-        print(f"    signal: {signal}")
+    for sig_line in kwin_analysis.get("signals", []):
+        print(f"    signal: {sig_line}")
     for step in kwin_analysis.get("next_steps", []):
         print(f"    next: {step}")
-    for sec_name, sec_data in journalctl_debug.get("sections", {}).items():
+    for sec_name, sec_data in jd.get("sections", {}).items():
         _bullet(f"Section {sec_name}", "ok" if sec_data.get("ok") else "failed")
-        if sec_data.get("stderr"):
-            print(f"    stderr: {sec_data.get('stderr')[:200]}")
+        sec_stderr = sec_data.get("stderr")
+        if sec_stderr:
+            print(f"    stderr: {sec_stderr[:200]}")
 
     _section("Efficiency & Performance Assessment")
     print(assessment)
@@ -4592,13 +5279,22 @@ def print_console_report(
         for c in conclusions:
             print(f"  * {c}")
 
-    print(f"\n{C_BLUE}{'=' * 62}{C_RESET}\n")
+    print(f"\n{_BLUE_RULE}\n")
 
 
 # ---------------------------------------------------------------------------
 # Markdown report
 # ---------------------------------------------------------------------------
 
+_MD_CELL_TRANS = str.maketrans({"|": "\\|", "\n": " "})
+_fmt_journal_section_head = "\n### journalctl section: {}\n- Command: {}\n- Success: {}\n```text\n".format
+
+
+def _md_cell(value) -> str:
+    """Table-cell text: pipes escaped, newlines flattened so the row stays on one line."""
+    return str(value).translate(_MD_CELL_TRANS)
+
+
 def write_markdown_report(
     output_path: str,
     osr, base_distro, session_type, desktop, wm_comp,
@@ -4631,401 +5327,406 @@ def write_markdown_report(
     sudo_passwordless_result,
     trace_log,
     console_log,
+    generated_at: dt.datetime,
+    include_raw_json: bool = True,
 ) -> None:
-    matrix_has_fractional = any(
-        abs(float(run.get("requested_scale", 1.0)) - round(float(run.get("requested_scale", 1.0)))) > 1e-6
-        for run in test_runs.values()
-    )
-
-    lines = [
-        "# Desktop Scaling Diagnostic Report",
-        f"- Generated: {dt.datetime.now().isoformat()}",
-        "",
-        "## System Summary",
-        f"- Hostname: {platform.node()}",
-        f"- Kernel: {platform.release()}",
-        f"- Distro: {osr.get('PRETTY_NAME', 'unknown')}",
-        f"- Base distro: {base_distro}",
-        f"- CPU: {cpu_model or 'unknown'} ({cpu_cores} cores)",
-        f"- RAM: {ram_total_mb} MB ({ram_total_mb / 1024:.1f} GB)",
-        f"- GPU: {gpu_lspci or 'unknown'}",
-        f"- OpenGL renderer: {renderer or 'unknown'}",
-        f"- Boot mode: {firmware_security_info.get('boot_mode', 'unknown')}",
-        f"- Secure Boot: {firmware_security_info.get('secure_boot', {}).get('state', 'unknown')}",
-        f"- BIOS: {firmware_security_info.get('bios_vendor', '')} {firmware_security_info.get('bios_version', '')} ({firmware_security_info.get('bios_date', '')})".strip(),
-        f"- Mainboard: {firmware_security_info.get('board_name', 'unknown')}",
-        f"- System model: {firmware_security_info.get('sys_vendor', '')} {firmware_security_info.get('product_name', '')}".strip(),
-        "",
-        "### GPU Inventory",
-    ]
-    if gpu_inventory:
-        for idx, gpu in enumerate(gpu_inventory, 1):
-            lines += [
-                f"- GPU[{idx}] model: {gpu.get('model', 'unknown')}",
-                f"- GPU[{idx}] active driver: {gpu.get('driver_in_use') or 'unknown'}",
-                f"- GPU[{idx}] possible drivers: {', '.join(gpu.get('kernel_modules', [])) if gpu.get('kernel_modules') else 'unknown'}",
-            ]
-    else:
-        lines += ["- No GPU inventory parsed"]
+    # A 1 MiB buffer hands the kernel large chunks while the rest of the report is still being formatted.
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        # Lines go straight to the file; no report-sized list or joined string is built.
+        write = f.write
+
+        def emit(*report_lines: str) -> None:
+            # Written piece by piece: journal sections can be ~120 kB each and are not copied again.
+            for line in report_lines:
+                write(line)
+                write("\n")
+
+        def emit_bullets(items, prefix: str = "- ") -> None:
+            # One join per list instead of one formatted line per item.
+            if items:
+                write(prefix)
+                write(("\n" + prefix).join(map(str, items)))
+                write("\n")
+
+        def emit_row(*cells) -> None:
+            write("| ")
+            write(" | ".join(map(_md_cell, cells)))
+            write(" |\n")
+
+        def emit_tail(entries: list, limit: int, empty: str) -> None:
+            # Index the tail in place: no slice copy and no joined string for long logs.
+            if not entries:
+                emit(empty)
+            for i in range(max(0, len(entries) - limit), len(entries)):
+                write(entries[i])
+                write("\n")
+
+        def emit_json(obj) -> None:
+            if not include_raw_json:
+                return
+            import json  # only raw report embeds need it; --compact-report never loads it
+
+            write("```json\n")
+            # Plain trees built by this script: no cycle bookkeeping; UTF-8 file, so no \u escaping.
+            json.dump(obj, f, indent=2, check_circular=False, ensure_ascii=False)
+            write("\n```\n")
+
+        emit(
+            "# Desktop Scaling Diagnostic Report",
+            f"- Generated: {generated_at.isoformat()}",
+            "",
+            "## System Summary",
+            f"- Hostname: {_HOSTNAME}",
+            f"- Kernel: {_KERNEL_RELEASE}",
+            f"- Distro: {osr.get('PRETTY_NAME', 'unknown')}",
+            f"- Base distro: {base_distro}",
+            f"- CPU: {cpu_model or 'unknown'} ({cpu_cores} cores)",
+            f"- RAM: {ram_total_mb} MB ({ram_total_mb / 1024:.1f} GB)",
+            f"- GPU: {gpu_lspci or 'unknown'}",
+            f"- OpenGL renderer: {renderer or 'unknown'}",
+            f"- Boot mode: {firmware_security_info.get('boot_mode', 'unknown')}",
+            f"- Secure Boot: {firmware_security_info.get('secure_boot', {}).get('state', 'unknown')}",
+            f"- BIOS: {_firmware_bios_line(firmware_security_info)}".strip(),
+            f"- Mainboard: {firmware_security_info.get('board_name', 'unknown')}",
+            f"- System model: {_firmware_system_line(firmware_security_info)}".strip(),
+            "",
+            "### GPU Inventory",
+        )
+        if gpu_inventory:
+            for idx, gpu in enumerate(gpu_inventory, 1):
+                emit(
+                    f"- GPU[{idx}] model: {gpu.get('model', 'unknown')}",
+                    f"- GPU[{idx}] active driver: {gpu.get('driver_in_use') or 'unknown'}",
+                    f"- GPU[{idx}] possible drivers: {', '.join(gpu.get('kernel_modules', [])) if gpu.get('kernel_modules') else 'unknown'}",
+                )
+        else:
+            emit("- No GPU inventory parsed")
+
+        if possible_nvidia_drivers.get("recommended"):
+            emit(f"- NVIDIA recommended package: {possible_nvidia_drivers.get('recommended')}")
+        if possible_nvidia_drivers.get("available"):
+            emit(f"- NVIDIA possible packages: {', '.join(possible_nvidia_drivers.get('available', [])[:20])}")
+
+        emit(
+            "## Session",
+            f"- Session type: {session_type}",
+            f"- Desktop: {desktop}",
+            f"- Compositor/WM: {wm_comp.get('compositor', 'unknown')}",
+            f"- XWayland present: {xwayland_present}",
+            "",
+            "## Desktop Pipeline Packages",
+            f"- Package manager: {pipeline_packages.get('package_manager', 'unknown')}",
+            "",
+        )
 
-    if possible_nvidia_drivers.get("recommended"):
-        lines += [f"- NVIDIA recommended package: {possible_nvidia_drivers.get('recommended')}"]
-    if possible_nvidia_drivers.get("available"):
-        lines += [f"- NVIDIA possible packages: {', '.join(possible_nvidia_drivers.get('available', [])[:20])}"]
-
-    lines += [
-        "## Session",
-        f"- Session type: {session_type}",
-        f"- Desktop: {desktop}",
-        f"- Compositor/WM: {wm_comp.get('compositor', 'unknown')}",
-        f"- XWayland present: {xwayland_present}",
-        "",
-        "## Desktop Pipeline Packages",
-        f"- Package manager: {pipeline_packages.get('package_manager', 'unknown')}",
-        "",
-    ]
+        pkg_rows = pipeline_packages.get("rows", [])
+        if pkg_rows:
+            emit(
+                "| Component | Package | Version |",
+                "|---|---|---|",
+            )
+            for row in pkg_rows:
+                get = row.get
+                emit_row(get("component", ""), get("package", ""), get("version", ""))
+        else:
+            emit("- No pipeline package versions resolved")
 
-    pkg_rows = pipeline_packages.get("rows", [])
-    if pkg_rows:
-        lines += [
-            "| Component | Package | Version |",
-            "|---|---|---|",
-        ]
-        for row in pkg_rows:
-            component = str(row.get("component", "")).replace("|", "\\|")
-            package = str(row.get("package", "")).replace("|", "\\|")
-            version = str(row.get("version", "")).replace("|", "\\|")
-            lines.append(f"| {component} | {package} | {version} |")
-    else:
-        lines += ["- No pipeline package versions resolved"]
+        active_runtime = pipeline_packages.get("active_runtime", [])
+        if active_runtime:
+            emit(
+                "",
+                "### Active Runtime Components",
+                "| Role | Process | Package | Version |",
+                "|---|---|---|---|",
+            )
+            for item in active_runtime:
+                get = item.get
+                emit_row(get("role", ""), get("process", ""), get("package", ""), get("version", ""))
+        else:
+            emit("", "### Active Runtime Components", "- None detected in current process list")
 
-    active_runtime = pipeline_packages.get("active_runtime", [])
-    if active_runtime:
-        lines += [
+        live_env = package_manager_diagnostics.get("live_env") or {}
+        emit(
             "",
-            "### Active Runtime Components",
-            "| Role | Process | Package | Version |",
-            "|---|---|---|---|",
-        ]
-        for item in active_runtime:
-            role = str(item.get("role", "")).replace("|", "\\|")
-            process = str(item.get("process", "")).replace("|", "\\|")
-            package = str(item.get("package", "")).replace("|", "\\|")
-            version = str(item.get("version", "")).replace("|", "\\|")
-            lines.append(f"| {role} | {process} | {package} | {version} |")
-    else:
-        lines += ["", "### Active Runtime Components", "- None detected in current process list"]
-
-    lines += [
-        "",
-        "## Package Manager Diagnostics",
-        f"- Package manager: {package_manager_diagnostics.get('pm', 'unknown')}",
-        f"- Installability probe: {package_manager_diagnostics.get('can_install')}",
-        f"- Immutable environment: {package_manager_diagnostics.get('immutable')}",
-        f"- Likely live environment: {(package_manager_diagnostics.get('live_env', {}) or {}).get('likely_live')}",
-    ]
-    package_resolution = package_install_result.get("package_resolution", {}) or {}
-    lines.append(
-        "- Package resolution: "
-        f"{package_resolution.get('resolved_tool_count', 0)} / {package_resolution.get('missing_tool_count', 0)} missing tools mapped to installable packages"
-    )
-    live_reasons = (package_manager_diagnostics.get("live_env", {}) or {}).get("reasons", [])
-    if live_reasons:
-        lines.append(f"- Live detection reasons: {', '.join(live_reasons[:8])}")
-    if package_manager_diagnostics.get("reasons"):
-        lines.append(f"- Installability reasons: {', '.join(package_manager_diagnostics.get('reasons', [])[:8])}")
-    lines += [
-        f"- Install attempted: {package_install_result.get('attempted')}",
-        f"- Install result: {package_install_result.get('reason', 'not-attempted')}",
-    ]
-    if package_install_result.get("requested_packages"):
-        lines.append(f"- Requested packages: {', '.join(package_install_result.get('requested_packages', [])[:12])}")
-    if package_install_result.get("attempted"):
-        lines.append(f"- Install success: {package_install_result.get('ok')}")
-    if package_resolution.get("out_of_sync"):
-        lines += ["", "### Out-of-sync mappings"]
-        for entry in package_resolution.get("out_of_sync", [])[:40]:
-            tool = entry.get("tool", "unknown")
-            status = entry.get("status", "unknown")
-            candidates = ", ".join(entry.get("candidates", [])[:8]) or "none"
-            available = ", ".join(entry.get("available_candidates", [])[:8]) or "none"
-            lines.append(
-                f"- {tool}: {status}; candidates=[{candidates}] available=[{available}]"
+            "## Package Manager Diagnostics",
+            f"- Package manager: {package_manager_diagnostics.get('pm', 'unknown')}",
+            f"- Installability probe: {package_manager_diagnostics.get('can_install')}",
+            f"- Immutable environment: {package_manager_diagnostics.get('immutable')}",
+            f"- Likely live environment: {live_env.get('likely_live')}",
+        )
+        package_resolution = package_install_result.get("package_resolution") or {}
+        emit(
+            "- Package resolution: "
+            f"{package_resolution.get('resolved_tool_count', 0)} / {package_resolution.get('missing_tool_count', 0)} missing tools mapped to installable packages"
+        )
+        live_reasons = live_env.get("reasons")
+        if live_reasons:
+            emit(f"- Live detection reasons: {', '.join(live_reasons[:8])}")
+        if package_manager_diagnostics.get("reasons"):
+            emit(f"- Installability reasons: {', '.join(package_manager_diagnostics.get('reasons', [])[:8])}")
+        emit(
+            f"- Install attempted: {package_install_result.get('attempted')}",
+            f"- Install result: {package_install_result.get('reason', 'not-attempted')}",
+        )
+        if package_install_result.get("requested_packages"):
+            emit(f"- Requested packages: {', '.join(package_install_result.get('requested_packages', [])[:12])}")
+        if package_install_result.get("attempted"):
+            emit(f"- Install success: {package_install_result.get('ok')}")
+        if package_resolution.get("out_of_sync"):
+            emit("", "### Out-of-sync mappings")
+            for entry in package_resolution.get("out_of_sync", [])[:40]:
+                tool = entry.get("tool", "unknown")
+                status = entry.get("status", "unknown")
+                candidates = ", ".join(entry.get("candidates", [])[:8]) or "none"
+                available = ", ".join(entry.get("available_candidates", [])[:8]) or "none"
+                emit(
+                    f"- {tool}: {status}; candidates=[{candidates}] available=[{available}]"
+                )
+        if include_raw_json and package_manager_diagnostics.get("checks"):
+            emit("", "### Package manager checks")
+            emit_json(package_manager_diagnostics.get("checks", {}))
+        if include_raw_json and package_install_result.get("logs"):
+            emit("", "### Package install logs")
+            emit_json(package_install_result.get("logs", []))
+
+        if sudo_passwordless_result.get("attempted") or sudo_passwordless_result.get("reason") not in {"", "not-requested"}:
+            emit(
+                "",
+                "## Sudo Configuration",
+                f"- Passwordless sudo requested: {'yes' if sudo_passwordless_result.get('attempted') else 'no'}",
+                f"- Result: {'ok' if sudo_passwordless_result.get('ok') else 'failed'}",
+                f"- Reason: {sudo_passwordless_result.get('reason', 'unknown')}",
+                f"- Target user: {sudo_passwordless_result.get('target_user', '')}",
+                f"- Sudoers file: {sudo_passwordless_result.get('sudoers_file', '')}",
+                "",
             )
-    if package_manager_diagnostics.get("checks"):
-        lines += ["", "### Package manager checks", "```json", json.dumps(package_manager_diagnostics.get("checks", {}), indent=2), "```"]
-    if package_install_result.get("logs"):
-        lines += ["", "### Package install logs", "```json", json.dumps(package_install_result.get("logs", []), indent=2), "```"]
+            emit_json(sudo_passwordless_result)
 
-    if sudo_passwordless_result.get("attempted") or sudo_passwordless_result.get("reason") not in {"", "not-requested"}:
-        lines += [
+        emit(
+            "",
+            "## Inspection Coverage",
+            f"- Coverage score: {inspection_coverage.get('score', 0)} / 100",
+            f"- Coverage level: {inspection_coverage.get('level', 'unknown')}",
+        )
+        missing_components = inspection_coverage.get("missing_components", [])
+        missing_runtime_roles = inspection_coverage.get("missing_runtime_roles", [])
+        flags = inspection_coverage.get("flags", [])
+        if missing_components:
+            emit(f"- Missing package components: {', '.join(missing_components)}")
+        if missing_runtime_roles:
+            emit(f"- Missing runtime role mappings: {', '.join(missing_runtime_roles)}")
+        if flags:
+            emit("- Flags:")
+            emit_bullets(flags, "  - ")
+
+        emit(
             "",
-            "## Sudo Configuration",
-            f"- Passwordless sudo requested: {'yes' if sudo_passwordless_result.get('attempted') else 'no'}",
-            f"- Result: {'ok' if sudo_passwordless_result.get('ok') else 'failed'}",
-            f"- Reason: {sudo_passwordless_result.get('reason', 'unknown')}",
-            f"- Target user: {sudo_passwordless_result.get('target_user', '')}",
-            f"- Sudoers file: {sudo_passwordless_result.get('sudoers_file', '')}",
+            "## Gaming Optimization Signals",
+            f"- Kernel: {gaming_signals.get('kernel_release', 'unknown')}",
+            f"- Kernel flavor tags: {', '.join(gaming_signals.get('kernel_flavor_tags', [])) or 'none'}",
+            f"- zram enabled: {'yes' if gaming_signals.get('zram_enabled') else 'no'}",
+            f"- CPU governor: {gaming_signals.get('cpu_governor', 'unknown')}",
+            f"- Platform profile: {gaming_signals.get('platform_profile', 'unknown')}",
+            f"- gamemoded active: {'yes' if gaming_signals.get('gamemoded_active') else 'no'}",
+            f"- gamemode service state: {gaming_signals.get('gamemode_service_state', 'unknown')}",
+            f"- gamescope active: {'yes' if gaming_signals.get('gamescope_active') else 'no'}",
+            f"- steam active: {'yes' if gaming_signals.get('steam_active') else 'no'}",
             "",
-            "```json",
-            json.dumps(sudo_passwordless_result, indent=2),
-            "```",
-        ]
+            "### Gaming Tool Binaries",
+        )
+        for tool_name, available in (gaming_signals.get("binary_checks") or {}).items():
+            emit(f"- {tool_name}: {'yes' if available else 'no'}")
+        profile_probe = gaming_signals.get("profile_package_probe", [])
+        if profile_probe:
+            emit(
+                "",
+                "### Distro-profile package probes",
+                "| Package | Version |",
+                "|---|---|",
+            )
+            for item in profile_probe:
+                get = item.get
+                emit_row(get("package", ""), get("version", ""))
 
-    lines += [
-        "",
-        "## Inspection Coverage",
-        f"- Coverage score: {inspection_coverage.get('score', 0)} / 100",
-        f"- Coverage level: {inspection_coverage.get('level', 'unknown')}",
-    ]
-    missing_components = inspection_coverage.get("missing_components", [])
-    missing_runtime_roles = inspection_coverage.get("missing_runtime_roles", [])
-    flags = inspection_coverage.get("flags", [])
-    if missing_components:
-        lines.append(f"- Missing package components: {', '.join(missing_components)}")
-    if missing_runtime_roles:
-        lines.append(f"- Missing runtime role mappings: {', '.join(missing_runtime_roles)}")
-    if flags:
-        lines += ["- Flags:"] + [f"  - {flag}" for flag in flags]
-
-    lines += [
-        "",
-        "## Gaming Optimization Signals",
-        f"- Kernel: {gaming_signals.get('kernel_release', 'unknown')}",
-        f"- Kernel flavor tags: {', '.join(gaming_signals.get('kernel_flavor_tags', [])) or 'none'}",
-        f"- zram enabled: {'yes' if gaming_signals.get('zram_enabled') else 'no'}",
-        f"- CPU governor: {gaming_signals.get('cpu_governor', 'unknown')}",
-        f"- Platform profile: {gaming_signals.get('platform_profile', 'unknown')}",
-        f"- gamemoded active: {'yes' if gaming_signals.get('gamemoded_active') else 'no'}",
-        f"- gamemode service state: {gaming_signals.get('gamemode_service_state', 'unknown')}",
-        f"- gamescope active: {'yes' if gaming_signals.get('gamescope_active') else 'no'}",
-        f"- steam active: {'yes' if gaming_signals.get('steam_active') else 'no'}",
-        "",
-        "### Gaming Tool Binaries",
-    ]
-    for tool_name, available in (gaming_signals.get("binary_checks", {}) or {}).items():
-        lines.append(f"- {tool_name}: {'yes' if available else 'no'}")
-    profile_probe = gaming_signals.get("profile_package_probe", [])
-    if profile_probe:
-        lines += [
+        emit("", "## Operational Hints")
+        emit_bullets(operational_hints)
+
+        emit(
             "",
-            "### Distro-profile package probes",
-            "| Package | Version |",
-            "|---|---|",
-        ]
-        for item in profile_probe:
-            pkg = str(item.get("package", "")).replace("|", "\\|")
-            ver = str(item.get("version", "")).replace("|", "\\|")
-            lines.append(f"| {pkg} | {ver} |")
-
-    lines += ["", "## Operational Hints"] + [f"- {hint}" for hint in operational_hints]
-
-    lines += [
-        "",
-        "## Scaling",
-        f"- Reference: {_REFERENCE_SCALE}x",
-        f"- Start: {start_scale}x  (detected via: {start_scale_source})",
-        f"- Baseline: {baseline_scale}x  (detected via: {baseline_scale_source})",
-        f"- Fractional case tested: {'yes' if matrix_has_fractional else 'no'}",
-        "",
-        "## Test Matrix",
-        "",
-    ]
+            "## Scaling",
+            f"- Reference: {_REFERENCE_SCALE}x",
+            f"- Start: {start_scale}x  (detected via: {start_scale_source})",
+            f"- Baseline: {baseline_scale}x  (detected via: {baseline_scale_source})",
+            f"- Fractional case tested: {'yes' if _matrix_has_fractional(test_runs) else 'no'}",
+            "",
+            "## Test Matrix",
+            "",
+        )
 
-    for case_name, run in test_runs.items():
-        lines += [
-            f"- {case_name} requested: {run.get('requested_scale')}x",
-            f"- {case_name} status: {run.get('status', 'ok')}",
-            f"- {case_name} detected: {run.get('detected_scale')}x",
-            f"- {case_name} FPS: {run.get('fps') if run.get('fps') else 'n/a'}",
-            f"- {case_name} tool: {run.get('fps_tool') or 'unavailable'}",
-            f"- {case_name} benchmark note: {run.get('benchmark_note') or 'none'}",
-            f"- {case_name} RAM used: {run.get('used_mb')} MB",
+        for case_name, run in test_runs.items():
+            emit(
+                f"- {case_name} requested: {run.get('requested_scale')}x",
+                f"- {case_name} status: {run.get('status', 'ok')}",
+                f"- {case_name} detected: {run.get('detected_scale')}x",
+                f"- {case_name} FPS: {run.get('fps') if run.get('fps') else 'n/a'}",
+                f"- {case_name} tool: {run.get('fps_tool') or 'unavailable'}",
+                f"- {case_name} benchmark note: {run.get('benchmark_note') or 'none'}",
+                f"- {case_name} RAM used: {run.get('used_mb')} MB",
+                "",
+            )
+        emit(
+            "## FPS Benchmark",
+            f"- Baseline tool: {fps_tool or 'unavailable'}",
+            f"- Baseline FPS: {baseline_fps if baseline_fps else 'n/a'}",
+        )
+        if target_fps is not None:
+            emit(f"- Target FPS: {target_fps if target_fps else 'n/a'}")
+            if baseline_fps and target_fps:
+                emit(f"- FPS ratio: {target_fps / baseline_fps:.2f}")
+        emit(
             "",
-        ]
-    lines += [
-        "## FPS Benchmark",
-        f"- Baseline tool: {fps_tool or 'unavailable'}",
-        f"- Baseline FPS: {baseline_fps if baseline_fps else 'n/a'}",
-    ]
-    if target_fps is not None:
-        lines.append(f"- Target FPS: {target_fps if target_fps else 'n/a'}")
-        if baseline_fps and target_fps:
-            lines.append(f"- FPS ratio: {target_fps / baseline_fps:.2f}")
-    lines += [
-        "",
-        "## RAM Usage",
-        f"- Used at baseline: {baseline_used_mb} MB",
-        f"- Available at baseline: {baseline_avail_mb} MB",
-    ]
-    if target_used_mb is not None:
-        delta = target_used_mb - baseline_used_mb
-        lines.append(f"- Used at target scale: {target_used_mb} MB  (delta: {'+'if delta >= 0 else ''}{delta} MB)")
-    lines += [
-        "",
-        "## Mouse Smoothness",
-        f"- Assessment: {'likely smooth' if smooth else 'potentially degraded'}",
-        f"- Notes: {mouse_notes}",
-        "",
-        "```json",
-        json.dumps(mouse_stats, indent=2),
-        "```",
-        "",
-        "## Driver Suitability",
-        f"- Assessment: {'suitable' if driver_suitable else 'may be unsuitable'}",
-        f"- Notes: {driver_notes}",
-    ]
-    if nvidia_instructions:
-        lines += ["", "### Proprietary NVIDIA install guidance"] + [f"- {x}" for x in nvidia_instructions]
-    if nvidia_activation_diagnostics.get("relevant"):
-        lines += [
+            "## RAM Usage",
+            f"- Used at baseline: {baseline_used_mb} MB",
+            f"- Available at baseline: {baseline_avail_mb} MB",
+        )
+        if target_used_mb is not None:
+            delta = target_used_mb - baseline_used_mb
+            emit(f"- Used at target scale: {target_used_mb} MB  (delta: {delta:+d} MB)")
+        emit(
             "",
-            "### NVIDIA Activation Diagnostics",
-            f"- NVIDIA module active: {'yes' if nvidia_activation_diagnostics.get('nvidia_module_active') else 'no'}",
-            f"- nouveau active: {'yes' if nvidia_activation_diagnostics.get('nouveau_active') else 'no'}",
-            f"- Nouveau accepted for legacy GPU: {'yes' if nvidia_activation_diagnostics.get('nouveau_accepted_legacy_gpu') else 'no'}",
+            "## Mouse Smoothness",
+            f"- Assessment: {'likely smooth' if smooth else 'potentially degraded'}",
+            f"- Notes: {mouse_notes}",
             "",
-            "```json",
-            json.dumps(nvidia_activation_diagnostics, indent=2),
-            "```",
-        ]
-        options = nvidia_activation_diagnostics.get("options", [])
-        if options:
-            lines += ["", "### NVIDIA Recovery Options"] + [f"- {opt}" for opt in options]
-        command_block = nvidia_activation_diagnostics.get("command_block", [])
-        if command_block:
-            lines += ["", "### NVIDIA Suggested Commands", "```bash"] + command_block + ["```"]
-        command_block_cuda = nvidia_activation_diagnostics.get("command_block_nvidia_cuda_repo", [])
-        if command_block_cuda:
-            lines += ["", "### NVIDIA Direct Install Commands (CUDA Repo)", "```bash"] + command_block_cuda + ["```"]
-        command_block_runfile = nvidia_activation_diagnostics.get("command_block_nvidia_runfile", [])
-        if command_block_runfile:
-            lines += ["", "### NVIDIA Direct Install Commands (.run Installer)", "```bash"] + command_block_runfile + ["```"]
-        remediation = nvidia_activation_diagnostics.get("auto_remediation", {})
-        if remediation:
-            reboot_required = bool(remediation.get("reboot_required")) or bool((remediation.get("post_check") or {}).get("needs_reboot"))
-            runfile_source = remediation.get("runfile_source", "")
-            runfile_path = remediation.get("runfile_path", "")
-            lines += [
+        )
+        emit_json(mouse_stats)
+        emit(
+            "",
+            "## Driver Suitability",
+            f"- Assessment: {'suitable' if driver_suitable else 'may be unsuitable'}",
+            f"- Notes: {driver_notes}",
+        )
+        if nvidia_instructions:
+            emit("", "### Proprietary NVIDIA install guidance")
+            emit_bullets(nvidia_instructions)
+        if nvidia_activation_diagnostics.get("relevant"):
+            emit(
                 "",
-                "### NVIDIA Auto Remediation",
-                f"- Offered: {'yes' if remediation.get('offered') else 'no'}",
-                f"- Attempted: {'yes' if remediation.get('attempted') else 'no'}",
-                f"- Result: {'ok' if remediation.get('ok') else remediation.get('reason', 'failed')}",
-                f"- Execution class: {remediation.get('execution_class', 'n/a')}",
-                f"- Issues detected: {', '.join(remediation.get('issues_detected', [])) or 'none'}",
-                f"- Action recommended: {'yes' if remediation.get('action_recommended') else 'no'}",
-                f"- Reboot required: {'yes' if reboot_required else 'no'}",
-                f"- Runfile source: {runfile_source or 'n/a'}",
-                f"- Runfile path: {runfile_path or 'n/a'}",
+                "### NVIDIA Activation Diagnostics",
+                f"- NVIDIA module active: {'yes' if nvidia_activation_diagnostics.get('nvidia_module_active') else 'no'}",
+                f"- nouveau active: {'yes' if nvidia_activation_diagnostics.get('nouveau_active') else 'no'}",
+                f"- Nouveau accepted for legacy GPU: {'yes' if nvidia_activation_diagnostics.get('nouveau_accepted_legacy_gpu') else 'no'}",
                 "",
-                "```json",
-                json.dumps(remediation, indent=2),
-                "```",
-            ]
-    lines += [
-        "",
-        "```json",
-        json.dumps(driver_info, indent=2),
-        "```",
-        "",
-        "## XWayland Analysis",
-        "```json",
-        json.dumps(xwayland_analysis, indent=2),
-        "```",
-        "",
-        "## Pipeline Analysis",
-        f"- Pipeline: {pipeline_analysis.get('pipeline_class', 'unknown')}",
-        f"- GPU path: {pipeline_analysis.get('gpu_path', 'unknown')}",
-        f"- Expected efficiency: {pipeline_analysis.get('efficiency_expectation', 'unknown')}",
-        "",
-        "```json",
-        json.dumps(pipeline_analysis, indent=2),
-        "```",
-        "",
-        "## Desktop Present FPS Strategy",
-        f"- Strategy: {fps_strategy_findings.get('strategy', {}).get('name', 'unknown')}",
-        f"- Primary: {fps_strategy_findings.get('strategy', {}).get('primary', 'unknown')}",
-        f"- Fallback: {fps_strategy_findings.get('strategy', {}).get('fallback', 'unknown')}",
-        "",
-        "```json",
-        json.dumps(fps_strategy_findings, indent=2),
-        "```",
-        "",
-        "## Compositor Diagnostics",
-        f"- Compositor: {compositor_diagnostics.get('compositor', 'unknown')}",
-        f"- Strategy id: {compositor_diagnostics.get('strategy_id', 'unknown')}",
-        "",
-        "```json",
-        json.dumps(compositor_diagnostics, indent=2),
-        "```",
-        "",
-        "## Efficiency & Performance Assessment",
-        assessment,
-        "",
-        "## Findings & Reasoning",
-    ]
-    for c in (conclusions or ["No strong conclusions; insufficient signals in this run."]):
-        lines.append(f"- {c}")
-    lines += [
-        "",
-        "## Memory Breakdown (top processes by RSS)",
-        "```json",
-        json.dumps(mem_breakdown, indent=2),
-        "```",
-    ]
-    if ps_output:
-        lines += ["", "## Process List (ps axu)", "```text", ps_output, "```"]
-
-    lines += ["", "## Journalctl Debug"]
-    lines += [
-        f"- Enabled: {journalctl_debug.get('enabled')}",
-        f"- journalctl available: {journalctl_debug.get('available')}",
-        f"- Captured lines: {journalctl_debug.get('lines')}",
-    ]
-    kwin_analysis = journalctl_debug.get("kwin_crash_analysis", {}) or {}
-    lines += [
-        f"- KWin crash risk: {kwin_analysis.get('risk_level', 'unknown')}",
-        f"- KWin crash score: {kwin_analysis.get('score', 0)}",
-    ]
-    if kwin_analysis.get("signals"):
-        lines.append("- KWin crash signals:")
-        for signal in kwin_analysis.get("signals", []):
-            lines.append(f"  - {signal}")
-    if kwin_analysis.get("next_steps"):
-        lines.append("- KWin next-step commands:")
-        for step in kwin_analysis.get("next_steps", []):
-            lines.append(f"  - {step}")
-    for note in journalctl_debug.get("notes", []):
-        lines.append(f"- Note: {note}")
-    for sec_name, sec_data in journalctl_debug.get("sections", {}).items():
-        lines += [
+            )
+            emit_json(nvidia_activation_diagnostics)
+            options = nvidia_activation_diagnostics.get("options", [])
+            if options:
+                emit("", "### NVIDIA Recovery Options")
+                emit_bullets(options)
+            command_block = nvidia_activation_diagnostics.get("command_block", [])
+            if command_block:
+                emit("", "### NVIDIA Suggested Commands", "```bash", *command_block, "```")
+            command_block_cuda = nvidia_activation_diagnostics.get("command_block_nvidia_cuda_repo", [])
+            if command_block_cuda:
+                emit("", "### NVIDIA Direct Install Commands (CUDA Repo)", "```bash", *command_block_cuda, "```")
+            command_block_runfile = nvidia_activation_diagnostics.get("command_block_nvidia_runfile", [])
+            if command_block_runfile:
+                emit("", "### NVIDIA Direct Install Commands (.run Installer)", "```bash", *command_block_runfile, "```")
+            remediation = nvidia_activation_diagnostics.get("auto_remediation", {})
+            if remediation:
+                reboot_required = bool(remediation.get("reboot_required")) or bool((remediation.get("post_check") or {}).get("needs_reboot"))
+                runfile_source = remediation.get("runfile_source", "")
+                runfile_path = remediation.get("runfile_path", "")
+                emit(
+                    "",
+                    "### NVIDIA Auto Remediation",
+                    f"- Offered: {'yes' if remediation.get('offered') else 'no'}",
+                    f"- Attempted: {'yes' if remediation.get('attempted') else 'no'}",
+                    f"- Result: {'ok' if remediation.get('ok') else remediation.get('reason', 'failed')}",
+                    f"- Execution class: {remediation.get('execution_class', 'n/a')}",
+                    f"- Issues detected: {', '.join(remediation.get('issues_detected', [])) or 'none'}",
+                    f"- Action recommended: {'yes' if remediation.get('action_recommended') else 'no'}",
+                    f"- Reboot required: {'yes' if reboot_required else 'no'}",
+                    f"- Runfile source: {runfile_source or 'n/a'}",
+                    f"- Runfile path: {runfile_path or 'n/a'}",
+                    "",
+                )
+                emit_json(remediation)
+        emit("")
+        emit_json(driver_info)
+        emit("", "## XWayland Analysis")
+        emit_json(xwayland_analysis)
+        emit(
             "",
-            f"### journalctl section: {sec_name}",
-            f"- Command: {sec_data.get('cmd', '')}",
-            f"- Success: {sec_data.get('ok')}",
-            "```text",
-            sec_data.get("stdout", "") or "(no output)",
-            "```",
-        ]
-        if sec_data.get("stderr"):
-            lines += ["```text", sec_data.get("stderr"), "```"]
-
-    lines += [
-        "",
-        "## Execution Trace Log",
-        "```text",
-        "\n".join(trace_log[-1200:]) if trace_log else "(no trace entries)",
-        "```",
-        "",
-        "## Console Log",
-        "```text",
-        "\n".join(console_log[-1200:]) if console_log else "(no console log entries)",
-        "```",
-    ]
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+            "## Pipeline Analysis",
+            f"- Pipeline: {pipeline_analysis.get('pipeline_class', 'unknown')}",
+            f"- GPU path: {pipeline_analysis.get('gpu_path', 'unknown')}",
+            f"- Expected efficiency: {pipeline_analysis.get('efficiency_expectation', 'unknown')}",
+            "",
+        )
+        emit_json(pipeline_analysis)
+        strategy = fps_strategy_findings.get("strategy") or {}
+        emit(
+            "",
+            "## Desktop Present FPS Strategy",
+            f"- Strategy: {strategy.get('name', 'unknown')}",
+            f"- Primary: {strategy.get('primary', 'unknown')}",
+            f"- Fallback: {strategy.get('fallback', 'unknown')}",
+            "",
+        )
+        emit_json(fps_strategy_findings)
+        emit(
+            "",
+            "## Compositor Diagnostics",
+            f"- Compositor: {compositor_diagnostics.get('compositor', 'unknown')}",
+            f"- Strategy id: {compositor_diagnostics.get('strategy_id', 'unknown')}",
+            "",
+        )
+        emit_json(compositor_diagnostics)
+        emit(
+            "",
+            "## Efficiency & Performance Assessment",
+            assessment,
+            "",
+            "## Findings & Reasoning",
+        )
+        emit_bullets(conclusions or ["No strong conclusions; insufficient signals in this run."])
+        emit("", "## Memory Breakdown (top processes by RSS)")
+        emit_json(mem_breakdown)
+        if ps_output:
+            emit("", "## Process List (ps axu)", "```text", ps_output, "```")
+
+        emit("", "## Journalctl Debug")
+        emit(
+            f"- Enabled: {journalctl_debug.get('enabled')}",
+            f"- journalctl available: {journalctl_debug.get('available')}",
+            f"- Captured lines: {journalctl_debug.get('lines')}",
+        )
+        kwin_analysis = journalctl_debug.get("kwin_crash_analysis") or {}
+        emit(
+            f"- KWin crash risk: {kwin_analysis.get('risk_level', 'unknown')}",
+            f"- KWin crash score: {kwin_analysis.get('score', 0)}",
+        )
+        if kwin_analysis.get("signals"):
+            emit("- KWin crash signals:")
+            emit_bullets(kwin_analysis["signals"], "  - ")
+        if kwin_analysis.get("next_steps"):
+            emit("- KWin next-step commands:")
+            emit_bullets(kwin_analysis["next_steps"], "  - ")
+        emit_bullets(journalctl_debug.get("notes"), "- Note: ")
+        for sec_name, sec_data in journalctl_debug.get("sections", {}).items():
+            # The section body (up to ~120 kB) is written as-is rather than formatted into the template.
+            write(_fmt_journal_section_head(sec_name, sec_data.get("cmd", ""), sec_data.get("ok")))
+            emit(sec_data.get("stdout") or "(no output)", "```")
+            sec_stderr = sec_data.get("stderr")
+            if sec_stderr:
+                emit("```text", sec_stderr, "```")
+
+        emit("", "## Execution Trace Log", "```text")
+        emit_tail(trace_log, 1200, "(no trace entries)")
+        emit("```", "", "## Console Log", "```text")
+        emit_tail(console_log, 1200, "(no console log entries)")
+        emit("```")
 
 
 # ---------------------------------------------------------------------------
@@ -5062,6 +5763,10 @@ def main() -> int:
         "--no-ps", action="store_true",
         help="Skip ps axu output in Markdown report.",
     )
+    parser.add_argument(
+        "--compact-report", action="store_true",
+        help="Omit raw JSON dumps from the Markdown report (summary sections only).",
+    )
     parser.add_argument(
         "--mouse-test", action="store_true",
         help="Enable interactive libinput mouse capture test (disabled by default).",
@@ -5109,6 +5814,11 @@ def main() -> int:
         default=8000,
         help="Number of lines per journalctl debug section in report (default: 8000).",
     )
+    parser.add_argument(
+        "--journalctl-since",
+        default="",
+        help="Only capture journal entries since this time, e.g. '-10min' (default: whole boot).",
+    )
     parser.add_argument(
         "--no-journalctl",
         action="store_true",
@@ -5120,6 +5830,7 @@ def main() -> int:
         help="Enable safety guard that skips risky scale switching combinations (off by default).",
     )
     args = parser.parse_args()
+    run_started_at = dt.datetime.now()
     interactive = not args.non_interactive
     trace(f"main start: argv={sys.argv}")
     trace(
@@ -5128,7 +5839,7 @@ def main() -> int:
         f"scale_alias={args.scale}, mouse_test={args.mouse_test}, "
         f"allow_glxgears_fallback={args.allow_glxgears_fallback}, fps_mode={args.fps_mode}, "
         f"fps_window_size={args.fps_window_size}, no_journalctl={args.no_journalctl}, "
-        f"journalctl_lines={args.journalctl_lines}, enable_scale_safety_guard={args.enable_scale_safety_guard}, "
+        f"journalctl_lines={args.journalctl_lines}, journalctl_since={args.journalctl_since!r}, enable_scale_safety_guard={args.enable_scale_safety_guard}, "
         f"fix_nvidia={args.fix_nvidia}, nvidia_runfile_path_set={bool(args.nvidia_runfile_path)}, "
         f"make_sudo_passwordless={args.make_sudo_passwordless}, "
         f"output='{args.output}'"
@@ -5204,12 +5915,18 @@ def main() -> int:
     xwayland_display = parse_xwayland_display(processes)
     if xwayland_display and "DISPLAY" not in session_env:
         session_env["DISPLAY"] = xwayland_display
-
-    def run_user_cmd(cmd: list, timeout: int = 20, extra_env: Optional[dict] = None) -> dict:
-        env = dict(session_env)
-        if extra_env:
-            env.update(extra_env)
-        return run_cmd(cmd, timeout=timeout, env=env)
+    # Read-only from here on, so run_user_cmd can hand it to subprocess without copying.
+    session_env = types.MappingProxyType(session_env)
+
+    def run_user_cmd(
+        cmd: list,
+        timeout: int = 20,
+        extra_env: Optional[dict] = None,
+        line_handler=None,
+        max_stdout: Optional[int] = None,
+    ) -> dict:
+        env = {**session_env, **extra_env} if extra_env else session_env
+        return run_cmd(cmd, timeout=timeout, env=env, line_handler=line_handler, max_stdout=max_stdout)
 
     session_type      = detect_session_type(session_env)
     desktop           = infer_desktop_session(session_env, processes)
@@ -5231,13 +5948,7 @@ def main() -> int:
         "lspci", "lshw", "glxinfo", "vulkaninfo", "glmark2", "mangohud",
         "glxgears", "xlsclients", "libinput",
     ] + [tool for tool in strategy_tools if tool]
-    deduped_wanted = []
-    seen = set()
-    for cmd in wanted:
-        if cmd in seen:
-            continue
-        seen.add(cmd)
-        deduped_wanted.append(cmd)
+    deduped_wanted = list(dict.fromkeys(wanted))
     missing = [c for c in deduped_wanted if not tool_available(c)]
     package_resolution = resolve_package_plan(missing, base_distro, pm)
     requested_pkgs = package_resolution.get("installable_packages", [])
@@ -5307,12 +6018,28 @@ def main() -> int:
 
     # ---- Graphics info ----
     cprint(C_BLUE, "\n[*] Gathering graphics information...")
-    graphics    = gather_graphics_info(run_user_cmd, priv)
+    # These collectors only read system state, so run them side by side before the
+    # benchmarks start; the FPS runs themselves stay strictly sequential.
+    collected = _run_probes_concurrently({
+        "graphics": functools.partial(gather_graphics_info, run_user_cmd, priv),
+        "firmware_security": functools.partial(gather_platform_firmware_security_info, run_user_cmd),
+        "possible_nvidia_drivers": functools.partial(parse_possible_nvidia_drivers, base_distro, run_user_cmd),
+        "gaming_signals": functools.partial(
+            gather_gaming_optimization_signals,
+            base_distro=base_distro,
+            session_type=session_type,
+            desktop=desktop,
+            wm_comp=wm_comp,
+            processes=processes,
+            run_user_cmd=run_user_cmd,
+        ),
+    })
+    graphics    = collected["graphics"]
     lsmod_text  = graphics.get("lsmod", {}).get("stdout", "")
     driver_info = gather_driver_info(lsmod_text, priv)
     gpu_inventory = parse_lspci_gpu_inventory(graphics.get("lspci", {}).get("stdout", ""))
-    firmware_security_info = gather_platform_firmware_security_info(run_user_cmd)
-    possible_nvidia_drivers = parse_possible_nvidia_drivers(base_distro, run_user_cmd)
+    firmware_security_info = collected["firmware_security"]
+    possible_nvidia_drivers = collected["possible_nvidia_drivers"]
     pipeline_packages = gather_desktop_pipeline_packages(
         base_distro=base_distro,
         session_type=session_type,
@@ -5324,22 +6051,12 @@ def main() -> int:
         run_user_cmd=run_user_cmd,
     )
 
-    gpu_lspci = ""
-    for line in graphics.get("lspci", {}).get("stdout", "").splitlines():
-        if any(k in line.lower() for k in ("vga", "3d controller", "display controller")):
-            m_gpu = re.search(r":\s*(.+?)(?:\s*\(rev\s+[0-9a-fA-F]+\))?$", line)
-            if m_gpu:
-                gpu_lspci = m_gpu.group(1).strip()
-            else:
-                gpu_lspci = line.strip()
-            break
+    # The inventory already holds the first display controller's model; no second lspci pass.
+    gpu_lspci = gpu_inventory[0]["model"] if gpu_inventory else ""
 
     glxinfo_out = graphics.get("glxinfo", {}).get("stdout", "")
-    renderer = ""
-    for line in glxinfo_out.splitlines():
-        if "OpenGL renderer" in line:
-            renderer = line.split(":", 1)[1].strip()
-            break
+    m_renderer = _RE_GLX_RENDERER.search(glxinfo_out)
+    renderer = m_renderer.group(1).strip() if m_renderer else ""
 
     driver_suitable, driver_notes = assess_driver_suitability(glxinfo_out, driver_info)
     inspection_coverage = evaluate_inspection_coverage(
@@ -5349,22 +6066,23 @@ def main() -> int:
         renderer=renderer,
         gpu_inventory=gpu_inventory,
     )
-    gaming_signals = gather_gaming_optimization_signals(
-        base_distro=base_distro,
-        session_type=session_type,
-        desktop=desktop,
-        wm_comp=wm_comp,
-        processes=processes,
-        run_user_cmd=run_user_cmd,
-    )
+    gaming_signals = collected["gaming_signals"]
     operational_hints = build_operational_hints(base_distro=base_distro, gaming_signals=gaming_signals, live_env=live_env)
 
     # ---- Display / scale detection ----
     home_dir = os.path.expanduser("~")
     _ = gather_display_info(run_user_cmd)
-    start_scale, start_scale_source = detect_current_scale(
-        session_env, desktop, run_user_cmd, home_dir,
-    )
+
+    # The detected scale only changes when this script switches it, so reuse the last
+    # detection until _ensure_scale/set_scale_programmatic runs again.
+    scale_cache: dict = {}
+
+    def current_scale() -> tuple:
+        if "detected" not in scale_cache:
+            scale_cache["detected"] = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
+        return scale_cache["detected"]
+
+    start_scale, start_scale_source = current_scale()
 
     session_type_lc = (session_type or "unknown").strip().lower()
     desktop_lc = (desktop or "unknown").strip().lower()
@@ -5430,7 +6148,7 @@ def main() -> int:
         status: str = "ok",
         benchmark_required: bool = False,
     ) -> dict:
-        detected_scale, detected_src = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
+        detected_scale, detected_src = current_scale()
         auto_glxgears_fallback = bool(args.allow_glxgears_fallback or benchmark_required)
         if benchmark_required and not args.allow_glxgears_fallback:
             trace(
@@ -5466,9 +6184,10 @@ def main() -> int:
         }
 
     if skip_desktop_matrix:
+        # Nothing is switched or measured, so one reading serves every skipped case.
+        detected_scale, detected_src = current_scale()
+        used_mb, avail_mb = ram_snapshot()
         for case_name, scale_value in required_cases.items():
-            detected_scale, detected_src = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
-            used_mb, avail_mb = ram_snapshot()
             test_runs[case_name] = {
                 "case": case_name,
                 "status": f"skipped ({skip_desktop_reason})",
@@ -5498,24 +6217,28 @@ def main() -> int:
             if case_name in test_runs:
                 continue
             if guard_scale:
+                # The guard keeps the start scale, so the start-scale run's readings still hold.
                 cprint(C_YELLOW, f"\n[*] Skipping scale switch for {case_name}: {guard_reason}")
-                detected_scale, detected_src = detect_current_scale(session_env, desktop, run_user_cmd, home_dir)
-                used_mb, avail_mb = ram_snapshot()
+                first_run = test_runs[first_case]
                 test_runs[case_name] = {
                     "case": case_name,
                     "status": f"skipped ({guard_reason})",
                     "requested_scale": scale_value,
-                    "detected_scale": detected_scale,
-                    "detected_source": detected_src,
+                    "detected_scale": first_run["detected_scale"],
+                    "detected_source": first_run["detected_source"],
                     "switch_method": "skipped",
                     "fps": 0.0,
                     "fps_tool": "skipped",
-                    "used_mb": used_mb,
-                    "avail_mb": avail_mb,
+                    "used_mb": first_run["used_mb"],
+                    "avail_mb": first_run["avail_mb"],
                 }
                 continue
             cprint(C_BLUE, f"\n[*] Running case {case_name} at {scale_value}x...")
-            ok, method = _ensure_scale(session_env, desktop, scale_value, run_user_cmd, interactive)
+            ok, method = _ensure_scale(
+                session_env, desktop, scale_value, run_user_cmd, interactive,
+                known_scale=current_scale()[0],
+            )
+            scale_cache.clear()
             if not ok:
                 cprint(C_YELLOW, f"    Could not ensure scale {scale_value}x; proceeding with current detected scale.")
                 case_status = f"scale-change-failed ({method})"
@@ -5569,12 +6292,18 @@ def main() -> int:
     if abs(start_scale - baseline_scale) > 1e-6:
         cprint(C_BLUE, f"\n[*] Restoring start scale ({start_scale}x)...")
         restored, _ = set_scale_programmatic(desktop, start_scale, run_user_cmd)
+        scale_cache.clear()
         if not restored:
             cprint(C_YELLOW, f"    Could not auto-restore. Please manually restore to {start_scale}x.")
 
     # ---- Assess mouse smoothness ----
     cprint(C_BLUE, "\n[*] Assessing mouse smoothness...")
-    smooth, mouse_notes = assess_mouse_smoothness(session_type, baseline_mouse, run_user_cmd)
+    # The FPS strategy findings already queried xrandr; only probe again if they did not.
+    xrandr_probe = fps_strategy_findings.get("probes", {}).get("xrandr")
+    refresh_hz = xrandr_probe["active_refresh_hz"] if xrandr_probe else _get_active_refresh_hz(run_user_cmd)
+    smooth, mouse_notes = assess_mouse_smoothness(
+        session_type, baseline_mouse, refresh_hz, command_exists("libinput"),
+    )
 
     # ---- Assessment ----
     cprint(C_BLUE, "[*] Generating assessment...")
@@ -5594,7 +6323,7 @@ def main() -> int:
     )
     assessment = assess_performance(
         ram_total_mb=ram_total_mb,
-        cpu_cores=os.cpu_count() or 0,
+        cpu_cores=_CPU_COUNT,
         baseline_used_mb=baseline_used_mb,
         baseline_fps=baseline_fps,
         baseline_scale=baseline_scale,
@@ -5675,8 +6404,10 @@ def main() -> int:
                 nvidia_activation_diagnostics,
             )
         if remediation_result.get("attempted"):
-            post_lsmod = run_cmd(["lsmod"])
-            driver_info = gather_driver_info(post_lsmod.get("stdout", ""), priv)
+            # Package changes alone leave the loaded modules as they were until reboot; otherwise
+            # reuse the driver info the remediation post-check already gathered.
+            if remediation_result.get("module_state_may_have_changed"):
+                driver_info = remediation_result["driver_info_after"]
             nvidia_activation_diagnostics = gather_nvidia_activation_diagnostics(
                 run_user_cmd=run_user_cmd,
                 base_distro=base_distro,
@@ -5714,7 +6445,9 @@ def main() -> int:
             f"issues={remediation_result.get('issues_detected', [])} "
             f"reboot_required={remediation_result.get('reboot_required')}"
         )
+    # Snapshot memory and processes before the journal capture spawns its own readers.
     mem_breakdown = summarize_memory_breakdown()
+    ps_res = run_cmd(["ps", "axu"]) if not args.no_ps else None
     if args.no_journalctl:
         journalctl_debug = {
             "enabled": False,
@@ -5724,13 +6457,13 @@ def main() -> int:
             "notes": ["journalctl capture disabled by --no-journalctl"],
         }
     else:
-        journalctl_debug = gather_journalctl_debug(run_user_cmd, journalctl_lines=args.journalctl_lines)
+        journalctl_debug = gather_journalctl_debug(
+            run_user_cmd,
+            journalctl_lines=args.journalctl_lines,
+            journalctl_since=args.journalctl_since,
+        )
 
-    cpu_model = ""
-    for line in read_file("/proc/cpuinfo").splitlines():
-        if line.startswith("model name"):
-            cpu_model = line.split(":", 1)[1].strip()
-            break
+    cpu_model = _read_cpuinfo_model()
 
     # ---- Console report ----
     print_console_report(
@@ -5740,7 +6473,7 @@ def main() -> int:
         start_scale=start_scale, start_scale_source=start_scale_source,
         baseline_scale=baseline_scale, baseline_scale_source=baseline_scale_source,
         test_runs=test_runs,
-        ram_total_mb=ram_total_mb, cpu_model=cpu_model, cpu_cores=os.cpu_count() or 0,
+        ram_total_mb=ram_total_mb, cpu_model=cpu_model, cpu_cores=_CPU_COUNT,
         gpu_lspci=gpu_lspci, gpu_inventory=gpu_inventory,
         firmware_security_info=firmware_security_info,
         possible_nvidia_drivers=possible_nvidia_drivers,
@@ -5768,10 +6501,8 @@ def main() -> int:
 
     # ---- Markdown report ----
     ps_output = None
-    if not args.no_ps:
-        res = run_cmd(["ps", "axu"])
-        if res["ok"]:
-            ps_output = res["stdout"]
+    if ps_res is not None and ps_res["ok"]:
+        ps_output = ps_res["stdout"]
 
     resolved_output, output_note = resolve_report_output_path(args.output)
     if output_note:
@@ -5791,7 +6522,7 @@ def main() -> int:
             start_scale=start_scale, start_scale_source=start_scale_source,
             baseline_scale=baseline_scale, baseline_scale_source=baseline_scale_source,
             test_runs=test_runs,
-            ram_total_mb=ram_total_mb, cpu_model=cpu_model, cpu_cores=os.cpu_count() or 0,
+            ram_total_mb=ram_total_mb, cpu_model=cpu_model, cpu_cores=_CPU_COUNT,
             gpu_lspci=gpu_lspci, gpu_inventory=gpu_inventory,
             firmware_security_info=firmware_security_info,
             possible_nvidia_drivers=possible_nvidia_drivers,
@@ -5818,6 +6549,8 @@ def main() -> int:
             sudo_passwordless_result=sudo_passwordless_result,
             trace_log=TRACE_LOG,
             console_log=CONSOLE_LOG,
+            generated_at=run_started_at,
+            include_raw_json=not args.compact_report,
         )
     except PermissionError as exc:
         cprint(C_RED, f"[ERROR] Failed writing report due to permission error: {exc}")